@@ -0,0 +1,229 @@
+import os
+import time
+import queue
+import socket
+import threading
+import subprocess
+from contextlib import contextmanager
+from chrome_initialize import LinkedInCommentBot, USER_AGENT
+from chromedriver_cache import get_chrome_binary_candidates
+from profile_clone import ProfileClone
+import config
+
+# Flags shared by every pooled Chrome (same anti-automation setup as launch_new_browser)
+POOL_CHROME_FLAGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-blink-features=AutomationControlled",
+    "--window-size=1920,1080"
+]
+
+
+def find_free_port():
+    """
+    Ask the OS for a free local TCP port
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BrowserInstance:
+    def __init__(self, index, port, profile_dir, process, bot):
+        self.index = index
+        self.port = port
+        self.profile_dir = profile_dir
+        self.process = process
+        self.bot = bot
+        self.leases = 0
+
+    @property
+    def driver(self):
+        return self.bot.driver
+
+    @property
+    def debugger_address(self):
+        return f"127.0.0.1:{self.port}"
+
+    def is_healthy(self):
+        """
+        Chrome process still alive and the attached session still answers
+        """
+        return self.process.poll() is None and self.bot.is_session_healthy()
+
+    def shutdown(self):
+        try:
+            self.bot.release_driver()
+        except Exception:
+            pass
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=10)
+        except Exception:
+            self.process.kill()
+
+
+class BrowserPool:
+    """
+    Runs N Chrome instances, each on its own debug port with its own cloned
+    profile. Workers lease an instance and hand it back when done.
+    """
+
+    def __init__(self, size=None, source_profiles=None, headless=False):
+        self.size = size or config.BROWSER_POOL_SIZE
+        self.source_profiles = source_profiles or config.BROWSER_POOL_SOURCE_PROFILES
+        self.headless = headless
+        self.instances = []
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        self.recycled_count = 0
+
+    def get_source_profile(self, index):
+        """
+        Profiles are assigned round-robin, so one pool can serve several accounts
+        """
+        if self.source_profiles:
+            return self.source_profiles[index % len(self.source_profiles)]
+        return LinkedInCommentBot.get_chrome_profile_path()
+
+    def clone_profile(self, index):
+        """
+        Reusable per-instance profile clone (only changed login files are re-copied)
+        """
+        source_dir = self.get_source_profile(index)
+        clone_dir = os.path.abspath(os.path.join(config.BROWSER_POOL_DIR, f"instance_{index}"))
+        return ProfileClone(source_dir, clone_dir).sync()
+
+    def launch_instance(self, index):
+        """
+        Start one Chrome on a free port and attach a bot to it
+        """
+        binaries = get_chrome_binary_candidates()
+        if not binaries:
+            raise Exception("Chrome executable not found")
+
+        port = find_free_port()
+        profile_dir = self.clone_profile(index)
+        command = [binaries[0], f"--remote-debugging-port={port}", f"--user-data-dir={profile_dir}"] + POOL_CHROME_FLAGS
+        if self.headless:
+            command += ["--headless=new", f"--user-agent={USER_AGENT}"]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        bot = LinkedInCommentBot()
+        debugger_address = f"127.0.0.1:{port}"
+        deadline = time.time() + config.BROWSER_POOL_START_TIMEOUT
+        while not bot.is_debugger_reachable(debugger_address):
+            if process.poll() is not None or time.time() > deadline:
+                process.kill()
+                raise Exception(f"Chrome instance {index} did not open port {port}")
+            time.sleep(0.2)
+
+        if not bot.attach_to_existing_browser(debugger_address):
+            process.kill()
+            raise Exception(f"Could not attach to Chrome instance {index} on port {port}")
+
+        if config.RESTORE_SAVED_SESSION:
+            bot.session_store.restore(bot.driver)
+        bot.driver.get("https://www.linkedin.com/feed/")
+        print(f"🌐 Pool instance {index} ready on port {port}")
+        return BrowserInstance(index, port, profile_dir, process, bot)
+
+    def start(self):
+        print(f"🚀 Starting browser pool with {self.size} instances...")
+        for index in range(self.size):
+            instance = self.launch_instance(index)
+            self.instances.append(instance)
+            self.idle.put(instance)
+        return self
+
+    def recycle(self, instance):
+        """
+        Replace an unhealthy instance with a fresh one on the same profile slot
+        If the relaunch fails the dead instance goes back to the idle queue, so the slot
+        is kept and the next acquire retries the relaunch
+        """
+        print(f"♻️ Recycling unhealthy pool instance {instance.index}")
+        instance.shutdown()
+        try:
+            replacement = self.launch_instance(instance.index)
+        except Exception as e:
+            print(f"❌ Could not relaunch pool instance {instance.index}: {e}")
+            self.idle.put(instance)
+            raise
+        with self.lock:
+            self.instances[self.instances.index(instance)] = replacement
+            self.recycled_count += 1
+        return replacement
+
+    def acquire(self, timeout=None):
+        instance = self.idle.get(timeout=timeout or config.BROWSER_POOL_LEASE_TIMEOUT)
+        if not instance.is_healthy():
+            instance = self.recycle(instance)
+        instance.leases += 1
+        return instance
+
+    def release(self, instance):
+        if not instance.is_healthy():
+            try:
+                instance = self.recycle(instance)
+            except Exception:
+                return  # recycle() already returned the slot to the idle queue
+        self.idle.put(instance)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        Usage:
+            with pool.lease() as instance:
+                scanner.driver = instance.driver
+        """
+        instance = self.acquire(timeout)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def shutdown(self):
+        print("\nShutting down browser pool...")
+        for instance in self.instances:
+            instance.shutdown()
+        self.instances = []
+
+
+def main():
+    """
+    Standalone demo: run one sponsor scan per pooled browser in parallel
+    """
+    from linkedin_sponsor_scanner import LinkedInSponsorScanner
+
+    pool = BrowserPool()
+    results = {}
+
+    def worker(worker_id):
+        with pool.lease() as instance:
+            scanner = LinkedInSponsorScanner()
+            scanner.driver = instance.driver  # Use the pooled browser session
+            results[worker_id] = scanner.scan_sponsored_posts()
+
+    try:
+        pool.start()
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(pool.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for worker_id, sponsored_ids in results.items():
+            print(f"Worker {worker_id}: {len(sponsored_ids)} sponsored posts")
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Script interrupted by user.")
+
+    finally:
+        pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import json
+import time
+import select
+import itertools
+import urllib.request
+import websocket
+import config
+
+
+class CDPError(Exception):
+    pass
+
+
+class TransportStats:
+    """
+    Round-trip counts and latency per transport ('cdp', 'selenium', ...)
+    """
+
+    def __init__(self):
+        self.transports = {}
+
+    def record(self, transport, seconds):
+        entry = self.transports.setdefault(transport, {"round_trips": 0, "total_ms": 0.0})
+        entry["round_trips"] += 1
+        entry["total_ms"] += seconds * 1000
+
+    def as_dict(self):
+        return {
+            transport: {
+                "round_trips": entry["round_trips"],
+                "total_ms": round(entry["total_ms"], 1),
+                "avg_ms": round(entry["total_ms"] / entry["round_trips"], 2) if entry["round_trips"] else 0
+            }
+            for transport, entry in self.transports.items()
+        }
+
+    def print_report(self):
+        print("\n📡 TRANSPORT STATS")
+        print("-" * 50)
+        for transport, entry in self.as_dict().items():
+            print(f"   {transport:<18} {entry['round_trips']:>6} round-trips  avg {entry['avg_ms']:>7.2f} ms")
+        print("-" * 50)
+
+
+def instrument_selenium(driver, stats, transport="selenium_total"):
+    """
+    Count every WebDriver command (find_element, .text, get_attribute, ...) of a driver
+    WebElements call their parent driver's execute(), so wrapping it catches everything
+    """
+    if getattr(driver, "_transport_instrumented", False):
+        return
+    original_execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            stats.record(transport, time.perf_counter() - started)
+
+    driver.execute = timed_execute
+    driver._transport_instrumented = True
+
+
+class CDPClient:
+    """
+    Minimal Chrome DevTools Protocol client over the browser's debug port
+    """
+
+    def __init__(self, debugger_address, target_id=None, target_url_hint="linkedin.com"):
+        self.debugger_address = debugger_address
+        self.target_id = target_id  # ChromeDriver's window handle is the CDP target id
+        self.target_url_hint = target_url_hint
+        self.ws = None
+        self.message_ids = itertools.count(1)
+        self.crashed = False
+
+    def connect(self):
+        with urllib.request.urlopen(f"http://{self.debugger_address}/json/list", timeout=config.ATTACH_PROBE_TIMEOUT) as response:
+            targets = json.loads(response.read())
+
+        pages = [t for t in targets if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+        if not pages:
+            raise CDPError("No page target available on the debug port")
+
+        # The tab Selenium drives; the URL hint only when the handle is unknown
+        if self.target_id:
+            matching = [t for t in pages if t.get("id") == self.target_id]
+            if not matching:
+                raise CDPError(f"Target {self.target_id} (Selenium's window) not found on the debug port")
+            target = matching[0]
+        else:
+            preferred = [t for t in pages if self.target_url_hint in t.get("url", "")]
+            target = (preferred or pages)[0]
+
+        # suppress_origin: Chrome rejects DevTools websockets that send an Origin header
+        self.ws = websocket.create_connection(
+            target["webSocketDebuggerUrl"],
+            timeout=config.CDP_COMMAND_TIMEOUT,
+            suppress_origin=True
+        )
+        self.send("Inspector.enable")  # Delivers Inspector.targetCrashed if the renderer dies
+        return self
+
+    def send(self, method, params=None):
+        if not self.ws:
+            self.connect()
+
+        message_id = next(self.message_ids)
+        self.ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+
+        while True:
+            message = json.loads(self.ws.recv())
+            if message.get("method") == "Inspector.targetCrashed":
+                self.crashed = True
+                raise CDPError("Renderer crashed")
+            if message.get("id") != message_id:
+                continue  # Events and unrelated responses
+            if "error" in message:
+                raise CDPError(message["error"].get("message", str(message["error"])))
+            return message.get("result", {})
+
+    def poll_events(self):
+        """
+        Read the events already queued on the socket without blocking (the socket is
+        otherwise only read inside send). Returns True if the renderer crashed.
+        """
+        if not self.ws or self.crashed:
+            return self.crashed
+        try:
+            while select.select([self.ws.sock], [], [], 0)[0]:
+                message = json.loads(self.ws.recv())
+                if message.get("method") == "Inspector.targetCrashed":
+                    self.crashed = True
+                    break
+        except websocket.WebSocketConnectionClosedException:
+            self.crashed = True  # The browser closed the DevTools connection
+        except Exception:
+            pass
+        return self.crashed
+
+    def evaluate(self, expression):
+        result = self.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True
+        })
+        if "exceptionDetails" in result:
+            raise CDPError(result["exceptionDetails"].get("text", "JavaScript exception"))
+        return result.get("result", {}).get("value")
+
+    def close(self):
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+            self.ws = None
+
+
+class DomReader:
+    """
+    Read-only DOM queries over direct CDP, falling back transparently to
+    Selenium's execute_script. Scripts use execute_script conventions
+    (function body reading `arguments`); arguments must be JSON-serializable.
+    """
+
+    def __init__(self, driver, debugger_address=None):
+        self.driver = driver
+        self.stats = TransportStats()
+        self.cdp = None
+
+        if config.USE_DIRECT_CDP and debugger_address:
+            try:
+                self.cdp = CDPClient(debugger_address, driver.current_window_handle).connect()
+            except Exception as e:
+                print(f"⚠️ Direct CDP unavailable, using Selenium for DOM reads: {e}")
+                self.cdp = None
+
+        if config.TRACK_TRANSPORT_STATS:
+            instrument_selenium(driver, self.stats)
+
+    def run(self, script, *args):
+        if self.cdp:
+            expression = f"(function() {{ {script} }}).apply(null, {json.dumps(list(args))})"
+            started = time.perf_counter()
+            try:
+                value = self.cdp.evaluate(expression)
+                self.stats.record("cdp", time.perf_counter() - started)
+                return value
+            except Exception as e:
+                print(f"⚠️ CDP read failed, falling back to Selenium: {e}")
+                self.cdp.close()
+                self.cdp = None
+
+        started = time.perf_counter()
+        value = self.driver.execute_script(script, *args)
+        self.stats.record("selenium_script", time.perf_counter() - started)
+        return value
+
+    def close(self):
+        if self.cdp:
+            self.cdp.close()
+            self.cdp = None
@@ -4,25 +4,48 @@ import re
 import os
 import platform
 import traceback
+import urllib.request
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from openai import OpenAI
+from chromedriver_cache import resolve_chromedriver_path
+from startup_timer import StartupTimer, seconds_since_process_start
+from session_store import SessionStore
+from profile_clone import ProfileClone
+from lean_render import apply_lean_render, remove_lean_render, add_transfer_logging, get_transferred_bytes
+from cdp_client import DomReader
+from selector_registry import get_selector_registry
 import config
 
+IMPORTS_SECONDS = seconds_since_process_start()
+
+# Same user agent for headed and headless runs (headless would otherwise report HeadlessChrome)
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
 class LinkedInCommentBot:
     def __init__(self):
         self.driver = None
+        self.attached_to_existing = False
+        self.chromedriver_path = None
+        self.startup_timer = None
+        self.session_store = SessionStore()
+        self.profile_clone = None
+        self.lean_render_active = False
+        self.lean_render_script_id = None
+        self.transfer_totals = {"bytes": 0, "requests": 0}  # Network.loadingFinished totals (see get_render_stats)
+        self.dom_reader = None
+        self.selectors = get_selector_registry()
         self.comments_posted = 0
         self.posted_comments = []
         self.client = OpenAI(api_key=config.OPENAI_API_KEY)
 
-    def get_chrome_profile_path(self):
+    @staticmethod
+    def get_chrome_profile_path():
         """
         Automatically detect Chrome profile path based on OS
         You can override this by directly returning your path
@@ -42,7 +65,159 @@ class LinkedInCommentBot:
 
         return user_data_dir
 
+    def mark_startup_phase(self, phase):
+        if self.startup_timer:
+            self.startup_timer.mark(phase)
+
+    def get_driver_service(self):
+        """
+        Build the chromedriver Service from the per-Chrome-version cache (resolved once per bot)
+        """
+        if not self.chromedriver_path:
+            self.chromedriver_path = resolve_chromedriver_path()
+            self.mark_startup_phase("driver_resolution")
+        return Service(self.chromedriver_path)
+
+    def is_debugger_reachable(self, debugger_address):
+        """
+        Cheap probe of Chrome's DevTools endpoint before handing it to chromedriver
+        """
+        try:
+            url = f"http://{debugger_address}/json/version"
+            with urllib.request.urlopen(url, timeout=config.ATTACH_PROBE_TIMEOUT) as response:
+                return response.status == 200
+        except Exception:
+            return False
+
+    def is_session_healthy(self):
+        """
+        Health probe for the current driver session (one round-trip)
+        """
+        if not self.driver:
+            return False
+        try:
+            return self.driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def attach_to_existing_browser(self, debugger_address=None):
+        """
+        Attach to an already running Chrome started with --remote-debugging-port
+        Returns True if the attached session is healthy, False otherwise
+        """
+        debugger_address = debugger_address or config.CHROME_DEBUGGER_ADDRESS
+        print(f"Trying to attach to running Chrome at {debugger_address}...")
+
+        reachable = self.is_debugger_reachable(debugger_address)
+        self.mark_startup_phase("attach_probe")
+        if not reachable:
+            print("No running Chrome found on the debugging port")
+            return False
+
+        try:
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+            add_transfer_logging(chrome_options)
+            if config.LEAN_RENDER_MODE:
+                chrome_options.page_load_strategy = 'eager'
+
+            service = self.get_driver_service()
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.mark_startup_phase("chrome_attach")
+        except Exception as e:
+            print(f"Attaching to running Chrome failed: {e}")
+            self.driver = None
+            return False
+
+        if not self.is_session_healthy():
+            print("Attached Chrome session is not responding")
+            self.release_driver()
+            return False
+
+        self.attached_to_existing = True
+        print("Attached to running Chrome successfully!")
+        return True
+
+    def is_logged_out_url(self, url):
+        """
+        Check whether LinkedIn redirected us to a login/authwall page
+        """
+        logged_out_markers = ["/login", "/authwall", "/checkpoint", "/uas/login", "/signup"]
+        return any(marker in url for marker in logged_out_markers)
+
     def initialize_driver(self):
+        self.startup_timer = StartupTimer(imports_seconds=IMPORTS_SECONDS)
+
+        # Fast path: reuse a long-lived, already logged-in Chrome
+        if config.ATTACH_TO_EXISTING_CHROME and self.attach_to_existing_browser():
+            current_url = self.driver.current_url
+            if "linkedin.com/feed" not in current_url:
+                print("Opening LinkedIn feed in attached browser...")
+                self.driver.get("https://www.linkedin.com/feed/")
+            self.mark_startup_phase("first_navigation")
+
+            if self.is_logged_out_url(self.driver.current_url):
+                input("Please log in to LinkedIn manually, then press Enter to continue...")
+                self.startup_timer.skip()  # Manual login time is not startup cost
+            else:
+                print("Reusing logged-in session - skipping manual login")
+
+            self.wait_for_feed()
+            self.save_session_snapshot()
+            self.finish_startup_timing("attach")
+            return
+
+        self.launch_new_browser()
+
+        # Restore the saved session before the first navigation
+        session_restored = config.RESTORE_SAVED_SESSION and self.session_store.restore(self.driver)
+
+        if session_restored:
+            print("Opening LinkedIn feed with restored session...")
+            self.driver.get("https://www.linkedin.com/feed/")
+        else:
+            print("Opening LinkedIn...")
+            self.driver.get("https://www.linkedin.com/login")
+        self.mark_startup_phase("first_navigation")
+
+        if session_restored and self.is_logged_out_url(self.driver.current_url):
+            print("Restored session was rejected by LinkedIn - falling back to manual login")
+            self.session_store.clear()
+            self.driver.get("https://www.linkedin.com/login")
+            session_restored = False
+
+        if not session_restored and config.HEADLESS_MODE:
+            raise Exception("Headless mode needs a saved session - run once with HEADLESS_MODE = False to log in")
+
+        if not session_restored:
+            # Wait for manual login
+            input("Please log in to LinkedIn manually, then press Enter to continue...")
+            self.startup_timer.skip()  # Manual login time is not startup cost
+
+        self.wait_for_feed()
+        self.save_session_snapshot()
+        self.finish_startup_timing("restored_session" if session_restored else "launch")
+
+    def save_session_snapshot(self):
+        if config.SAVE_SESSION_SNAPSHOT:
+            self.session_store.save(self.driver)
+
+    def finish_startup_timing(self, mode):
+        self.mark_startup_phase("feed_ready")
+        if config.PRINT_STARTUP_TIMING:
+            self.startup_timer.print_report()
+        self.startup_timer.save(mode)
+
+    def add_display_arguments(self, chrome_options):
+        """
+        Window size, user agent and headless flag - identical fingerprint headed or headless
+        """
+        if config.HEADLESS_MODE:
+            chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
+
+    def launch_new_browser(self):
         print("Setting up Chrome browser with existing profile...")
 
         chrome_options = webdriver.ChromeOptions()
@@ -51,9 +226,7 @@ class LinkedInCommentBot:
         user_data_dir = self.get_chrome_profile_path()
 
         # IMPORTANT: Fix for DevToolsActivePort error
-        # Instead of using the profile directly, we'll use a temporary copy
-        import shutil
-        import tempfile
+        # If the profile can't be used directly, we fall back to a cloned copy (Option 2)
 
         # Option 1: Try using the profile with special flags (usually works)
         try:
@@ -63,7 +236,11 @@ class LinkedInCommentBot:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--remote-debugging-port=9222")
+            chrome_options.add_argument(f"--remote-debugging-port={config.CHROME_DEBUGGING_PORT}")
+
+            # Keep Chrome alive after this run so the next run can attach to it
+            if config.ATTACH_TO_EXISTING_CHROME:
+                chrome_options.add_experimental_option("detach", True)
 
             # Use profile - Try without specifying profile directory first
             chrome_options.add_argument(f"user-data-dir={user_data_dir}")
@@ -74,56 +251,47 @@ class LinkedInCommentBot:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
 
+            # Lean render: don't wait for images/subresources on page loads
+            if config.LEAN_RENDER_MODE:
+                chrome_options.page_load_strategy = 'eager'
+
             # Additional settings
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--start-maximized")
+            self.add_display_arguments(chrome_options)
+            if not config.HEADLESS_MODE:
+                chrome_options.add_argument("--start-maximized")  # Headless keeps the fixed --window-size
             chrome_options.add_argument("--disable-web-security")
             chrome_options.add_argument("--allow-running-insecure-content")
             chrome_options.add_argument("--disable-features=VizDisplayCompositor")
             chrome_options.add_argument("--disable-extensions")
 
-            # Set user agent
-            user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            chrome_options.add_argument(f"user-agent={user_agent}")
-
             # Add logging to debug
             chrome_options.add_argument("--enable-logging")
             chrome_options.add_argument("--v=1")
+            add_transfer_logging(chrome_options)
 
-            service = Service(ChromeDriverManager().install())
+            service = self.get_driver_service()
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.mark_startup_phase("chrome_spawn")
 
             print("Chrome started successfully!")
 
         except Exception as e:
+            self.mark_startup_phase("failed_launch")
             print(f"First attempt failed: {e}")
             print("\nTrying alternative approach with profile copy...")
 
-            # Option 2: Create a temporary copy of the profile
+            # Option 2: Use a reusable copy of the profile (caches stay warm across runs)
             try:
-                temp_dir = tempfile.mkdtemp(prefix="linkedin_bot_")
-                temp_profile = os.path.join(temp_dir, "ChromeProfile")
-
                 # Copy only essential profile files (not the whole profile to save time)
                 original_profile = os.path.join(user_data_dir, "Default")
                 if os.path.exists(original_profile):
-                    print(f"Copying profile from {original_profile} to {temp_profile}")
-
-                    # Create temp profile directory
-                    os.makedirs(temp_profile, exist_ok=True)
-
-                    # Copy only essential files
-                    essential_files = ["Cookies", "Cookies-journal", "Preferences", "Local State"]
-                    for file in essential_files:
-                        src = os.path.join(original_profile, file)
-                        if os.path.exists(src):
-                            dst = os.path.join(temp_profile, file)
-                            shutil.copy2(src, dst)
+                    self.profile_clone = ProfileClone(user_data_dir)
+                    clone_dir = self.profile_clone.sync()
 
-                    # Use the temporary profile
+                    # Use the cloned profile
                     chrome_options = webdriver.ChromeOptions()
-                    chrome_options.add_argument(f"user-data-dir={temp_dir}")
-                    chrome_options.add_argument("profile-directory=ChromeProfile")
+                    chrome_options.add_argument(f"user-data-dir={clone_dir}")
+                    chrome_options.add_argument("profile-directory=Default")
                 else:
                     print(f"Profile path not found: {original_profile}")
                     raise Exception("Chrome profile not found")
@@ -135,18 +303,23 @@ class LinkedInCommentBot:
                 chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
                 chrome_options.add_experimental_option('useAutomationExtension', False)
                 chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+                self.add_display_arguments(chrome_options)
+                add_transfer_logging(chrome_options)
+                if config.LEAN_RENDER_MODE:
+                    chrome_options.page_load_strategy = 'eager'
 
-                service = Service(ChromeDriverManager().install())
+                service = self.get_driver_service()
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                self.mark_startup_phase("chrome_spawn")
 
-                print("Chrome started with temporary profile!")
+                print("Chrome started with cloned profile!")
 
             except Exception as e2:
                 print(f"Second attempt also failed: {e2}")
                 print("\n🔧 Alternative Solution: Use manual browser approach")
                 print("Run this command in terminal to start Chrome:")
                 print('chrome.exe --remote-debugging-port=9222 --user-data-dir="C:\\temp\\chrome_profile"')
-                print("Then update the code to connect to existing browser")
+                print("Then set ATTACH_TO_EXISTING_CHROME = True in config.py to connect to it")
                 raise
 
         try:
@@ -154,21 +327,21 @@ class LinkedInCommentBot:
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
                 "source": """
+                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
                 """
             })
+            if config.HEADLESS_MODE:
+                # Also covers navigator.userAgent in workers and the UA request header
+                self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                    "userAgent": USER_AGENT,
+                    "acceptLanguage": "en-US,en"
+                })
         except Exception:
             pass  # CDP commands might not work with all setups
 
-        print("Opening LinkedIn...")
-        self.driver.get("https://www.linkedin.com/login")
-
-        # Wait for manual login
-        input("Please log in to LinkedIn manually, then press Enter to continue...")
-        self.wait_for_feed()
-
     def wait_for_feed(self):
         print("Waiting for LinkedIn feed to load...")
         try:
@@ -207,10 +380,100 @@ class LinkedInCommentBot:
             self.cleanup()
             exit(1)
 
+    def get_dom_reader(self):
+        """
+        Read-only DOM queries over direct CDP on this session's debug port (Selenium fallback)
+        """
+        if not self.dom_reader:
+            debugger_address = None
+            try:
+                debugger_address = self.driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+            except Exception:
+                pass
+            self.dom_reader = DomReader(self.driver, debugger_address)
+        return self.dom_reader
+
+    def enable_lean_render(self):
+        """
+        Switch the session to the lean profile for read-only stages (see LEAN_RENDER_MODE)
+        """
+        if config.LEAN_RENDER_MODE and not self.lean_render_active:
+            self.lean_render_script_id = apply_lean_render(self.driver)
+            self.lean_render_active = self.lean_render_script_id is not None
+
+    def disable_lean_render(self):
+        """
+        Back to full rendering before the session writes (commenting needs the real page)
+        """
+        if self.lean_render_active and remove_lean_render(self.driver, self.lean_render_script_id):
+            self.lean_render_active = False
+            self.lean_render_script_id = None
+
+    def drain_transfer_log(self):
+        """
+        Move the performance log ChromeDriver has buffered into transfer_totals (called
+        after each scan and per post in Stage 2 so the log never piles up)
+        Returns the totals, None when TRACK_TRANSFERRED_BYTES is off
+        """
+        if not config.TRACK_TRANSFERRED_BYTES or not self.driver:
+            return None
+        return get_transferred_bytes(self.driver, self.transfer_totals)
+
+    def get_render_stats(self, scroll_stats=None):
+        """
+        Bytes transferred (CDP encodedDataLength, whole session) and time per scroll step
+        (from the feed pass's ScrollEngine stats), to compare runs with the lean profile on and off
+        """
+        transfer = self.drain_transfer_log()
+        scroll_stats = scroll_stats or {}
+        return {
+            "lean_render": self.lean_render_active,
+            "bytes_transferred": transfer["bytes"] if transfer else None,
+            "requests": transfer["requests"] if transfer else None,
+            "scroll_count": scroll_stats.get("scroll_steps", 0),
+            "avg_scroll_seconds": scroll_stats.get("avg_step_seconds", 0)
+        }
+
+    def print_render_stats(self, render_stats):
+        mode = "ON" if render_stats["lean_render"] else "OFF"
+        if render_stats["bytes_transferred"] is None:
+            transfer = "bytes not measured (TRACK_TRANSFERRED_BYTES off)"
+        else:
+            transfer = f"{render_stats['bytes_transferred'] / (1024 * 1024):.1f} MB in {render_stats['requests']} requests"
+        print(f"🪶 Lean render {mode}: {transfer}, {render_stats['avg_scroll_seconds']:.3f}s per scroll "
+              f"({render_stats['scroll_count']} scrolls)")
+
+    def release_driver(self):
+        """
+        Stop chromedriver but leave the Chrome process running for the next attach
+        """
+        try:
+            self.driver.service.stop()
+        except Exception:
+            pass
+        self.driver = None
+
     def cleanup(self):
+        self.selectors.print_report()
+        self.selectors.save()
+
+        if self.dom_reader:
+            self.dom_reader.close()
+            self.dom_reader = None
+
+        browser_left_running = False
         if self.driver:
-            print("\nClosing browser...")
-            self.driver.quit()
+            if config.ATTACH_TO_EXISTING_CHROME and config.KEEP_BROWSER_ALIVE:
+                print("\nDetaching from browser (left running for the next run)...")
+                self.release_driver()
+                browser_left_running = True
+            else:
+                print("\nClosing browser...")
+                self.driver.quit()
+
+        # The running browser still uses the clone, so its caches must not be trimmed under it
+        if self.profile_clone and not browser_left_running:
+            self.profile_clone.gc()
 
 def main():
     bot = LinkedInCommentBot()
@@ -0,0 +1,128 @@
+import os
+import re
+import json
+import glob
+import shutil
+import platform
+import subprocess
+from datetime import datetime
+import config
+
+
+def get_chrome_binary_candidates():
+    """
+    Return the usual Chrome executable locations for the current OS
+    """
+    system = platform.system()
+
+    if system == "Windows":
+        candidates = [
+            os.path.join(os.environ.get("PROGRAMFILES", r"C:\Program Files"), "Google", "Chrome", "Application", "chrome.exe"),
+            os.path.join(os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)"), "Google", "Chrome", "Application", "chrome.exe"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Google", "Chrome", "Application", "chrome.exe")
+        ]
+    elif system == "Darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        candidates = [shutil.which(name) for name in ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]]
+
+    return [path for path in candidates if path and os.path.exists(path)]
+
+
+def get_chrome_major_version():
+    """
+    Detect the installed Chrome major version without any network access
+    Returns the major version as a string (e.g. '120') or None if unknown
+    """
+    if platform.system() == "Windows":
+        # chrome.exe --version does not print on Windows, the registry does
+        try:
+            output = subprocess.run(
+                ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+                capture_output=True, text=True, timeout=5
+            ).stdout
+            match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+            if match:
+                return match.group(1)
+        except Exception:
+            pass
+
+    for binary in get_chrome_binary_candidates():
+        try:
+            output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5).stdout
+            match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+            if match:
+                return match.group(1)
+        except Exception:
+            continue
+
+    return None
+
+
+def load_driver_cache():
+    try:
+        with open(config.CHROMEDRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_driver_cache(cache):
+    try:
+        with open(config.CHROMEDRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        print(f"⚠️ Could not save chromedriver cache: {e}")
+
+
+def find_local_chromedriver(chrome_major):
+    """
+    Look for an already downloaded chromedriver matching the Chrome major version
+    (webdriver-manager keeps its downloads under ~/.wdm/drivers/chromedriver)
+    """
+    driver_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+    wdm_root = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+
+    matches = []
+    for path in glob.glob(os.path.join(wdm_root, "**", driver_name), recursive=True):
+        version_match = re.search(r"[\\/](\d+)\.\d+\.\d+\.\d+[\\/]", path)
+        if version_match and (chrome_major is None or version_match.group(1) == chrome_major):
+            matches.append(path)
+
+    if matches:
+        return max(matches, key=os.path.getmtime)
+
+    # A chromedriver on PATH is the last offline option
+    return shutil.which(driver_name)
+
+
+def resolve_chromedriver_path():
+    """
+    Resolve chromedriver for the installed Chrome, cached per Chrome major version.
+    Only touches the network when no matching driver exists locally.
+    """
+    chrome_major = get_chrome_major_version()
+    cache_key = chrome_major or "unknown"
+    cache = load_driver_cache()
+
+    cached = cache.get(cache_key)
+    if cached and os.path.exists(cached.get("path", "")):
+        return cached["path"]
+
+    driver_path = find_local_chromedriver(chrome_major)
+    source = "local"
+
+    if not driver_path:
+        print(f"No cached chromedriver for Chrome {cache_key} - downloading once...")
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+        source = "download"
+
+    cache[cache_key] = {
+        "path": driver_path,
+        "source": source,
+        "resolved_at": datetime.now().isoformat()
+    }
+    save_driver_cache(cache)
+    print(f"Using chromedriver for Chrome {cache_key}: {driver_path}")
+    return driver_path
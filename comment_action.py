@@ -9,6 +9,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException,
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from chrome_initialize import LinkedInCommentBot
+from post_index import EMBER_ID_BY_URN_SCRIPT
 import config
 
 class LinkedInCommentAction(LinkedInCommentBot):
@@ -100,62 +101,25 @@ class LinkedInCommentAction(LinkedInCommentBot):
     def find_comment_button(self, post_element):
         """
         Find the comment button within a post using multiple strategies
-        Based on linkedin_html_tag.txt patterns
+        Based on linkedin_html_tag.txt patterns; strategies are tried best performer first
         """
         try:
             print("🔍 Looking for comment button...")
 
-            # Strategy 1: Use the specific ID pattern from HTML tag file
-            # Pattern: #feed-shared-social-action-bar-comment-ember[number]
-            try:
-                comment_buttons = post_element.find_elements(
-                    By.CSS_SELECTOR,
-                    "[id^='feed-shared-social-action-bar-comment-']"
-                )
-                for button in comment_buttons:
+            def first_usable(buttons):
+                for button in buttons:
                     if button.is_displayed() and button.is_enabled():
-                        button_id = button.get_attribute('id')
-                        print(f"✅ Found comment button by ID pattern: {button_id}")
                         return button
-            except NoSuchElementException:
-                pass
+                return None
 
-            # Strategy 2: Find by aria-label containing 'comment'
-            try:
-                comment_button = post_element.find_element(
-                    By.CSS_SELECTOR,
-                    "button[aria-label*='comment' i]"
-                )
-                if comment_button.is_displayed() and comment_button.is_enabled():
-                    aria_label = comment_button.get_attribute('aria-label')
-                    print(f"✅ Found comment button by aria-label: {aria_label}")
-                    return comment_button
-            except NoSuchElementException:
-                pass
-
-            # Strategy 3: XPath search for any button containing 'comment' in ID
-            try:
-                comment_buttons = post_element.find_elements(
-                    By.XPATH,
-                    ".//button[contains(@id, 'comment')]"
-                )
-                for button in comment_buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        button_id = button.get_attribute('id')
-                        print(f"✅ Found comment button by XPath ID search: {button_id}")
-                        return button
-            except NoSuchElementException:
-                pass
-
-            # Strategy 4: Look for social action bar and find comment button within
-            try:
+            def in_social_action_bar():
+                # Look for social action bar and find comment button within
                 social_bars = post_element.find_elements(
                     By.CSS_SELECTOR,
                     "[class*='social-action'], [id*='social-action']"
                 )
                 for bar in social_bars:
-                    buttons = bar.find_elements(By.CSS_SELECTOR, "button")
-                    for button in buttons:
+                    for button in bar.find_elements(By.CSS_SELECTOR, "button"):
                         button_id = button.get_attribute('id') or ''
                         button_aria = button.get_attribute('aria-label') or ''
                         button_text = button.text.lower()
@@ -164,10 +128,28 @@ class LinkedInCommentAction(LinkedInCommentBot):
                             'comment' in button_aria.lower() or
                             'comment' in button_text):
                             if button.is_displayed() and button.is_enabled():
-                                print(f"✅ Found comment button in social action bar")
                                 return button
-            except NoSuchElementException:
-                pass
+                return None
+
+            strategies = {
+                # Specific ID pattern from HTML tag file: #feed-shared-social-action-bar-comment-ember[number]
+                "id_pattern": lambda: first_usable(post_element.find_elements(
+                    By.CSS_SELECTOR, "[id^='feed-shared-social-action-bar-comment-']")),
+                # aria-label containing 'comment'
+                "aria_label": lambda: first_usable([post_element.find_element(
+                    By.CSS_SELECTOR, "button[aria-label*='comment' i]")]),
+                # Any button containing 'comment' in its ID
+                "xpath_id": lambda: first_usable(post_element.find_elements(
+                    By.XPATH, ".//button[contains(@id, 'comment')]")),
+                "social_action_bar": in_social_action_bar
+            }
+
+            strategy, button = self.selectors.first_match(
+                "comment_button", list(strategies), lambda name: strategies[name]()
+            )
+            if button:
+                print(f"✅ Found comment button ({strategy})")
+                return button
 
             print("❌ Could not find comment button with any strategy")
             return None
@@ -338,138 +320,69 @@ class LinkedInCommentAction(LinkedInCommentBot):
     def find_submit_button(self, post_element=None):
         """
         Find the submit/post comment button
-        Based on linkedin_html_tag.txt patterns
+        Based on linkedin_html_tag.txt patterns. With a post element only strategies scoped
+        to that post are tried (best performer first); page-wide strategies are a fixed-order
+        fallback for when no post element is given, so another post's button is never clicked.
         Args:
             post_element: Optional post element to search within for better context
         """
         try:
             print("🔍 Looking for submit button...")
 
-            # Strategy 1: Search within post element first if provided
-            if post_element:
-                try:
-                    # Look for buttons with ember IDs that contain "Comment" text within post
-                    ember_buttons = post_element.find_elements(
-                        By.CSS_SELECTOR,
-                        "button[id^='ember']"
-                    )
-                    for button in ember_buttons:
-                        button_text = button.text.strip()
-                        if (button_text in ["Comment", "Post", "Post comment"] and
-                            button.is_displayed() and
-                            button.is_enabled()):
-                            button_id = button.get_attribute('id')
-                            print(f"✅ Found submit button by ember ID within post context: {button_id}")
-                            return button
-                except:
-                    pass
-
-            # Strategy 2: Find by specific ID pattern globally (like #ember300)
-            try:
-                # Look for buttons with ember IDs that contain "Comment" text
-                ember_buttons = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "button[id^='ember']"
-                )
-                for button in ember_buttons:
-                    button_text = button.text.strip()
-                    if (button_text in ["Comment", "Post", "Post comment"] and
-                        button.is_displayed() and
-                        button.is_enabled()):
-                        button_id = button.get_attribute('id')
-                        print(f"✅ Found submit button by ember ID: {button_id}")
-                        return button
-            except:
-                pass
-
-            # Strategy 3: Find by class pattern (within post if available)
             search_element = post_element if post_element else self.driver
-            try:
-                submit_button = search_element.find_element(
-                    By.CSS_SELECTOR,
-                    "button.comments-comment-box__submit-button--cr"
-                )
-                if submit_button.is_displayed() and submit_button.is_enabled():
-                    context = " within post context" if post_element else ""
-                    print(f"✅ Found submit button by specific class{context}")
-                    return submit_button
-            except NoSuchElementException:
-                pass
+            submit_texts = ["Comment", "Post", "Post comment"]
 
-            # Strategy 4: Find by partial class match (within post if available)
-            try:
-                submit_buttons = search_element.find_elements(
-                    By.CSS_SELECTOR,
-                    "button[class*='comments-comment-box__submit-button']"
-                )
-                for button in submit_buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        context = " within post context" if post_element else ""
-                        print(f"✅ Found submit button by partial class{context}")
+            def usable(button):
+                return button.is_displayed() and button.is_enabled()
+
+            def by_text(buttons):
+                for button in buttons:
+                    if button.text.strip() in submit_texts and usable(button):
                         return button
-            except NoSuchElementException:
-                pass
+                return None
 
-            # Strategy 5: Find primary button with "Comment" text (within post if available)
-            try:
-                primary_buttons = search_element.find_elements(
-                    By.CSS_SELECTOR,
-                    "button.artdeco-button--primary"
-                )
-                for button in primary_buttons:
-                    button_text = button.text.strip()
-                    if (button_text in ["Comment", "Post", "Post comment"] and
-                        button.is_displayed() and
-                        button.is_enabled()):
-                        context = " within post context" if post_element else ""
-                        print(f"✅ Found submit button (primary button with Comment text){context}")
+            def first_usable(buttons):
+                for button in buttons:
+                    if usable(button):
                         return button
-            except:
-                pass
+                return None
+
+            def generic_search():
+                # Any button that appeared after typing
+                for button in search_element.find_elements(By.CSS_SELECTOR, "button"):
+                    button_classes = (button.get_attribute("class") or "").lower()
+                    if (button.text.strip() in submit_texts and usable(button) and
+                        ("submit" in button_classes or "comment" in button_classes or "primary" in button_classes)):
+                        return button
+                return None
 
-            # Strategy 6: XPath search for button containing "Comment" in span (prefer post context)
+            span_xpath = "button[.//span[contains(text(), 'Comment')] or .//span[contains(text(), 'Post')]]"
+            strategies = {}
             if post_element:
-                try:
-                    submit_button = post_element.find_element(
-                        By.XPATH,
-                        ".//button[.//span[contains(text(), 'Comment')] or .//span[contains(text(), 'Post')]]"
-                    )
-                    if submit_button.is_displayed() and submit_button.is_enabled():
-                        print("✅ Found submit button by span text XPath within post context")
-                        return submit_button
-                except NoSuchElementException:
-                    pass
-
-            # Strategy 7: XPath search globally as fallback
-            try:
-                submit_button = self.driver.find_element(
-                    By.XPATH,
-                    "//button[.//span[contains(text(), 'Comment')] or .//span[contains(text(), 'Post')]]"
-                )
-                if submit_button.is_displayed() and submit_button.is_enabled():
-                    print("✅ Found submit button by span text XPath")
-                    return submit_button
-            except NoSuchElementException:
-                pass
+                # Buttons with ember IDs that contain "Comment" text within the post
+                strategies["ember_text_in_post"] = lambda: by_text(post_element.find_elements(By.CSS_SELECTOR, "button[id^='ember']"))
+            else:
+                strategies["ember_text"] = lambda: by_text(self.driver.find_elements(By.CSS_SELECTOR, "button[id^='ember']"))
+            strategies["submit_class"] = lambda: first_usable([search_element.find_element(
+                By.CSS_SELECTOR, "button.comments-comment-box__submit-button--cr")])
+            strategies["submit_class_partial"] = lambda: first_usable(search_element.find_elements(
+                By.CSS_SELECTOR, "button[class*='comments-comment-box__submit-button']"))
+            strategies["primary_with_text"] = lambda: by_text(search_element.find_elements(
+                By.CSS_SELECTOR, "button.artdeco-button--primary"))
+            if post_element:
+                strategies["span_xpath_in_post"] = lambda: first_usable([post_element.find_element(By.XPATH, ".//" + span_xpath)])
+            else:
+                strategies["span_xpath"] = lambda: first_usable([self.driver.find_element(By.XPATH, "//" + span_xpath)])
+            strategies["generic_search"] = generic_search
 
-            # Strategy 8: Find any button that appeared after typing (within post if available)
-            try:
-                all_buttons = search_element.find_elements(By.CSS_SELECTOR, "button")
-                for button in all_buttons:
-                    button_text = button.text.strip()
-                    button_classes = button.get_attribute("class") or ""
-
-                    if (button_text in ["Comment", "Post", "Post comment"] and
-                        button.is_displayed() and
-                        button.is_enabled() and
-                        ("submit" in button_classes.lower() or
-                         "comment" in button_classes.lower() or
-                         "primary" in button_classes.lower())):
-                        context = " within post context" if post_element else ""
-                        print(f"✅ Found submit button (generic search){context}")
-                        return button
-            except:
-                pass
+            # Only the post-scoped cascade is reordered by hit rate
+            cascade = "submit_button_in_post" if post_element else "submit_button_page"
+            strategy, button = self.selectors.first_match(
+                cascade, list(strategies), lambda name: strategies[name](), adaptive=bool(post_element)
+            )
+            if button:
+                print(f"✅ Found submit button ({strategy})")
+                return button
 
             print("❌ Could not find submit button")
             return None
@@ -719,6 +632,64 @@ class LinkedInCommentAction(LinkedInCommentBot):
             comment_data["duration_seconds"] = (end_time - start_time).total_seconds()
             self.comment_results["comments"].append(comment_data)
 
+    def find_ember_id_by_urn(self, urn):
+        """
+        Find the current ember ID of a post by URN, on the current page if it is
+        rendered there, otherwise on the post's permalink page
+        Args:
+            urn (str): Stable post URN (e.g., 'urn:li:activity:7123...')
+        Returns:
+            str or None: The ember ID of the post's container
+        """
+        try:
+            ember_id = self.driver.execute_script(EMBER_ID_BY_URN_SCRIPT, urn)
+            if ember_id:
+                print(f"✅ Found post {urn} on the current page: {ember_id}")
+                return ember_id
+
+            print(f"🔗 Opening permalink for {urn}...")
+            self.driver.get(f"https://www.linkedin.com/feed/update/{urn}/")
+            WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(
+                lambda driver: driver.execute_script(EMBER_ID_BY_URN_SCRIPT, urn)
+            )
+            return self.driver.execute_script(EMBER_ID_BY_URN_SCRIPT, urn)
+        except TimeoutException:
+            print(f"❌ Post {urn} did not load on its permalink page")
+            return None
+        except Exception as e:
+            print(f"❌ Error opening post {urn}: {e}")
+            return None
+
+    def post_comment_by_urn(self, urn, comment_text):
+        """
+        Post a comment to a post identified by its URN (used by the dual-browser writer)
+
+        Args:
+            urn (str): Stable post URN
+            comment_text (str): The comment text to post
+
+        Returns:
+            bool: True if comment was posted successfully, False otherwise
+        """
+        ember_id = self.find_ember_id_by_urn(urn)
+        if not ember_id:
+            self.comment_results["total_attempts"] += 1
+            self.comment_results["failed_comments"] += 1
+            self.comment_results["comments"].append({
+                "ember_id": None,
+                "urn": urn,
+                "comment_text": comment_text,
+                "timestamp": datetime.now().isoformat(),
+                "success": False,
+                "error": "Post not found by URN",
+                "steps_completed": []
+            })
+            return False
+
+        success = self.post_comment_by_ember_id(ember_id, comment_text)
+        self.comment_results["comments"][-1]["urn"] = urn
+        return success
+
     def post_comments_batch(self, comment_requests):
         """
         Post multiple comments in batch
@@ -10,7 +10,7 @@ MIN_WAIT_TIME = 30  # Minimum seconds to wait between comments
 MAX_WAIT_TIME = 60  # Maximum seconds to wait between comments
 
 # Post Filtering
-MAX_POST_AGE_DAYS = 3  # Skip posts older than this many days
+MAX_POST_AGE_DAYS = 3  # Skip posts older than this many days, from their relative timestamp (0 = no limit)
 
 # Comment Generation Prompt
 COMMENT_PROMPT = """Generate a professional LinkedIn comment for this post. 
@@ -131,9 +131,10 @@ SCROLL_DELAY = 1.0  # Seconds to wait after scrolling to element
 
 # Filtering Options
 EXTRACT_FROM_SPONSORED = False  # Whether to extract content from sponsored posts
-SKIP_VIETNAMESE_POSTS = True  # Skip posts written in Vietnamese language
-SKIP_VIDEO_POSTS = True  # Skip posts that are primarily video content
-SKIP_IMAGE_ONLY_POSTS = True  # Skip posts that are primarily images without text
+SKIP_LANGUAGES = ["vi"]  # Set aside posts in these languages (ISO 639-1 codes from LANGUAGE_SAMPLES_FILE)
+SPONSOR_LABELS = ["Promoted", "Sponsored"]  # Actor sub-description labels that mark an ad (add localized labels as needed)
+SKIP_VIDEO_POSTS = True  # Skip posts that are primarily video content (adds "video_only" to SKIP_CONTENT_TYPES)
+SKIP_IMAGE_ONLY_POSTS = True  # Skip posts that are primarily images without text (adds "image_only" to SKIP_CONTENT_TYPES)
 
 # Author Filtering
 EXTRACT_FROM_SPECIFIC_AUTHORS = []  # List of author names to extract from (empty = all authors)
@@ -144,6 +145,9 @@ SKIP_AUTHORS = []  # List of author names to skip (empty = don't skip any)
 # SKIP_AUTHORS = ["Spam Account", "Bot User"]  # Skip these authors
 
 # Content Type Filtering
+# Tagged in-page during Stage 1 (content_types.py); Stage 2 only extracts posts whose
+# type is listed here (empty = all types) and not listed in SKIP_CONTENT_TYPES.
+# Image/video posts with commentary of at least MIN_CONTENT_LENGTH count as "text".
 EXTRACT_CONTENT_TYPES = [
     "text",      # Regular text posts
     "article",   # Shared articles with commentary
@@ -179,11 +183,12 @@ ERROR_LOG_FILENAME = "content_extraction_errors.log"
 # Advanced Options
 USE_SELENIUM_WAIT = True  # Use explicit waits for better reliability
 WAIT_TIMEOUT = 10  # Maximum seconds to wait for elements to load
-HEADLESS_MODE = False  # Run browser in headless mode (not recommended for LinkedIn)
+HEADLESS_MODE = False  # Run Chrome with --headless=new (needs a saved session, see SAVE_SESSION_SNAPSHOT)
 SAVE_SCREENSHOTS_ON_ERROR = False  # Save screenshot when content extraction fails
 
 # Stage 2 Automation
 AUTO_START_STAGE_2 = False  # Automatically start Stage 2 without user prompt
+STREAMING_PIPELINE = False  # Comment on posts as they are discovered instead of after the full Stage 1 scan
 SKIP_STAGE_2_PROMPT = False  # Skip the Stage 2 confirmation prompt entirely
 
 # Integrated Commenting (Stage 2)
@@ -193,9 +198,107 @@ GENERATE_CONTEXTUAL_COMMENTS = True  # Generate comments based on post content v
 MAX_COMMENTS_PER_SESSION = 5  # Maximum number of comments to post in one session
 COMMENT_ON_EXTRACTION_FAILURE = False  # Whether to comment even if content extraction fails
 
+# Lean Render (read-only stages)
+LEAN_RENDER_MODE = False  # Block media/fonts/beacons, disable animations, eager page loads while scanning
+TRACK_TRANSFERRED_BYTES = False  # Log CDP Network events to measure bytes per scan (to compare LEAN_RENDER_MODE on/off)
+
+# DOM Read Transport
+USE_DIRECT_CDP = True  # Run read-only scan queries over a direct DevTools websocket (falls back to Selenium)
+CDP_COMMAND_TIMEOUT = 10  # Seconds to wait for a direct CDP response
+TRACK_TRANSPORT_STATS = True  # Count round-trips and latency per transport (cdp / selenium)
+
+# Driver Watchdog (Stage 2)
+WATCHDOG_ENABLED = True  # Check browser health before each post and restart it if needed
+WATCHDOG_COMMAND_TIMEOUT = 15  # Seconds before a WebDriver command counts as hung
+WATCHDOG_MAX_COMMAND_LATENCY = 5  # Restart when a trivial command takes longer than this (seconds)
+WATCHDOG_MAX_RSS_MB = 3000  # Restart when the browser process tree exceeds this memory (0 = no limit)
+WATCHDOG_MAX_RESTARTS = 3  # Give up after this many restarts in one extraction run
+
+# Post Handles (Stage 2)
+POST_RELOCATE_TIMEOUT = 2.0  # Seconds a re-rendering post may be missing from the page before it counts as gone
+
+# Feed Harvester (Stage 1)
+HARVEST_EXCERPT_CHARS = 1500  # Characters of post text returned per post for language checks
+INCREMENTAL_FEED_CAPTURE = True  # Buffer posts in-page with a MutationObserver as they are inserted
+
+# Language Identification (character n-grams, see language_id.py)
+LANGUAGE_SAMPLES_FILE = "language_samples.json"  # Labelled texts the identifier is trained on (and benchmarked with)
+LANGUAGE_ID_MAX_CHARS = 600  # Characters of each post used for language identification
+LANGUAGE_MIN_CHARS = 20  # Posts with fewer letters are reported as "unknown" (never skipped)
+LANGUAGE_HASH_BUCKETS = 65536  # Hashed n-gram buckets per language profile
+LANGUAGE_MIN_COVERAGE = 0.88  # Share of a text's n-grams seen in training for the best language (else "unknown")
+LANGUAGE_MIN_MARGIN = 0.2  # Per-n-gram log-likelihood lead over the runner-up language (else "unknown")
+LANGUAGE_MIXED_MIN_SHARE = 0.3  # Skip mixed posts with at least this share of letters in a SKIP_LANGUAGES language
+
+# Feed Scrolling (Stage 1) - stops at MAX_POSTS_TO_SCAN, a growth plateau, the time budget or the age cutoff
+SCROLL_TIME_BUDGET = 30  # Maximum seconds spent scrolling the feed (0 = no limit)
+SCROLL_GROWTH_TIMEOUT = 4.0  # Seconds to wait for the feed to grow after each scroll
+SCROLL_POLL_INTERVAL = 0.25  # Seconds between feed growth checks
+SCROLL_PLATEAU_STEPS = 3  # Stop after this many scrolls in a row without new content
+STALE_POSTS_STOP_AFTER = 5  # Stop after this many posts in a row older than MAX_POST_AGE_DAYS (0 = never)
+
+# Selector Cascades
+ADAPTIVE_SELECTORS = True  # Try the fallback selector with the best observed hit rate first
+SELECTOR_STATS_FILE = "selector_stats.json"  # Hit/miss stats per selector, kept between runs
+SELECTOR_DEAD_AFTER = 50  # Report selectors that missed this many times without a single hit
+LOCAL_SELECTOR_EVALUATION = True  # Stage 2: fetch each post's outerHTML once and run its selectors in Python
+
+# Feed Snapshots (offline re-classification, see snapshot_parser.py)
+SAVE_FEED_SNAPSHOTS = False  # Archive the rendered feed HTML (zstd-compressed) after Stage 1 scrolling
+FEED_SNAPSHOT_DIR = "feed_snapshots"  # Snapshot archive directory (trained dictionaries are stored here too)
+SNAPSHOT_COMPRESSION_LEVEL = 10  # zstd level (1-22)
+SNAPSHOT_DICT_SIZE = 112640  # Bytes of the trained zstd dictionary
+SNAPSHOT_DICT_MIN_SAMPLES = 8  # Snapshots needed before a dictionary can be trained
+SNAPSHOT_PARSER_WORKERS = 0  # Processes used to parse an archive (0 = one per CPU)
+
 # Performance Settings
-BATCH_SIZE = 5  # Process posts in batches (0 = process all at once)
-MEMORY_CLEANUP_INTERVAL = 20  # Clear browser cache every N posts
+BATCH_SIZE = 5  # Save Stage 2 progress every N posts (0 = only save at the end)
+MEMORY_CLEANUP_INTERVAL = 20  # Prune processed posts from the DOM every N posts (0 = never)
+
+# ========== BROWSER SESSION REUSE ==========
+
+# Attach to a long-lived Chrome that is already logged in instead of spawning a new one.
+# Start it once with: chrome --remote-debugging-port=9222 --user-data-dir=<your profile>
+ATTACH_TO_EXISTING_CHROME = True  # Try attaching via debuggerAddress before launching a fresh browser
+CHROME_DEBUGGING_PORT = 9222  # Remote debugging port used for attaching and for fresh launches
+CHROME_DEBUGGER_ADDRESS = f"127.0.0.1:{CHROME_DEBUGGING_PORT}"
+ATTACH_PROBE_TIMEOUT = 2  # Seconds to wait for the DevTools endpoint before falling back to a fresh launch
+KEEP_BROWSER_ALIVE = True  # Leave Chrome running on cleanup so the next run can attach to it
+
+# ========== SAVED LOGIN SESSION ==========
+
+SAVE_SESSION_SNAPSHOT = True  # Save cookies + localStorage (encrypted) once the feed has loaded
+RESTORE_SAVED_SESSION = True  # Restore the snapshot on start and skip the manual login prompt
+SESSION_SNAPSHOT_FILE = "linkedin_session.enc"  # Encrypted session snapshot
+SESSION_KEY_FILE = "linkedin_session.key"  # Encryption key (or set LINKEDIN_SESSION_KEY env variable)
+SESSION_LOCAL_STORAGE_PREFIXES = ["voyager", "li_", "feed"]  # localStorage keys worth keeping ([] = all)
+
+# ========== STARTUP ==========
+
+CHROMEDRIVER_CACHE_FILE = "chromedriver_cache.json"  # Chromedriver path cached per installed Chrome major version
+PRINT_STARTUP_TIMING = True  # Print per-phase startup timing after the feed is ready
+STARTUP_TIMING_LOG = "startup_timings.jsonl"  # Append each startup's timings here ("" = don't log)
+
+# ========== PROFILE CLONE (fallback launch path) ==========
+
+PROFILE_CLONE_DIR = ""  # Where the reusable profile clone lives ("" = tmpfs or system temp dir)
+PROFILE_CLONE_ON_TMPFS = True  # Put the clone on /dev/shm when available (Linux)
+PROFILE_CLONE_HASH_CHECK = True  # Hash files whose mtime changed before re-copying them
+PROFILE_CLONE_MAX_CACHE_MB = 500  # cleanup() drops the clone's caches above this size (0 = never)
+
+# ========== BROWSER POOL ==========
+
+BROWSER_POOL_SIZE = 2  # Number of Chrome instances launched by browser_pool.BrowserPool
+BROWSER_POOL_DIR = "browser_pool_profiles"  # Per-instance cloned profiles live here
+BROWSER_POOL_SOURCE_PROFILES = []  # Chrome user-data dirs to clone, assigned round-robin (empty = default profile)
+BROWSER_POOL_START_TIMEOUT = 30  # Seconds to wait for a pooled Chrome to open its debug port
+BROWSER_POOL_LEASE_TIMEOUT = 300  # Seconds a worker waits for a free instance
+
+# ========== DUAL BROWSER ==========
+
+# Reader/writer split: a headless reader (cloned profile + saved session) scans and extracts
+# while the headed writer only posts comments, handed over by post URN
+DUAL_BROWSER_MODE = False  # Needs a saved session (SAVE_SESSION_SNAPSHOT) for the headless reader
 
 # ========== VALIDATION RULES ==========
 def validate_config():
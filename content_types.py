@@ -0,0 +1,125 @@
+import json
+import config
+
+# Content type of a post from the feed components it renders, checked in priority
+# order. Media posts whose own commentary is shorter than MIN_CONTENT_LENGTH are
+# "<media>_only"; with substantial commentary they count as "text".
+CONTENT_TYPE_MARKERS = [
+    ("job_posting", [
+        ".update-components-job",
+        ".feed-shared-job",
+        "[data-view-name*='job']",
+        "a[href*='/jobs/view/']"
+    ]),
+    ("event", [
+        ".update-components-event",
+        ".feed-shared-event",
+        "a[href*='/events/']"
+    ]),
+    ("poll", [
+        ".update-components-poll",
+        ".feed-shared-poll"
+    ]),
+    ("document", [
+        ".update-components-document",
+        ".feed-shared-document",
+        ".document-s-container"
+    ]),
+    ("article", [
+        ".update-components-article",
+        ".feed-shared-article"
+    ]),
+    ("video", [
+        ".update-components-linkedin-video",
+        ".feed-shared-linkedin-video",
+        ".update-components-video",
+        "video"
+    ]),
+    ("image", [
+        ".update-components-image",
+        ".feed-shared-image",
+        ".update-components-carousel"
+    ])
+]
+
+MEDIA_TYPES = ("video", "image")
+
+COMMENTARY_SELECTORS = [
+    ".update-components-text",
+    ".feed-shared-update-v2__description",
+    ".feed-shared-text"
+]
+
+# In-page contentType(el): {content_type, markers}
+CONTENT_TYPE_JS = (
+    "const CONTENT_TYPE_MARKERS = " + json.dumps(CONTENT_TYPE_MARKERS) + ";\n"
+    "const COMMENTARY_SELECTORS = " + json.dumps(COMMENTARY_SELECTORS) + ";\n"
+    "const MEDIA_TYPES = " + json.dumps(MEDIA_TYPES) + ";\n"
+    "const MIN_COMMENTARY_CHARS = " + json.dumps(config.MIN_CONTENT_LENGTH) + ";\n"
+    """
+function contentType(el) {
+    const markers = [];
+    for (const [type, selectors] of CONTENT_TYPE_MARKERS) {
+        const selector = selectors.find(selector => el.querySelector(selector));
+        if (selector) markers.push(type + ':' + selector);
+    }
+
+    let commentaryChars = 0;
+    for (const selector of COMMENTARY_SELECTORS) {
+        const node = el.querySelector(selector);
+        if (node) { commentaryChars = (node.textContent || '').trim().length; break; }
+    }
+
+    let type = markers.length ? markers[0].split(':')[0] : 'text';
+    if (MEDIA_TYPES.includes(type)) type = commentaryChars >= MIN_COMMENTARY_CHARS ? 'text' : type + '_only';
+    return {content_type: type, markers: markers};
+}
+"""
+)
+
+
+def content_type(root):
+    """
+    Same check as the in-page contentType, on parsed HTML (html_selectors).
+    Returns (content_type, markers).
+    """
+    markers = []
+    for name, selectors in CONTENT_TYPE_MARKERS:
+        selector = next((selector for selector in selectors if root.css_first(selector) is not None), None)
+        if selector:
+            markers.append(f"{name}:{selector}")
+
+    commentary_chars = 0
+    for selector in COMMENTARY_SELECTORS:
+        node = root.css_first(selector)
+        if node is not None:
+            commentary_chars = len(node.text(deep=True).strip())
+            break
+
+    name = markers[0].split(":")[0] if markers else "text"
+    if name in MEDIA_TYPES:
+        name = "text" if commentary_chars >= config.MIN_CONTENT_LENGTH else name + "_only"
+    return name, markers
+
+
+def skipped_content_types():
+    """
+    SKIP_CONTENT_TYPES plus the older SKIP_VIDEO_POSTS / SKIP_IMAGE_ONLY_POSTS switches
+    """
+    skipped = set(config.SKIP_CONTENT_TYPES)
+    if config.SKIP_VIDEO_POSTS:
+        skipped.add("video_only")
+    if config.SKIP_IMAGE_ONLY_POSTS:
+        skipped.add("image_only")
+    return skipped
+
+
+def is_extracted_content_type(name):
+    """
+    Whether Stage 2 should extract a post of this content type (None = not classified, kept)
+    """
+    if name is None:
+        return True
+    if name in skipped_content_types():
+        return False
+    return not config.EXTRACT_CONTENT_TYPES or name in config.EXTRACT_CONTENT_TYPES
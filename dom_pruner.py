@@ -0,0 +1,99 @@
+from datetime import datetime
+import config
+
+# Empty processed post subtrees but keep the (Ember-owned) root node with its
+# height pinned, so scroll height and LinkedIn's own bookkeeping stay intact
+PRUNE_POSTS_SCRIPT = """
+const ids = arguments[0];
+let pruned = 0;
+for (const id of ids) {
+    const el = document.getElementById(id);
+    if (!el || el.dataset.pruned === '1') continue;
+    el.style.height = el.getBoundingClientRect().height + 'px';
+    el.style.overflow = 'hidden';
+    el.replaceChildren();
+    el.dataset.pruned = '1';
+    pruned++;
+}
+return pruned;
+"""
+
+
+def get_js_heap_size(driver):
+    """
+    Used JS heap size of the current page in bytes (None if unavailable)
+    """
+    try:
+        return driver.execute_cdp_cmd("Runtime.getHeapUsage", {}).get("usedSize")
+    except Exception:
+        try:
+            return driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : null;")
+        except Exception:
+            return None
+
+
+class MemoryCleaner:
+    """
+    Every MEMORY_CLEANUP_INTERVAL posts, prune the processed posts from the DOM
+    and record the JS heap size before and after
+    """
+
+    def __init__(self, driver, interval=None):
+        self.driver = driver
+        self.interval = config.MEMORY_CLEANUP_INTERVAL if interval is None else interval
+        self.posts_seen = 0
+        self.pending_ids = []
+        self.cleanups = []
+
+    def post_done(self, ember_id, prunable=True):
+        """
+        Register a finished post; prunable posts are removed at the next cleanup
+        """
+        self.posts_seen += 1
+        if prunable and ember_id:
+            self.pending_ids.append(ember_id)
+
+        if self.interval and self.posts_seen % self.interval == 0:
+            self.cleanup()
+
+    def cleanup(self):
+        if not self.pending_ids:
+            return None
+
+        heap_before = get_js_heap_size(self.driver)
+        try:
+            pruned = self.driver.execute_script(PRUNE_POSTS_SCRIPT, self.pending_ids)
+        except Exception as e:
+            print(f"⚠️ DOM pruning failed: {e}")
+            return None
+
+        try:
+            self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        except Exception:
+            pass
+        heap_after = get_js_heap_size(self.driver)
+
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "after_posts": self.posts_seen,
+            "posts_pruned": pruned,
+            "heap_before": heap_before,
+            "heap_after": heap_after
+        }
+        self.cleanups.append(record)
+        self.pending_ids = []
+
+        if heap_before and heap_after:
+            print(f"🧹 Pruned {pruned} posts from DOM - JS heap {heap_before / (1024 * 1024):.1f} MB "
+                  f"→ {heap_after / (1024 * 1024):.1f} MB")
+        else:
+            print(f"🧹 Pruned {pruned} posts from DOM")
+        return record
+
+    def summary(self):
+        return {
+            "cleanup_interval": self.interval,
+            "cleanups_run": len(self.cleanups),
+            "posts_pruned": sum(c["posts_pruned"] for c in self.cleanups),
+            "cleanups": self.cleanups
+        }
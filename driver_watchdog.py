@@ -0,0 +1,130 @@
+import time
+import threading
+from datetime import datetime
+from process_metrics import get_browser_processes, get_browser_usage
+import config
+
+# WebDriver error messages that mean the browser/renderer is gone, not that an element is missing
+DEAD_SESSION_MARKERS = [
+    "tab crashed",
+    "session deleted",
+    "invalid session id",
+    "disconnected",
+    "chrome not reachable",
+    "no such window",
+    "target window already closed",
+    "connection refused",
+    "max retries exceeded",
+    "read timed out"
+]
+
+
+class DriverWatchdog:
+    """
+    Detects dead or hung browser sessions (command latency, renderer crashes,
+    process RSS) and restarts Chrome with the saved login session
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.restarts = 0
+        self.events = []
+
+    def is_dead_session_error(self, error):
+        message = str(error).lower()
+        return any(marker in message for marker in DEAD_SESSION_MARKERS)
+
+    def probe_latency(self):
+        """
+        Time one trivial command. Returns (latency, error): latency is None if the
+        command failed or did not return within the timeout.
+        """
+        result = {}
+
+        def probe():
+            started = time.perf_counter()
+            try:
+                self.bot.driver.execute_script("return 1")
+                result["latency"] = time.perf_counter() - started
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=probe, daemon=True)
+        thread.start()
+        thread.join(config.WATCHDOG_COMMAND_TIMEOUT)
+        return result.get("latency"), result.get("error")
+
+    def check(self):
+        """
+        Returns the reason the session needs a restart, or None if it is healthy
+        """
+        if not self.bot.driver:
+            return "no_driver"
+
+        # Inspector.targetCrashed waits on the DevTools socket until something reads it
+        reader = self.bot.dom_reader
+        if reader and reader.cdp and reader.cdp.poll_events():
+            return "renderer_crashed"
+
+        latency, error = self.probe_latency()
+        if error is not None and "crashed" in str(error).lower():
+            return "renderer_crashed"
+        if latency is None:
+            return "unresponsive"
+        if latency > config.WATCHDOG_MAX_COMMAND_LATENCY:
+            return f"slow_commands ({latency:.1f}s)"
+
+        if config.WATCHDOG_MAX_RSS_MB:
+            rss_mb = get_browser_usage(self.bot.driver)["rss_bytes"] / (1024 * 1024)
+            if rss_mb > config.WATCHDOG_MAX_RSS_MB:
+                return f"rss_limit ({rss_mb:.0f} MB)"
+
+        return None
+
+    def kill_browser(self):
+        """
+        Tear down a possibly hung browser without waiting on it
+        """
+        processes = []
+        try:
+            processes = get_browser_processes(self.bot.driver)
+        except Exception:
+            pass
+
+        if self.bot.dom_reader:
+            self.bot.dom_reader.close()
+
+        quitter = threading.Thread(target=self.bot.driver.quit, daemon=True)
+        quitter.start()
+        quitter.join(config.WATCHDOG_COMMAND_TIMEOUT)
+
+        for process in processes:
+            try:
+                process.kill()
+            except Exception:
+                continue
+
+    def restart(self, reason):
+        """
+        Restart Chrome and restore the logged-in session (see SessionStore)
+        """
+        print(f"\n🐕 Watchdog: restarting browser ({reason})...")
+        if self.restarts >= config.WATCHDOG_MAX_RESTARTS:
+            raise Exception(f"Watchdog restart limit reached ({config.WATCHDOG_MAX_RESTARTS})")
+
+        if self.bot.driver:
+            self.kill_browser()
+
+        self.bot.driver = None
+        self.bot.dom_reader = None
+        self.bot.attached_to_existing = False
+        self.bot.lean_render_active = False
+        self.bot.lean_render_script_id = None
+
+        self.bot.initialize_driver()
+        self.restarts += 1
+        self.events.append({"timestamp": datetime.now().isoformat(), "reason": reason})
+        print(f"🐕 Watchdog: browser restarted ({self.restarts}/{config.WATCHDOG_MAX_RESTARTS})")
+
+    def summary(self):
+        return {"restarts": self.restarts, "events": self.events}
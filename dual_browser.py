@@ -0,0 +1,137 @@
+import time
+import queue
+import random
+import threading
+from datetime import datetime
+from browser_pool import BrowserPool
+from comment_action import LinkedInCommentAction
+import config
+
+
+class CommentWriter:
+    """
+    Headed writer browser that only posts comments. Jobs are queued by post URN
+    and posted on a background thread, so the MIN_WAIT_TIME / MAX_WAIT_TIME
+    cooldown between comments never blocks the reader browser.
+    Only comments the writer confirms count toward MAX_COMMENTS_PER_SESSION.
+    """
+
+    def __init__(self):
+        self.commenter = LinkedInCommentAction()
+        self.jobs = queue.Queue()
+        self.results = []
+        self.thread = None
+        self.last_post_time = None
+        self.lock = threading.Lock()
+        self.in_flight = 0  # Queued jobs without a result yet
+
+    def start(self):
+        """
+        Launch (or attach to) the headed browser and start the posting thread
+        """
+        print("✍️  Starting writer browser...")
+        self.commenter.initialize_driver()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def submit(self, urn, comment_text, **details):
+        """
+        Queue a comment for the writer. Returns False if the post has no URN to hand over.
+        """
+        if not urn:
+            print("⚠️ Post has no URN - cannot hand the comment to the writer browser")
+            return False
+        with self.lock:
+            self.in_flight += 1
+        self.jobs.put({"urn": urn, "comment_text": comment_text, "queued_at": datetime.now().isoformat(), **details})
+        return True
+
+    def confirmed_count(self):
+        """
+        Comments the writer has actually posted
+        """
+        with self.lock:
+            return sum(1 for result in self.results if result["comment_success"])
+
+    def committed_count(self):
+        """
+        Posted plus still queued: the reader stops queueing once this reaches the session limit
+        """
+        with self.lock:
+            return sum(1 for result in self.results if result["comment_success"]) + self.in_flight
+
+    def last_error(self):
+        comments = self.commenter.comment_results["comments"]
+        return comments[-1].get("error") if comments else None
+
+    def wait_for_cooldown(self):
+        if self.last_post_time is None:
+            return
+        wait_time = random.randint(config.MIN_WAIT_TIME, config.MAX_WAIT_TIME)
+        remaining = self.last_post_time + wait_time - time.time()
+        if remaining > 0:
+            print(f"⏱️ Writer waiting {remaining:.0f} seconds before next comment...")
+            time.sleep(remaining)
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            if self.confirmed_count() >= config.MAX_COMMENTS_PER_SESSION:
+                self.record(job, False, "Max comments reached")
+                continue
+
+            self.wait_for_cooldown()
+            error = None
+            try:
+                success = self.commenter.post_comment_by_urn(job["urn"], job["comment_text"])
+                if not success:
+                    error = self.last_error() or "Posting failed"
+            except Exception as e:
+                print(f"❌ Writer error on {job['urn']}: {e}")
+                success = False
+                error = str(e)
+
+            self.last_post_time = time.time()
+            self.record(job, success, error)
+
+    def record(self, job, success, error=None):
+        result = {**job, "comment_success": success, "posted_at": datetime.now().isoformat() if success else None}
+        if error:
+            result["comment_error"] = error
+        with self.lock:
+            self.results.append(result)
+            self.in_flight -= 1
+
+    def finish(self):
+        """
+        Wait until every queued comment has been posted and return the results
+        """
+        if self.thread and self.thread.is_alive():
+            pending = self.jobs.qsize()
+            if pending:
+                print(f"⏳ Waiting for the writer browser to post {pending} queued comments...")
+            self.jobs.put(None)
+            self.thread.join()
+        return self.results
+
+    def close(self):
+        self.finish()
+        self.commenter.save_results_to_json()
+        self.commenter.cleanup()
+
+
+def start_dual_browsers():
+    """
+    Start the headed writer, then a headless reader on a cloned profile with
+    the writer's saved session. Returns (reader_pool, writer).
+    """
+    writer = CommentWriter().start()
+
+    # The reader clones the writer's profile and restores its saved cookies
+    reader_pool = BrowserPool(size=1, headless=True).start()
+    print("📖 Headless reader browser ready")
+    return reader_pool, writer
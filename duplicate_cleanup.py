@@ -2,6 +2,7 @@ import json
 import os
 from datetime import datetime
 from collections import defaultdict
+from feed_pipeline import classification_summary
 
 class DuplicateAuthorCleanup:
     def __init__(self):
@@ -54,9 +55,78 @@ class DuplicateAuthorCleanup:
 
         return author_posts, duplicate_authors
 
-    def cleanup_duplicates(self, posts_data, strategy="keep_first_normal"):
+    def remove_urn_duplicates(self, posts_data):
         """
-        Remove duplicate posts from the same author
+        Drop phantom duplicates: the same post (same URN) recorded more than once
+        """
+        seen_urns = set()
+        unique_posts = []
+
+        for post in posts_data:
+            urn = post.get("urn")
+            if urn and urn in seen_urns:
+                self.cleanup_results["removed_posts"].append({
+                    "ember_id": post.get("ember_id"),
+                    "urn": urn,
+                    "author_name": post.get("author_name"),
+                    "is_sponsored": post.get("is_sponsored"),
+                    "reason": "duplicate_urn"
+                })
+                self.cleanup_results["duplicates_removed"] += 1
+                continue
+
+            if urn:
+                seen_urns.add(urn)
+            unique_posts.append(post)
+
+        return unique_posts
+
+    def stream_unique(self, posts):
+        """
+        Streaming dedupe for a generator of (normal) posts: the same URN or a later
+        post by an already-seen author is dropped, i.e. keep_first_normal applied
+        as posts arrive
+        """
+        self.cleanup_results["cleanup_strategy"] = "keep_first_normal"
+        seen_urns = set()
+        seen_authors = set()
+
+        for post in posts:
+            self.cleanup_results["original_post_count"] += 1
+            urn = post.get("urn")
+            author_name = post.get("author_name")
+
+            reason = None
+            if urn and urn in seen_urns:
+                reason = "duplicate_urn"
+            elif author_name and author_name in seen_authors:
+                reason = "duplicate_author_keep_first_normal"
+
+            if reason:
+                self.cleanup_results["removed_posts"].append({
+                    "ember_id": post.get("ember_id"),
+                    "urn": urn,
+                    "author_name": author_name,
+                    "is_sponsored": post.get("is_sponsored"),
+                    "reason": reason
+                })
+                self.cleanup_results["duplicates_removed"] += 1
+                print(f"🧹 Skipping duplicate post by {author_name} ({reason})")
+                continue
+
+            if urn:
+                seen_urns.add(urn)
+            if author_name:
+                seen_authors.add(author_name)
+                self.cleanup_results["authors_processed"] = len(seen_authors)
+            self.cleanup_results["final_post_count"] += 1
+            yield post
+
+    def cleanup_duplicates(self, posts_data, strategy="keep_first_normal", is_eligible=None):
+        """
+        Remove duplicate posts from the same author. With is_eligible (the Stage 2
+        content filters), the strategy chooses among an author's eligible posts first,
+        so a filtered-out post never displaces one that would be commented on.
 
         Strategies:
         - keep_first_normal: Keep first normal post, remove sponsored duplicates
@@ -67,6 +137,9 @@ class DuplicateAuthorCleanup:
         self.cleanup_results["cleanup_strategy"] = strategy
         self.cleanup_results["original_post_count"] = len(posts_data)
 
+        # The same post seen twice is not an author duplicate
+        posts_data = self.remove_urn_duplicates(posts_data)
+
         author_posts = defaultdict(list)
 
         # Group posts by author
@@ -85,7 +158,8 @@ class DuplicateAuthorCleanup:
                 cleaned_posts.append(posts[0])
             else:
                 # Multiple posts from same author - apply strategy
-                kept_post = self._apply_cleanup_strategy(posts, strategy)
+                eligible_posts = [p for p in posts if is_eligible(p)] if is_eligible else posts
+                kept_post = self._apply_cleanup_strategy(eligible_posts or posts, strategy)
                 if kept_post:
                     cleaned_posts.append(kept_post)
 
@@ -94,6 +168,7 @@ class DuplicateAuthorCleanup:
                         if post != kept_post:
                             self.cleanup_results["removed_posts"].append({
                                 "ember_id": post.get("ember_id"),
+                                "urn": post.get("urn"),
                                 "author_name": post.get("author_name"),
                                 "is_sponsored": post.get("is_sponsored"),
                                 "reason": f"duplicate_author_{strategy}"
@@ -145,7 +220,7 @@ class DuplicateAuthorCleanup:
             # Default: keep first occurrence
             return posts[0]
 
-    def clean_scan_file(self, input_filename, output_filename=None, strategy="keep_first_normal"):
+    def clean_scan_file(self, input_filename, output_filename=None, strategy="keep_first_normal", is_eligible=None):
         """
         Main function to clean up a scan file and save the cleaned version
         """
@@ -168,26 +243,25 @@ class DuplicateAuthorCleanup:
 
         # Clean up posts_data
         print(f"\n🧹 Applying cleanup strategy: {strategy}")
-        cleaned_posts_data = self.cleanup_duplicates(scan_data.get("posts_data", []), strategy)
+        cleaned_posts_data = self.cleanup_duplicates(scan_data.get("posts_data", []), strategy, is_eligible)
 
-        # Rebuild normal_posts and sponsored_posts arrays
-        normal_posts = [p for p in cleaned_posts_data if not p.get("is_sponsored", False)]
-        sponsored_posts = [p for p in cleaned_posts_data if p.get("is_sponsored", False)]
+        # Rebuild the per-type arrays (post_type from the classifier pipeline)
+        normal_posts = [p for p in cleaned_posts_data if p.get("post_type", "normal") == "normal"]
+        sponsored_posts = [p for p in cleaned_posts_data if p.get("post_type") == "sponsored"]
+        skipped_language_posts = [p for p in cleaned_posts_data if p.get("post_type") == "skipped_language"]
 
         # Update the scan data
         cleaned_scan_data = scan_data.copy()
         cleaned_scan_data["posts_data"] = cleaned_posts_data
         cleaned_scan_data["normal_posts"] = normal_posts
         cleaned_scan_data["sponsored_posts"] = sponsored_posts
+        cleaned_scan_data["skipped_language_posts"] = skipped_language_posts
 
-        # Update scan summary
+        # Update scan summary: scan-level stats carry over, post counts are recomputed
         cleaned_scan_data["scan_summary"] = {
-            "total_ember_elements": scan_data["scan_summary"].get("total_ember_elements", 0),
+            **scan_data.get("scan_summary", {}),
             "total_posts_processed": len(cleaned_posts_data),
-            "total_posts_with_authors": len(cleaned_posts_data),
-            "normal_posts_count": len(normal_posts),
-            "sponsored_posts_count": len(sponsored_posts),
-            "unique_authors_count": len(set([p["author_name"] for p in cleaned_posts_data if p["author_name"]]))
+            **classification_summary(cleaned_posts_data)
         }
 
         # Add cleanup metadata
@@ -259,7 +333,7 @@ class DuplicateAuthorCleanup:
 
         print(f"{'='*60}")
 
-    def quick_cleanup(self, filename="linkedin_comprehensive_scan.json", strategy="keep_first_normal"):
+    def quick_cleanup(self, filename="linkedin_comprehensive_scan.json", strategy="keep_first_normal", is_eligible=None):
         """
         Quick cleanup function for easy usage
         """
@@ -267,7 +341,7 @@ class DuplicateAuthorCleanup:
             print(f"❌ File not found: {filename}")
             return False
 
-        return self.clean_scan_file(filename, strategy=strategy)
+        return self.clean_scan_file(filename, strategy=strategy, is_eligible=is_eligible)
 
 
 def main():
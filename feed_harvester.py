@@ -0,0 +1,243 @@
+from post_index import PostIndex, POST_ROOT_JS
+from sponsor_detection import SPONSOR_JS
+from content_types import CONTENT_TYPE_JS
+from post_age import POST_AGE_JS
+from selector_registry import get_selector_registry
+from post_selectors import AUTHOR_SELECTORS
+import config
+
+# Shared in-page extraction: a post root (see POST_ROOT_JS) to a compact record
+EXTRACT_RECORD_JS = POST_ROOT_JS + SPONSOR_JS + CONTENT_TYPE_JS + POST_AGE_JS + """
+function extractRecord(el, selectors, excerptChars) {
+    let authorName = null, selectorUsed = null;
+    for (const selector of selectors) {
+        const node = el.querySelector(selector);
+        const text = node ? node.innerText.trim() : '';
+        if (text.length > 2) { authorName = text; selectorUsed = selector; break; }
+    }
+
+    const urns = postUrns(el);
+
+    const text = el.innerText || '';
+    const sponsor = sponsorSignal(el);
+    const content = contentType(el);
+    const age = postAge(el);
+
+    return {
+        ember_id: el.id,
+        urn: urns.urn,
+        reshared_urn: urns.reshared_urn,
+        author_name: authorName,
+        selector_used: selectorUsed,
+        is_sponsored: sponsor !== null,
+        sponsor_signal: sponsor,
+        content_type: content.content_type,
+        content_markers: content.markers,
+        age_label: age.label,
+        posted_at: age.seconds === null ? null : new Date(Date.now() - age.seconds * 1000).toISOString(),
+        excerpt: text.slice(0, excerptChars)
+    };
+}
+"""
+
+# One round-trip per scroll batch: every post root reduced to a record.
+# Nested containers collapse into their root; posts already harvested are skipped in-page.
+HARVEST_SCRIPT = EXTRACT_RECORD_JS + """
+const selectors = arguments[0];
+const excerptChars = arguments[1];
+const seen = new Set(arguments[2]);
+const embers = document.querySelectorAll("[id^='ember']");
+const posts = [];
+for (const el of embers) {
+    if (seen.has(el.id)) continue;
+    seen.add(el.id);
+    const root = resolvePostRoot(el);
+    if (!root || (root !== el && seen.has(root.id))) continue;
+    seen.add(root.id);
+    posts.push(extractRecord(root, selectors, excerptChars));
+}
+return {ember_count: embers.length, posts: posts};
+"""
+
+# Record post roots into a page-side buffer as LinkedIn inserts them, so posts that
+# are later virtualized away or re-rendered are captured exactly once.
+# A post is often inserted before its actor and commentary render: such records wait in
+# `pending` and are re-extracted when content arrives inside them, or at the next drain.
+INSTALL_CAPTURE_SCRIPT = EXTRACT_RECORD_JS + """
+// An observer left in a kept-alive tab by an earlier run would hide posts already in the
+// DOM behind its seenKeys: replace it with a fresh buffer
+const replaced = Boolean(window.__feedCapture);
+if (replaced) window.__feedCapture.observer.disconnect();
+const selectors = arguments[0];
+const excerptChars = arguments[1];
+const capture = {buffer: [], pending: new Map(), seenIds: new Set(), seenKeys: new Set(), embers: new Set()};
+
+function isComplete(el, record) {
+    return record.author_name !== null && COMMENTARY_SELECTORS.some(selector => el.querySelector(selector));
+}
+
+// Post root enclosing a node rendered into an existing post (nearest Ember ancestor
+// resolving to a root that contains the node; feed wrappers resolve to another post)
+function enclosingPostRoot(node) {
+    for (let el = node.parentElement; el; el = el.parentElement) {
+        if (!isEmber(el)) continue;
+        const root = resolvePostRoot(el);
+        if (root && root.contains(node)) return root;
+    }
+    return null;
+}
+
+function extractPending(id, force) {
+    const entry = capture.pending.get(id);
+    if (entry.el.isConnected) entry.record = extractRecord(entry.el, selectors, excerptChars);
+    if (force || !entry.el.isConnected || isComplete(entry.el, entry.record)) {
+        capture.pending.delete(id);
+        capture.buffer.push(entry.record);
+    }
+}
+
+function collect(root) {
+    if (!(root instanceof Element)) return;
+    const candidates = isEmber(root) ? [root] : [];
+    candidates.push(...root.querySelectorAll("[id^='ember']"));
+    for (const candidate of candidates) capture.embers.add(candidate.id);
+
+    // Content rendered into an existing post completes that post's record
+    const enclosing = enclosingPostRoot(root);
+    if (enclosing) candidates.push(enclosing);
+
+    for (const candidate of candidates) {
+        const el = capture.seenIds.has(candidate.id) ? candidate : resolvePostRoot(candidate);
+        if (!el) continue;
+        if (capture.seenIds.has(el.id)) {
+            if (capture.pending.has(el.id)) extractPending(el.id, false);
+            continue;
+        }
+        capture.seenIds.add(el.id);
+
+        // A re-rendered post gets a new ember id but keeps its URN
+        const record = extractRecord(el, selectors, excerptChars);
+        const key = record.urn || record.ember_id;
+        if (capture.seenKeys.has(key)) continue;
+        capture.seenKeys.add(key);
+        if (isComplete(el, record)) {
+            capture.buffer.push(record);
+        } else {
+            capture.pending.set(el.id, {el: el, record: record, drains: 0});
+        }
+    }
+}
+
+// Called by DRAIN_CAPTURE_SCRIPT: re-extract pending posts; one still incomplete after
+// a full scroll step (no commentary, e.g. a job or image-only post) is released as is,
+// and a final drain releases everything
+capture.drain = function(final) {
+    for (const [id, entry] of Array.from(capture.pending)) {
+        extractPending(id, final || entry.drains >= 1);
+        entry.drains += 1;
+    }
+    return {ember_count: capture.embers.size, posts: capture.buffer.splice(0, capture.buffer.length)};
+};
+
+collect(document.body);
+capture.observer = new MutationObserver(mutations => {
+    for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) collect(node);
+    }
+});
+capture.observer.observe(document.body, {childList: true, subtree: true});
+window.__feedCapture = capture;
+return replaced;
+"""
+
+# Hand the buffered records to Python and empty the buffer (null if the page was reloaded)
+DRAIN_CAPTURE_SCRIPT = """
+const capture = window.__feedCapture;
+return capture ? capture.drain(arguments[0]) : null;
+"""
+
+STOP_CAPTURE_SCRIPT = """
+const capture = window.__feedCapture;
+if (capture) { capture.observer.disconnect(); delete window.__feedCapture; }
+"""
+
+
+class FeedHarvester:
+    """
+    Collects post records from the feed, either from an injected MutationObserver
+    buffer (drained between scroll steps) or with one full harvest per scroll batch
+    """
+
+    def __init__(self, reader, author_selectors=None, excerpt_chars=None):
+        self.reader = reader
+        self.author_selectors = author_selectors or AUTHOR_SELECTORS
+        self.excerpt_chars = excerpt_chars or config.HARVEST_EXCERPT_CHARS
+        self.index = PostIndex()
+        self.ember_count = 0
+        self.round_trips = 0
+        self.capturing = False
+        self.capture_selectors = self.author_selectors
+
+    def add_records(self, records):
+        return [record for record in records if self.index.add(record)]
+
+    def harvest(self):
+        """
+        Harvest posts rendered since the last call. Returns the new records.
+        """
+        selectors = get_selector_registry().order("author_name", self.author_selectors)
+        result = self.reader.run(HARVEST_SCRIPT, selectors, self.excerpt_chars, self.index.ember_ids())
+        self.round_trips += 1
+        self.ember_count = result["ember_count"]
+        self.record_author_selectors(result["posts"], selectors)
+
+        new_records = self.add_records(result["posts"])
+        print(f"🌾 Harvested {len(new_records)} new posts ({len(self.index)} total)")
+        return new_records
+
+    def record_author_selectors(self, records, selectors):
+        registry = get_selector_registry()
+        for record in records:
+            registry.record_cascade("author_name", selectors, record["selector_used"])
+
+    def start_capture(self):
+        """
+        Inject the MutationObserver; everything already rendered is buffered immediately
+        """
+        self.capture_selectors = get_selector_registry().order("author_name", self.author_selectors)
+        replaced = self.reader.run(INSTALL_CAPTURE_SCRIPT, self.capture_selectors, self.excerpt_chars)
+        self.round_trips += 1
+        self.capturing = True
+        if replaced:
+            print("♻️ Replaced a feed capture observer left in the tab by an earlier run")
+        print("👀 Incremental feed capture started")
+
+    def drain(self, final=False):
+        """
+        Pull the posts buffered since the last drain. Returns the new records.
+        final releases posts still waiting for their content (end of the scroll).
+        """
+        if not self.capturing:
+            return self.harvest()
+
+        result = self.reader.run(DRAIN_CAPTURE_SCRIPT, final)
+        self.round_trips += 1
+        if result is None:
+            # Page was reloaded: re-inject (the new observer buffers what is already rendered)
+            print("⚠️ Feed capture lost (page reloaded) - reinstalling observer")
+            self.start_capture()
+            return self.drain(final)
+
+        self.ember_count = result["ember_count"]
+        self.record_author_selectors(result["posts"], self.capture_selectors)
+        new_records = self.add_records(result["posts"])
+        print(f"🌾 Captured {len(new_records)} new posts ({len(self.index)} total)")
+        return new_records
+
+    def stop_capture(self):
+        if self.capturing:
+            self.reader.run(STOP_CAPTURE_SCRIPT)
+            self.capturing = False
+
+    def posts(self):
+        return self.index.records()
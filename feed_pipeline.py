@@ -0,0 +1,232 @@
+import itertools
+from datetime import datetime
+from collections import Counter
+from feed_harvester import FeedHarvester
+from scroll_engine import ScrollEngine
+from language_id import analyze_languages, is_skipped_language
+from content_types import is_extracted_content_type
+from post_age import age_days, is_stale
+import config
+
+
+def annotate_languages(snapshots):
+    """
+    Identify the language of a whole batch of snapshots in one vectorized call
+    """
+    results = analyze_languages([snapshot["excerpt"] for snapshot in snapshots])
+    for snapshot, result in zip(snapshots, results):
+        snapshot["language"] = result["language"]
+        snapshot["language_shares"] = result["shares"]
+    return snapshots
+
+
+# ========== CLASSIFIERS ==========
+# A classifier takes the post snapshot (the harvested record) and the post data built
+# so far by earlier classifiers, and returns the fields it adds to the post data.
+
+def classify_author(snapshot, post):
+    return {"author_name": snapshot["author_name"], "selector_used": snapshot["selector_used"]}
+
+
+def classify_reshare(snapshot, post):
+    return {"reshared_urn": snapshot["reshared_urn"], "is_reshare": bool(snapshot["reshared_urn"])}
+
+
+def classify_sponsored(snapshot, post):
+    # Decided in-page from the actor label / ad attributes (see sponsor_detection)
+    return {"is_sponsored": snapshot["is_sponsored"], "sponsor_signal": snapshot["sponsor_signal"]}
+
+
+def classify_language(snapshot, post):
+    # Usually identified per scroll batch already (annotate_languages)
+    if "language" not in snapshot:
+        annotate_languages([snapshot])
+    language, shares = snapshot["language"], snapshot.get("language_shares", {})
+    return {
+        "language": language,
+        "language_shares": shares,
+        "is_vietnamese": language == "vi" or shares.get("vi", 0) >= config.LANGUAGE_MIXED_MIN_SHARE,
+        "is_skipped_language": is_skipped_language(language, shares)
+    }
+
+
+def classify_content_type(snapshot, post):
+    # Tagged in-page from the post's component markers (see content_types)
+    content_type = snapshot.get("content_type", "text")
+    return {
+        "content_type": content_type,
+        "content_markers": snapshot.get("content_markers", []),
+        "is_skipped_content_type": not is_extracted_content_type(content_type)
+    }
+
+
+def classify_age(snapshot, post):
+    # posted_at is set in-page from the relative timestamp; archived snapshots carry captured_at
+    captured_at = snapshot.get("captured_at")
+    now = datetime.fromisoformat(captured_at) if captured_at else None
+    return {
+        "posted_at": snapshot.get("posted_at"),
+        "age_label": snapshot.get("age_label"),
+        "age_days": age_days(snapshot.get("posted_at"), now),
+        "is_stale": is_stale(snapshot.get("posted_at"), now)
+    }
+
+
+def classify_post_type(snapshot, post):
+    # Priority: sponsored > skipped language > normal
+    if post.get("is_sponsored"):
+        return {"post_type": "sponsored"}
+    if post.get("is_skipped_language"):
+        return {"post_type": "skipped_language"}
+    return {"post_type": "normal"}
+
+
+def classification_summary(posts):
+    """
+    Per-type counts of classified posts, shared by the Stage 1 summary and duplicate cleanup
+    """
+    normal_posts = [p for p in posts if p.get("post_type", "normal") == "normal"]
+    return {
+        "total_posts_with_authors": len(posts),
+        "normal_posts_count": len(normal_posts),
+        "sponsored_posts_count": sum(1 for p in posts if p.get("post_type") == "sponsored"),
+        "skipped_language_posts_count": sum(1 for p in posts if p.get("post_type") == "skipped_language"),
+        "languages": dict(Counter(p.get("language", "unknown") for p in posts)),
+        "content_types": dict(Counter(p.get("content_type", "text") for p in posts)),
+        "skipped_content_types": dict(Counter(
+            p["content_type"] for p in normal_posts if p.get("is_skipped_content_type")
+        )),
+        "stale_posts_count": sum(1 for p in posts if p.get("is_stale")),
+        "posts_without_age": sum(1 for p in posts if not p.get("posted_at")),
+        "unique_authors_count": len(set(p["author_name"] for p in posts if p.get("author_name")))
+    }
+
+
+DEFAULT_CLASSIFIERS = [
+    ("author", classify_author),
+    ("reshare", classify_reshare),
+    ("sponsored", classify_sponsored),
+    ("language", classify_language),
+    ("content_type", classify_content_type),
+    ("age", classify_age),
+    ("post_type", classify_post_type)
+]
+
+# Fields a classifier sets when it fails: unknown values, with the filters failing closed
+# so a post that could not be checked is never commented on
+CLASSIFIER_DEFAULTS = {
+    "author": {"author_name": None, "selector_used": None},
+    "reshare": {"reshared_urn": None, "is_reshare": False},
+    "sponsored": {"is_sponsored": True, "sponsor_signal": "classifier_error"},
+    "language": {"language": "unknown", "language_shares": {}, "is_vietnamese": False, "is_skipped_language": True},
+    "content_type": {"content_type": "unknown", "content_markers": [], "is_skipped_content_type": True},
+    "age": {"posted_at": None, "age_label": None, "age_days": None, "is_stale": False},
+    "post_type": {"post_type": "unclassified"}
+}
+
+
+class FeedPipeline:
+    """
+    Single pass over the feed: scrolling + harvesting builds one snapshot per post,
+    then every registered classifier runs once over each snapshot. New signals are
+    added with register() instead of another walk over the ember elements.
+    """
+
+    def __init__(self, bot, author_selectors=None, classifiers=None):
+        self.bot = bot
+        self.author_selectors = author_selectors
+        self.classifiers = list(DEFAULT_CLASSIFIERS if classifiers is None else classifiers)
+        self.classifier_defaults = dict(CLASSIFIER_DEFAULTS)
+        self.harvester = None
+        self.scroll_stats = None
+        self.stale_run = 0  # Consecutive harvested posts past MAX_POST_AGE_DAYS
+
+    def register(self, name, classifier, before=None, defaults=None):
+        """
+        Add a classifier (optionally ahead of an existing one, e.g. before "post_type")
+        defaults are the fields the post gets if the classifier raises
+        """
+        names = [existing for existing, _ in self.classifiers]
+        position = names.index(before) if before in names else len(self.classifiers)
+        self.classifiers.insert(position, (name, classifier))
+        if defaults is not None:
+            self.classifier_defaults[name] = defaults
+        return self
+
+    def track_age(self, record):
+        if is_stale(record.get("posted_at")):
+            self.stale_run += 1
+        elif record.get("posted_at"):
+            self.stale_run = 0  # Posts without a timestamp (ads) neither extend nor break the run
+
+    def age_cutoff_reached(self):
+        """
+        Scroll stop condition: a run of STALE_POSTS_STOP_AFTER posts all older than MAX_POST_AGE_DAYS
+        """
+        if config.STALE_POSTS_STOP_AFTER and self.stale_run >= config.STALE_POSTS_STOP_AFTER:
+            return "age_cutoff"
+        return None
+
+    def snapshots(self, max_posts=None):
+        """
+        Scroll the feed and yield one snapshot record per post (see FeedHarvester)
+        as soon as its scroll batch is harvested
+        """
+        reader = self.bot.get_dom_reader()
+        self.harvester = FeedHarvester(reader, self.author_selectors)
+        count_posts = lambda: len(self.harvester.index)
+        limit = config.MAX_POSTS_TO_SCAN if max_posts is None else max_posts
+
+        # Capture posts as they are inserted (drained between scrolls), or harvest per scroll batch
+        if config.INCREMENTAL_FEED_CAPTURE:
+            self.harvester.start_capture()
+            on_batch = self.harvester.drain
+        else:
+            on_batch = self.harvester.harvest
+
+        engine = ScrollEngine(reader, on_batch=on_batch, count_posts=count_posts, max_posts=max_posts,
+                              stop_when=self.age_cutoff_reached)
+        batches = engine.batches()
+        yielded = 0
+        self.stale_run = 0
+        try:
+            for records in itertools.chain(batches, self.final_batch()):
+                for record in annotate_languages(records):
+                    if limit > 0 and yielded >= limit:
+                        return
+                    yielded += 1
+                    self.track_age(record)
+                    yield record
+        finally:
+            batches.close()
+            self.scroll_stats = engine.stats
+            self.harvester.stop_capture()
+
+    def final_batch(self):
+        """
+        Posts the capture observer still holds back waiting for their content, once scrolling ends
+        """
+        if self.harvester.capturing:
+            yield self.harvester.drain(final=True)
+
+    def classify(self, snapshot):
+        """
+        Run every classifier once over a post snapshot. A failing classifier is
+        recorded in classifier_errors, its fields get CLASSIFIER_DEFAULTS and the
+        others still run.
+        """
+        post = {"ember_id": snapshot["ember_id"], "urn": snapshot["urn"]}
+        for name, classifier in self.classifiers:
+            try:
+                post.update(classifier(snapshot, post))
+            except Exception as e:
+                post.update(self.classifier_defaults.get(name, {}))
+                post.setdefault("classifier_errors", {})[name] = str(e)
+        return post
+
+    def stream(self, max_posts=None):
+        for snapshot in self.snapshots(max_posts):
+            yield self.classify(snapshot)
+
+    def run(self, max_posts=None):
+        return list(self.stream(max_posts))
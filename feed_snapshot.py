@@ -0,0 +1,119 @@
+import os
+import sys
+import glob
+from datetime import datetime, timezone
+import zstandard
+import config
+
+SNAPSHOT_SUFFIX = ".html.zst"
+SNAPSHOT_NAME_FORMAT = "feed_%Y%m%d_%H%M%S_%f"  # Local capture time
+
+
+def get_dictionary_path(dict_id, directory=None):
+    return os.path.join(directory or config.FEED_SNAPSHOT_DIR, f"feed_{dict_id}.zdict")
+
+
+def load_dictionary(dict_id, directory=None):
+    with open(get_dictionary_path(dict_id, directory), 'rb') as f:
+        return zstandard.ZstdCompressionDict(f.read())
+
+
+def latest_dictionary(directory=None):
+    """
+    Most recently trained dictionary, or None (snapshots are then compressed without one)
+    """
+    paths = glob.glob(os.path.join(directory or config.FEED_SNAPSHOT_DIR, "feed_*.zdict"))
+    if not paths:
+        return None
+    with open(max(paths, key=os.path.getmtime), 'rb') as f:
+        return zstandard.ZstdCompressionDict(f.read())
+
+
+def list_snapshots(directory=None):
+    return sorted(glob.glob(os.path.join(directory or config.FEED_SNAPSHOT_DIR, f"*{SNAPSHOT_SUFFIX}")))
+
+
+def save_snapshot(html, directory=None):
+    """
+    Write a zstd-compressed page_source snapshot (with the trained dictionary if one exists)
+    """
+    directory = directory or config.FEED_SNAPSHOT_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    dictionary = latest_dictionary(directory)
+    compressor = zstandard.ZstdCompressor(level=config.SNAPSHOT_COMPRESSION_LEVEL, dict_data=dictionary)
+    data = html.encode('utf-8')
+    compressed = compressor.compress(data)
+
+    path = os.path.join(directory, datetime.now().strftime(SNAPSHOT_NAME_FORMAT) + SNAPSHOT_SUFFIX)
+    with open(path, 'wb') as f:
+        f.write(compressed)
+
+    print(f"🗜️ Feed snapshot saved to {path} ({len(data) / 1024:.0f} KB → {len(compressed) / 1024:.0f} KB)")
+    return path
+
+
+def snapshot_captured_at(path):
+    """
+    UTC capture time from the snapshot's file name (copying or syncing an archive
+    resets mtimes); the file's mtime only for snapshots that were renamed
+    """
+    name = os.path.basename(path)[:-len(SNAPSHOT_SUFFIX)]
+    try:
+        return datetime.strptime(name, SNAPSHOT_NAME_FORMAT).astimezone(timezone.utc)
+    except ValueError:
+        return datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+
+
+def load_snapshot(path):
+    """
+    Decompress a snapshot; the dictionary it was written with is found by the frame's dict id
+    """
+    with open(path, 'rb') as f:
+        compressed = f.read()
+
+    dict_id = zstandard.get_frame_parameters(compressed).dict_id
+    dictionary = load_dictionary(dict_id, os.path.dirname(path)) if dict_id else None
+    decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+    return decompressor.decompress(compressed).decode('utf-8')
+
+
+def train_dictionary(directory=None, size=None):
+    """
+    Train a zstd dictionary on the existing snapshots (feeds are highly repetitive,
+    so later snapshots compress far better). Existing snapshots stay readable:
+    each dictionary is stored under its own id.
+    """
+    directory = directory or config.FEED_SNAPSHOT_DIR
+    snapshots = list_snapshots(directory)
+    if len(snapshots) < config.SNAPSHOT_DICT_MIN_SAMPLES:
+        print(f"❌ Need at least {config.SNAPSHOT_DICT_MIN_SAMPLES} snapshots to train a dictionary "
+              f"(found {len(snapshots)})")
+        return None
+
+    # Chunk every page so the trainer sees many samples of the repeated markup
+    samples = []
+    for path in snapshots:
+        data = load_snapshot(path).encode('utf-8')
+        samples.extend(data[i:i + 64 * 1024] for i in range(0, len(data), 64 * 1024))
+
+    dictionary = zstandard.train_dictionary(size or config.SNAPSHOT_DICT_SIZE, samples)
+    path = get_dictionary_path(dictionary.dict_id(), directory)
+    with open(path, 'wb') as f:
+        f.write(dictionary.as_bytes())
+
+    print(f"📚 Trained dictionary {dictionary.dict_id()} on {len(snapshots)} snapshots → {path}")
+    return path
+
+
+def main():
+    """
+    python feed_snapshot.py train [snapshot_dir]
+    """
+    if len(sys.argv) >= 2 and sys.argv[1] == "train":
+        train_dictionary(sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        print("Usage: python feed_snapshot.py train [snapshot_dir]")
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,13 @@ import json
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
+from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from chrome_initialize import LinkedInCommentBot
+from feed_pipeline import FeedPipeline
+from post_index import PostIndex
+from post_selectors import POST_CONTENT_SELECTORS, READ_MORE_SELECTORS
 
 class LinkedInContentExtractor(LinkedInCommentBot):
     def __init__(self):
@@ -22,37 +25,25 @@ class LinkedInContentExtractor(LinkedInCommentBot):
 
     def find_read_more_button(self, post_element):
         """
-        Find the 'Read More' button using multiple selector strategies
+        Find the 'Read More' button using multiple selector strategies (adaptive "read_more" cascade)
         Returns the button element if found, None otherwise
         """
-        # Multiple selector strategies for Read More buttons
-        read_more_selectors = [
-            # Primary selector from HTML tag analysis
-            "div.fie-impression-container div[class*='biSBAHR'] > div > button",
-            # Alternative selectors for different LinkedIn layouts
-            "button[aria-label*='more' i]",
-            "button span[class*='see-more']",
-            ".feed-shared-update-v2__description button",
-            "button[data-control-name*='see_more']",
-            # Generic fallback
-            "button:contains('more')"
-        ]
-
-        for selector in read_more_selectors:
-            try:
-                # Special handling for :contains() selector (not supported in CSS)
-                if ':contains(' in selector:
-                    buttons = post_element.find_elements(By.TAG_NAME, "button")
-                    for button in buttons:
-                        if 'more' in button.text.lower():
-                            return button
-                else:
-                    button = post_element.find_element(By.CSS_SELECTOR, selector)
-                    if button.is_displayed():
-                        print(f"✅ Found Read More button with selector: {selector}")
-                        return button
-            except (NoSuchElementException, TimeoutException):
-                continue
+        def probe(selector):
+            button = post_element.find_element(By.CSS_SELECTOR, selector)
+            return button if button.is_displayed() else None
+
+        selector, button = self.selectors.first_match("read_more", READ_MORE_SELECTORS, probe)
+        if button:
+            print(f"✅ Found Read More button with selector: {selector}")
+            return button
+
+        # Generic fallback: any button whose text mentions "more"
+        try:
+            for button in post_element.find_elements(By.TAG_NAME, "button"):
+                if 'more' in button.text.lower():
+                    return button
+        except Exception:
+            pass
 
         return None
 
@@ -117,37 +108,21 @@ class LinkedInContentExtractor(LinkedInCommentBot):
                     post_data["errors"].append(f"Read More click error: {str(e)}")
                     print(f"❌ Error clicking Read More: {e}")
 
-            # Step 2: Extract content using multiple strategies
-            content_selectors = [
-                # Primary selector from HTML tag analysis
-                ".fie-impression-container div[class*='biSBAHR'] > div > div",
-                # Alternative content selectors
-                ".fie-impression-container .break-words",
-                ".feed-shared-update-v2__description",
-                ".feed-shared-update-v2__description-wrapper",
-                "[data-test-id='main-feed-activity-card'] .break-words",
-                ".update-components-text"
-            ]
-
-            content_found = False
-            for selector in content_selectors:
-                try:
-                    content_elements = post_element.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in content_elements:
-                        content_text = elem.text.strip()
-                        if content_text and len(content_text) > 20:  # Only consider substantial content
-                            post_data["content"] = content_text
-                            post_data["content_length"] = len(content_text)
-                            post_data["selectors_used"].append(selector)
-                            content_found = True
-                            print(f"✅ Extracted content ({len(content_text)} chars) using: {selector}")
-                            break
-
-                    if content_found:
-                        break
-
-                except (NoSuchElementException, TimeoutException):
-                    continue
+            # Step 2: Extract content using multiple strategies (adaptive "post_content" cascade)
+            def probe(selector):
+                for elem in post_element.find_elements(By.CSS_SELECTOR, selector):
+                    content_text = elem.text.strip()
+                    if content_text and len(content_text) > 20:  # Only consider substantial content
+                        return content_text
+                return None
+
+            selector, content_text = self.selectors.first_match("post_content", POST_CONTENT_SELECTORS, probe)
+            content_found = content_text is not None
+            if content_found:
+                post_data["content"] = content_text
+                post_data["content_length"] = len(content_text)
+                post_data["selectors_used"].append(selector)
+                print(f"✅ Extracted content ({len(content_text)} chars) using: {selector}")
 
             if not content_found:
                 post_data["errors"].append("No content found with any selector")
@@ -165,45 +140,28 @@ class LinkedInContentExtractor(LinkedInCommentBot):
         """
         print("🚀 Starting LinkedIn content extraction...")
 
+        # Read-only stage: use the lean render profile if enabled
+        self.enable_lean_render()
+
         # Wait for page to settle
         time.sleep(3)
 
-        # Find all LinkedIn posts using Ember element strategy
-        ember_selectors = [
-            "[id^='ember']",
-            "[data-id^='urn:li:activity:']",
-            ".feed-shared-update-v2"
-        ]
-
-        all_posts = []
-        for selector in ember_selectors:
-            try:
-                posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if posts:
-                    all_posts.extend(posts)
-                    print(f"📍 Found {len(posts)} elements with selector: {selector}")
-            except Exception as e:
-                print(f"❌ Error with selector {selector}: {e}")
-
-        # Remove duplicates by element ID
-        unique_posts = []
-        seen_ids = set()
-        for post in all_posts:
-            post_id = post.get_attribute("id")
-            if post_id and post_id not in seen_ids:
-                unique_posts.append(post)
-                seen_ids.add(post_id)
+        # Posts come from the shared feed pass (one root per URN, no duplicate containers)
+        pipeline = FeedPipeline(self)
+        posts = pipeline.run()
+        index = pipeline.harvester.index
 
-        print(f"📊 Found {len(unique_posts)} unique posts to process")
-        self.extraction_results["total_posts"] = len(unique_posts)
+        print(f"📊 Found {len(posts)} unique posts to process")
+        self.extraction_results["total_posts"] = len(posts)
 
         # Process each post
-        for i, post in enumerate(unique_posts, 1):
-            print(f"\n--- Processing post {i}/{len(unique_posts)} ---")
+        for i, post in enumerate(posts, 1):
+            print(f"\n--- Processing post {i}/{len(posts)} ---")
 
             try:
-                # Extract content from this post
-                post_data = self.extract_post_content(post)
+                # Extract content from this post (a URN-located handle, see PostHandle)
+                post_data = self.extract_post_content(index.handle(self.driver, PostIndex.key_for(post)))
+                post_data["author_name"] = post["author_name"]
                 self.extraction_results["posts"].append(post_data)
 
                 # Update statistics
@@ -0,0 +1,78 @@
+import json
+import time
+from datetime import datetime
+from process_metrics import get_browser_usage
+from chrome_initialize import LinkedInCommentBot
+from feed_pipeline import FeedPipeline
+import config
+
+
+def run_fixed_scan(headless):
+    """
+    Launch a fresh browser in the given mode and run the same Stage 1 feed pass
+    """
+    config.HEADLESS_MODE = headless
+    config.ATTACH_TO_EXISTING_CHROME = False  # Each mode needs its own fresh browser
+    mode = "headless" if headless else "headed"
+    print(f"\n🧪 Running fixed scan ({mode})...")
+
+    bot = LinkedInCommentBot()
+    try:
+        bot.initialize_driver()
+        bot.enable_lean_render()
+        usage_before = get_browser_usage(bot.driver)
+        started = time.perf_counter()
+
+        posts = FeedPipeline(bot).run()
+
+        elapsed = time.perf_counter() - started
+        usage_after = get_browser_usage(bot.driver)
+
+        return {
+            "mode": mode,
+            "scan_seconds": round(elapsed, 2),
+            "posts_scanned": len(posts),
+            "browser_cpu_seconds": round(usage_after["cpu_seconds"] - usage_before["cpu_seconds"], 2),
+            "browser_rss_mb": round(usage_after["rss_bytes"] / (1024 * 1024), 1),
+            "browser_processes": usage_after["process_count"]
+        }
+    finally:
+        bot.cleanup()
+
+
+def print_comparison(results):
+    print("\n" + "="*60)
+    print("📊 HEADED vs HEADLESS (fixed scan)")
+    print("="*60)
+    print(f"{'':<22}{'headed':>15}{'headless':>15}")
+    for key in ["scan_seconds", "posts_scanned", "browser_cpu_seconds", "browser_rss_mb", "browser_processes"]:
+        print(f"{key:<22}{results['headed'][key]:>15}{results['headless'][key]:>15}")
+    print("="*60)
+
+
+def main():
+    """
+    Compare browser CPU time and memory for the same scan headed vs headless
+    """
+    results = {}
+    try:
+        for headless in [False, True]:
+            result = run_fixed_scan(headless)
+            results[result["mode"]] = result
+
+        print_comparison(results)
+
+        with open("headless_benchmark.json", 'w', encoding='utf-8') as f:
+            json.dump({"benchmark_timestamp": datetime.now().isoformat(), "results": results}, f, indent=2)
+        print("💾 Results saved to headless_benchmark.json")
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Script interrupted by user.")
+
+    except Exception as e:
+        print(f"\n❌ An error occurred: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
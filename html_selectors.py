@@ -0,0 +1,137 @@
+import re
+from selectolax.lexbor import LexborHTMLParser
+
+# Python-side counterparts of the in-page helpers (post_index.POST_ROOT_JS), for
+# post HTML that was fetched once and is evaluated without further browser calls
+URN_PATTERN = re.compile(r"^urn:li:(activity|ugcPost|share|aggregate):")
+ACTOR_TITLE_SELECTOR = ".update-components-actor__title"
+
+# node_text approximates innerText: block elements and <br> break lines, inline whitespace
+# collapses, and non-rendered subtrees (script/style/template, the hidden attribute)
+# contribute nothing; aria-hidden content is rendered, so it is kept like in .text
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul"
+}
+NON_RENDERED_TAGS = {"head", "script", "style", "template", "noscript", "-comment"}
+WHITESPACE = re.compile(r"\s+")
+
+
+def parse_html(html):
+    return LexborHTMLParser(html)
+
+
+def parse_fragment(html):
+    """
+    The element an outerHTML string describes (not the <body> the parser wraps it in),
+    so selectors are evaluated against the same root as find_elements on the live element
+    """
+    body = parse_html(html).body
+    node = body.child if body is not None else None
+    while node is not None and node.tag.startswith(("-", "_")):
+        node = node.next
+    return node if node is not None else body
+
+
+def node_urn(node):
+    for attribute in ("data-urn", "data-id"):
+        value = node.attributes.get(attribute)
+        if value and URN_PATTERN.match(value):
+            return value
+    return None
+
+
+def outermost_urn(node):
+    """
+    URN of the outermost activity/share node enclosing node (the post, not a reshared original)
+    """
+    urn = None
+    while node is not None and node.tag != "html":
+        urn = node_urn(node) or urn
+        node = node.parent
+    return urn
+
+
+def top_level_urns(node):
+    urns = set()
+    for inner in node.css("[data-urn], [data-id]"):
+        urn = node_urn(inner)
+        if urn and outermost_urn(inner) == urn:
+            urns.add(urn)
+    return urns
+
+
+def post_urns(root):
+    """
+    (urn, reshared_urn) of a post root: a different URN nested inside the post is the reshared original
+    """
+    title = root.css_first(ACTOR_TITLE_SELECTOR)
+    urn = outermost_urn(title) if title is not None else None
+    if urn is None:
+        urn = next((node_urn(inner) for inner in root.css("[data-urn], [data-id]") if node_urn(inner)), None)
+    if urn is None:
+        return None, None
+
+    for inner in root.css("[data-urn], [data-id]"):
+        inner_urn = node_urn(inner)
+        if inner_urn and inner_urn != urn:
+            return urn, inner_urn
+    return urn, None
+
+
+def is_hidden_node(node):
+    return node.tag in NON_RENDERED_TAGS or "hidden" in node.attributes
+
+
+def collect_text(node, parts):
+    child = node.child
+    while child is not None:
+        if child.tag == "-text":
+            parts.append(WHITESPACE.sub(" ", child.text(deep=False)))
+        elif child.tag == "br":
+            parts.append("\n")
+        elif not is_hidden_node(child):
+            block = child.tag in BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            collect_text(child, parts)
+            if block:
+                parts.append("\n")
+        child = child.next
+
+
+def node_text(node, limit=None):
+    """
+    Rendered text of node, close to the live element's innerText
+    """
+    if is_hidden_node(node):
+        return ""
+    parts = []
+    collect_text(node, parts)
+    lines = (WHITESPACE.sub(" ", line).strip() for line in "".join(parts).split("\n"))
+    text = "\n".join(line for line in lines if line)
+    return text[:limit] if limit else text
+
+
+def selector_text(root, selector, min_length):
+    """
+    Text of the first node matching selector with more than min_length characters
+    (the local equivalent of find_elements + .text)
+    """
+    for node in root.css(selector):
+        text = node_text(node)
+        if len(text) > min_length:
+            return text
+    return None
+
+
+def first_match(root, selectors, min_length):
+    """
+    First selector (in declared order) with substantial text. Returns (selector, text).
+    """
+    for selector in selectors:
+        text = selector_text(root, selector, min_length)
+        if text:
+            return selector, text
+    return None, None
@@ -0,0 +1,121 @@
+import json
+import time
+from datetime import datetime
+from language_id import LanguageIdentifier
+import config
+
+# The previous Vietnamese-only heuristic, kept here as the benchmark baseline
+LEGACY_VIETNAMESE_CHARS = [
+    'à', 'á', 'ả', 'ã', 'ạ', 'ă', 'ằ', 'ắ', 'ẳ', 'ẵ', 'ặ',
+    'â', 'ầ', 'ấ', 'ẩ', 'ẫ', 'ậ', 'è', 'é', 'ẻ', 'ẽ', 'ẹ',
+    'ê', 'ề', 'ế', 'ể', 'ễ', 'ệ', 'ì', 'í', 'ỉ', 'ĩ', 'ị',
+    'ò', 'ó', 'ỏ', 'õ', 'ọ', 'ô', 'ồ', 'ố', 'ổ', 'ỗ', 'ộ',
+    'ơ', 'ờ', 'ớ', 'ở', 'ỡ', 'ợ', 'ù', 'ú', 'ủ', 'ũ', 'ụ',
+    'ư', 'ừ', 'ứ', 'ử', 'ữ', 'ự', 'ỳ', 'ý', 'ỷ', 'ỹ', 'ỵ',
+    'đ', 'Đ'
+]
+
+LEGACY_VIETNAMESE_WORDS = [
+    'và', 'của', 'trong', 'với', 'cho', 'từ', 'theo', 'về',
+    'được', 'có', 'là', 'một', 'các', 'này', 'để', 'những',
+    'như', 'khi', 'hay', 'đã', 'sẽ', 'không', 'tôi', 'bạn',
+    'chúng', 'việc', 'công', 'ty', 'doanh', 'nghiệp'
+]
+
+
+def legacy_is_vietnamese(text):
+    char_count = sum(1 for char in text if char in LEGACY_VIETNAMESE_CHARS)
+    text_lower = text.lower()
+    word_count = sum(1 for word in LEGACY_VIETNAMESE_WORDS if word in text_lower)
+    return char_count >= 3 or word_count >= 2
+
+
+def throughput(function, texts, repeats):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        function(texts)
+    elapsed = time.perf_counter() - started
+    return round(len(texts) * repeats / elapsed, 1) if elapsed else 0
+
+
+def is_vietnamese(result):
+    # The skip decision for Vietnamese, mixed posts included (see language_id.is_skipped_language)
+    return result["language"] == "vi" or result["shares"].get("vi", 0) >= config.LANGUAGE_MIXED_MIN_SHARE
+
+
+def run_benchmark(samples_file=None, repeats=50):
+    """
+    Accuracy on the labelled test split and texts/second, n-gram identifier vs legacy heuristic.
+    Test posts in untrained languages are labelled "unknown" and must be rejected.
+    """
+    with open(samples_file or config.LANGUAGE_SAMPLES_FILE, 'r', encoding='utf-8') as f:
+        samples = json.load(f)
+
+    started = time.perf_counter()
+    identifier = LanguageIdentifier.train(samples["train"])
+    training_seconds = time.perf_counter() - started
+
+    texts = [sample["text"] for sample in samples["test"]]
+    labels = [sample["language"] for sample in samples["test"]]
+    analyzed = identifier.analyze_batch(texts)
+    predicted = [result["language"] for result in analyzed]
+    vietnamese = [is_vietnamese(result) for result in analyzed]
+    legacy = [legacy_is_vietnamese(text) for text in texts]
+
+    per_language = {}
+    for label, prediction in zip(labels, predicted):
+        entry = per_language.setdefault(label, {"samples": 0, "correct": 0})
+        entry["samples"] += 1
+        entry["correct"] += label == prediction
+
+    results = {
+        "benchmark_timestamp": datetime.now().isoformat(),
+        "languages": identifier.languages,
+        "training_seconds": round(training_seconds, 3),
+        "test_samples": len(texts),
+        "ngram_accuracy": round(sum(l == p for l, p in zip(labels, predicted)) / len(texts), 3),
+        "ngram_vietnamese_accuracy": round(sum((l == "vi") == v for l, v in zip(labels, vietnamese)) / len(texts), 3),
+        "legacy_vietnamese_accuracy": round(sum((l == "vi") == v for l, v in zip(labels, legacy)) / len(texts), 3),
+        "ngram_false_positives": [text for label, text, v in zip(labels, texts, vietnamese) if v and label != "vi"],
+        "legacy_false_positives": [text for label, text, v in zip(labels, texts, legacy) if v and label != "vi"],
+        "per_language": per_language,
+        "ngram_texts_per_second": throughput(identifier.identify_batch, texts * 20, repeats),
+        "legacy_texts_per_second": throughput(lambda batch: [legacy_is_vietnamese(text) for text in batch], texts * 20, repeats),
+        "misclassified": [
+            {"text": text, "language": label, "predicted": result["language"], "shares": result["shares"],
+             "coverage": result["coverage"], "margin": result["margin"]}
+            for text, label, result in zip(texts, labels, analyzed) if label != result["language"]
+        ]
+    }
+    return results
+
+
+def print_results(results):
+    print("\n" + "="*60)
+    print("🌐 LANGUAGE IDENTIFICATION BENCHMARK")
+    print("="*60)
+    print(f"Languages: {', '.join(results['languages'])} ({results['test_samples']} labelled test posts)")
+    print(f"{'':<28}{'n-gram':>14}{'legacy':>14}")
+    print(f"{'Vietnamese yes/no accuracy':<28}{results['ngram_vietnamese_accuracy']:>14}{results['legacy_vietnamese_accuracy']:>14}")
+    print(f"{'Texts per second':<28}{results['ngram_texts_per_second']:>14}{results['legacy_texts_per_second']:>14}")
+    print(f"Multi-language accuracy: {results['ngram_accuracy']} (untrained languages must come back \"unknown\")")
+    for language, entry in results["per_language"].items():
+        print(f"   {language}: {entry['correct']}/{entry['samples']}")
+    if results["ngram_false_positives"]:
+        print(f"⚠️ n-gram identifier flagged {len(results['ngram_false_positives'])} non-Vietnamese posts as Vietnamese")
+    for item in results["misclassified"]:
+        print(f"   ❔ {item['language']} → {item['predicted']} {item['shares']}: {item['text'][:50]}")
+    if results["legacy_false_positives"]:
+        print(f"⚠️ Legacy heuristic flagged {len(results['legacy_false_positives'])} non-Vietnamese posts as Vietnamese")
+    print("="*60)
+
+
+def main():
+    results = run_benchmark()
+    print_results(results)
+    with open("language_benchmark.json", 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print("💾 Results saved to language_benchmark.json")
+
+if __name__ == "__main__":
+    main()
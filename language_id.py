@@ -0,0 +1,205 @@
+import re
+import json
+import numpy as np
+import config
+
+NGRAM_SIZES = (1, 2, 3)
+HASH_MULTIPLIER = np.uint64(1000003)
+SPACE = np.uint64(ord(" "))
+NON_LETTERS = re.compile(r"[\W\d_]+")
+
+
+def prepare_text(text):
+    """
+    Lowercased letters only, words separated by single spaces, padded so n-grams see word edges
+    """
+    return " " + NON_LETTERS.sub(" ", (text or "")[:config.LANGUAGE_ID_MAX_CHARS].lower()).strip() + " "
+
+
+def ngram_hashes(texts, buckets):
+    """
+    Hashed character n-grams for a whole batch of texts in one NumPy pass.
+    Returns (bucket per n-gram, text index per n-gram, word index per n-gram,
+    letters per text, text index per word, letters per word).
+    """
+    prepared = [prepare_text(text) for text in texts]
+    lengths = np.fromiter((len(text) for text in prepared), dtype=np.int64, count=len(prepared))
+    codes = np.frombuffer("".join(prepared).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    doc_ids = np.repeat(np.arange(len(prepared)), lengths)
+
+    # Word index per character: a word starts at the space before it, so "ab " ends in the next word
+    is_space = codes == SPACE
+    word_ids = np.cumsum(is_space) - 1
+    word_count = int(word_ids[-1]) + 1 if len(word_ids) else 0
+    word_letters = np.bincount(word_ids[~is_space], minlength=word_count)
+    word_docs = np.zeros(word_count, dtype=np.int64)
+    word_docs[word_ids] = doc_ids
+
+    hashes, docs, words = [], [], []
+    for n in NGRAM_SIZES:
+        count = len(codes) - n + 1
+        if count <= 0:
+            continue
+        # Polynomial hash of each window (uint64 arithmetic wraps around)
+        window = np.full(count, n, dtype=np.uint64)
+        for offset in range(n):
+            window = window * HASH_MULTIPLIER + codes[offset:offset + count]
+        # Drop windows that span two texts
+        same_doc = doc_ids[:count] == doc_ids[n - 1:n - 1 + count]
+        last = np.arange(n - 1, n - 1 + count)
+        hashes.append((window[same_doc] % np.uint64(buckets)).astype(np.int64))
+        docs.append(doc_ids[:count][same_doc])
+        words.append(np.maximum(word_ids[last] - is_space[last], 0)[same_doc])
+
+    if not hashes:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, lengths - 2, word_docs, word_letters
+    return np.concatenate(hashes), np.concatenate(docs), np.concatenate(words), lengths - 2, word_docs, word_letters
+
+
+class LanguageIdentifier:
+    """
+    Character n-gram naive Bayes language identification. N-grams are hashed into
+    LANGUAGE_HASH_BUCKETS buckets and a batch of texts is scored against every
+    language at once (one bincount per language).
+
+    The language set is closed, so a text is only attributed to a language when
+    enough of its n-grams were seen in that language's training samples and the
+    runner-up is far enough behind; anything else (Thai, Japanese, Indonesian, ...)
+    is "unknown". Words are also scored one by one, so a mixed post reports the
+    share of its letters written in each language.
+    """
+
+    def __init__(self, languages, log_probs, seen, buckets):
+        self.languages = languages
+        self.log_probs = log_probs  # languages x buckets
+        self.seen = seen  # languages x buckets, n-gram occurred in training
+        self.buckets = buckets
+
+    @classmethod
+    def train(cls, samples, buckets=None):
+        """
+        samples: {language code: [texts]}
+        """
+        buckets = buckets or config.LANGUAGE_HASH_BUCKETS
+        languages = sorted(samples)
+        counts = np.zeros((len(languages), buckets), dtype=np.float64)
+        for row, language in enumerate(languages):
+            hashes = ngram_hashes(samples[language], buckets)[0]
+            counts[row] += np.bincount(hashes, minlength=buckets)
+
+        smoothed = counts + 1  # Add-one smoothing
+        log_probs = np.log(smoothed / smoothed.sum(axis=1, keepdims=True)).astype(np.float32)
+        return cls(languages, log_probs, counts > 0, buckets)
+
+    @classmethod
+    def from_samples_file(cls, path=None):
+        with open(path or config.LANGUAGE_SAMPLES_FILE, 'r', encoding='utf-8') as f:
+            return cls.train(json.load(f)["train"])
+
+    def score(self, hashes, groups, size):
+        """
+        Per-language log-likelihood and seen n-gram count of every group (text or word)
+        """
+        scores = np.zeros((len(self.languages), size))
+        seen = np.zeros((len(self.languages), size))
+        for row in range(len(self.languages)):
+            scores[row] = np.bincount(groups, weights=self.log_probs[row, hashes], minlength=size)
+            seen[row] = np.bincount(groups, weights=self.seen[row, hashes], minlength=size)
+        return scores, seen
+
+    def best_languages(self, scores, seen, ngrams):
+        """
+        Best language index per group, -1 where coverage or margin is too low to tell
+        """
+        ngrams = np.maximum(ngrams, 1)
+        best = scores.argmax(axis=0)
+        columns = np.arange(scores.shape[1])
+        coverage = seen[best, columns] / ngrams
+        if len(self.languages) > 1:
+            margin = (scores[best, columns] - np.sort(scores, axis=0)[-2]) / ngrams
+        else:
+            margin = np.full(len(columns), np.inf)
+        confident = (coverage >= config.LANGUAGE_MIN_COVERAGE) & (margin >= config.LANGUAGE_MIN_MARGIN)
+        return np.where(confident, best, -1), coverage, margin
+
+    def analyze_batch(self, texts):
+        """
+        Per text: {"language", "coverage", "margin", "shares"}. language is "unknown" for
+        texts with too few letters or no confident match; shares maps each language to
+        the fraction of the text's letters in words identified as that language.
+        """
+        if not texts:
+            return []
+
+        hashes, docs, words, letters, word_docs, word_letters = ngram_hashes(texts, self.buckets)
+        doc_ngrams = np.bincount(docs, minlength=len(texts))
+        scores, seen = self.score(hashes, docs, len(texts))
+        best, coverage, margin = self.best_languages(scores, seen, doc_ngrams)
+
+        # Letter-weighted vote of the words (one-letter words carry no signal)
+        word_ngrams = np.bincount(words, minlength=len(word_docs))
+        word_scores, word_seen = self.score(hashes, words, len(word_docs))
+        word_best, _, _ = self.best_languages(word_scores, word_seen, word_ngrams)
+        voting = (word_best >= 0) & (word_letters > 1)
+        votes = np.zeros((len(texts), len(self.languages)))
+        np.add.at(votes, (word_docs[voting], word_best[voting]), word_letters[voting])
+        totals = np.maximum(np.bincount(word_docs, weights=word_letters, minlength=len(texts)), 1)
+
+        results = []
+        for i in range(len(texts)):
+            enough_letters = letters[i] >= config.LANGUAGE_MIN_CHARS
+            results.append({
+                "language": self.languages[best[i]] if enough_letters and best[i] >= 0 else "unknown",
+                "coverage": round(float(coverage[i]), 3),
+                "margin": round(float(margin[i]), 3),
+                "shares": {
+                    language: round(float(votes[i, row] / totals[i]), 3)
+                    for row, language in enumerate(self.languages) if enough_letters and votes[i, row]
+                }
+            })
+        return results
+
+    def identify_batch(self, texts):
+        """
+        Language code per text ("unknown" for texts with too few letters or no confident match)
+        """
+        return [result["language"] for result in self.analyze_batch(texts)]
+
+    def identify(self, text):
+        return self.identify_batch([text])[0]
+
+
+_identifier = None
+
+
+def get_language_identifier():
+    """
+    Process-wide identifier, trained once from LANGUAGE_SAMPLES_FILE
+    """
+    global _identifier
+    if _identifier is None:
+        _identifier = LanguageIdentifier.from_samples_file()
+    return _identifier
+
+
+def analyze_languages(texts):
+    return get_language_identifier().analyze_batch(texts)
+
+
+def identify_languages(texts):
+    return get_language_identifier().identify_batch(texts)
+
+
+def identify_language(text):
+    return get_language_identifier().identify(text)
+
+
+def is_skipped_language(language, shares=None):
+    """
+    In SKIP_LANGUAGES, or a mixed post with at least LANGUAGE_MIXED_MIN_SHARE of its
+    letters in a skipped language (e.g. a Vietnamese job post with English job titles)
+    """
+    if language in config.SKIP_LANGUAGES:
+        return True
+    return any((shares or {}).get(skipped, 0) >= config.LANGUAGE_MIXED_MIN_SHARE for skipped in config.SKIP_LANGUAGES)
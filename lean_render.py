@@ -0,0 +1,126 @@
+# Lean-render browser profile for read-only stages (scanning, content reading)
+import json
+import config
+
+# Media, fonts and tracking beacons - none of them are needed to read DOM text
+BLOCKED_URL_PATTERNS = [
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    "*.mp4*", "*.m4s*", "*.webm*", "*.m3u8*",
+    "*.woff*", "*.ttf*", "*.otf*",
+    "*media.licdn.com/dms/image*",
+    "*dms.licdn.com/playlist*",
+    "*static.licdn.com/aero-v1/sc/h/*font*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/sensorCollect*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*"
+]
+
+NO_ANIMATION_CSS = """
+*, *::before, *::after {
+    transition: none !important;
+    animation: none !important;
+    scroll-behavior: auto !important;
+}
+html, body { scroll-behavior: auto !important; }
+"""
+
+INJECT_CSS_SCRIPT = """
+(function(css) {
+    const inject = () => {
+        if (document.getElementById('lean-render-style')) return;
+        const style = document.createElement('style');
+        style.id = 'lean-render-style';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', inject);
+    } else {
+        inject();
+    }
+})(%s);
+"""
+
+REMOVE_CSS_SCRIPT = """
+const style = document.getElementById('lean-render-style');
+if (style) style.remove();
+"""
+
+# ChromeDriver performance log with Network events only: every Network.loadingFinished carries
+# encodedDataLength, the bytes actually received over the wire (headers included, blocked requests excluded)
+TRANSFER_LOGGING_PREFS = {"performance": "ALL"}
+TRANSFER_PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+
+def apply_lean_render(driver):
+    """
+    Block media/fonts/beacons and disable smooth scrolling and transitions
+    Returns the identifier of the injected CSS script (needed to remove it), None on failure
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+        css_script = INJECT_CSS_SCRIPT % json.dumps(NO_ANIMATION_CSS)
+        result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": css_script})
+        driver.execute_script(css_script)  # Current document as well
+        print(f"🪶 Lean render profile enabled ({len(BLOCKED_URL_PATTERNS)} URL patterns blocked)")
+        return result["identifier"]
+    except Exception as e:
+        print(f"⚠️ Could not enable lean render profile: {e}")
+        return None
+
+
+def remove_lean_render(driver, script_identifier):
+    """
+    Undo apply_lean_render before the session starts writing: unblock URLs and drop the
+    injected CSS (the eager page load strategy is fixed for the session; it only affects
+    how long driver.get waits, not what the page renders)
+    Returns True if the profile was removed
+    """
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        if script_identifier:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_identifier})
+        driver.execute_script(REMOVE_CSS_SCRIPT)
+        print("🪶 Lean render profile disabled (full rendering for writing)")
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not disable lean render profile: {e}")
+        return False
+
+
+def add_transfer_logging(chrome_options):
+    """
+    Ask ChromeDriver to record CDP Network events so get_transferred_bytes can sum them
+    (only with TRACK_TRANSFERRED_BYTES: the events are buffered until drained)
+    """
+    if not config.TRACK_TRANSFERRED_BYTES:
+        return
+    chrome_options.set_capability("goog:loggingPrefs", TRANSFER_LOGGING_PREFS)
+    chrome_options.add_experimental_option("perfLoggingPrefs", TRANSFER_PERF_LOGGING_PREFS)
+
+
+def get_transferred_bytes(driver, totals=None):
+    """
+    Add the Network.loadingFinished events logged since the last call to totals
+    ({bytes, requests}); the performance log is drained on every read, so totals
+    accumulate across calls and page navigations
+    """
+    totals = totals if totals is not None else {"bytes": 0, "requests": 0}
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return totals
+
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method") != "Network.loadingFinished":
+            continue
+        totals["bytes"] += int(message.get("params", {}).get("encodedDataLength", 0))
+        totals["requests"] += 1
+    return totals
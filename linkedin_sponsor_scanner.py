@@ -1,57 +1,38 @@
 import time
 import json
 from datetime import datetime
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from chrome_initialize import LinkedInCommentBot
+from feed_pipeline import FeedPipeline
 
 class LinkedInSponsorScanner(LinkedInCommentBot):
     def __init__(self):
         super().__init__()
         self.sponsored_ember_ids = []
 
-    def is_promoted_post(self, post_element):
-        """
-        Simple sponsor/advertising post detection
-        """
-        try:
-            promoted_text = post_element.text.lower()
-            return 'promoted' in promoted_text or 'sponsored' in promoted_text
-        except:
-            return False
-
     def scan_sponsored_posts(self):
         """
         Scan for sponsored post ember IDs only
         """
         print("Scanning for sponsored posts...")
 
+        # Read-only stage: use the lean render profile if enabled
+        self.enable_lean_render()
+
         # Wait for page to settle
         time.sleep(3)
 
-        # Scroll to bottom of page to load all content
-        print("Scrolling to bottom of page to load all content...")
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-
-        # Find all elements with ember IDs
-        ember_elements = self.driver.find_elements(By.CSS_SELECTOR, "[id^='ember']")
-        print(f"Found {len(ember_elements)} Ember elements")
-
-        # Check each ember element for sponsored content
-        for ember_elem in ember_elements:
-            try:
-                ember_id = ember_elem.get_attribute('id')
-
-                # Check if this ember element is a sponsored post
-                if self.is_promoted_post(ember_elem):
-                    self.sponsored_ember_ids.append(ember_id)
-                    print(f"📢 Found sponsored post: {ember_id}")
+        # Sponsor view over the shared feed pass (see FeedPipeline)
+        pipeline = FeedPipeline(self)
+        posts = pipeline.run()
+        print(f"Found {pipeline.harvester.ember_count} Ember elements, {len(posts)} posts")
 
-            except Exception as e:
-                continue
+        for post in posts:
+            if post["is_sponsored"]:
+                self.sponsored_ember_ids.append(post["ember_id"])
+                print(f"📢 Found sponsored post: {post['ember_id']}")
 
         print(f"Sponsor scan completed! Found {len(self.sponsored_ember_ids)} sponsored posts")
+        pipeline.harvester.reader.stats.print_report()
         return self.sponsored_ember_ids
 
     def save_results_to_json(self, filename="sponsored_ember_ids.json"):
@@ -0,0 +1,104 @@
+import re
+import json
+from datetime import datetime, timedelta, timezone
+import config
+
+# LinkedIn shows post age as a relative label in the actor sub-description:
+# "45m", "2h • Edited", "3d", "1w", "5mo", "1yr" (or "3 days ago" in the hidden a11y text)
+AGE_LABEL_SELECTORS = [
+    ".update-components-actor__sub-description",
+    ".feed-shared-actor__sub-description"
+]
+
+AGE_UNITS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+    "w": 604800, "wk": 604800, "wks": 604800, "week": 604800, "weeks": 604800,
+    "mo": 2592000, "month": 2592000, "months": 2592000,
+    "y": 31536000, "yr": 31536000, "yrs": 31536000, "year": 31536000, "years": 31536000
+}
+
+# Longest units first so "2mo" is months and "2min" is minutes; same syntax in Python and JS
+AGE_PATTERN = r"(\d+)\s*(" + "|".join(sorted(AGE_UNITS, key=len, reverse=True)) + r")\b"
+NOW_PATTERN = r"^(now|just now)\b"
+
+# In-page postAge(el): {label, seconds} (seconds null when the post shows no age, e.g. ads)
+POST_AGE_JS = (
+    "const AGE_LABEL_SELECTORS = " + json.dumps(AGE_LABEL_SELECTORS) + ";\n"
+    "const AGE_UNITS = " + json.dumps(AGE_UNITS) + ";\n"
+    "const AGE_PATTERN = new RegExp(" + json.dumps(AGE_PATTERN) + ", 'i');\n"
+    "const NOW_PATTERN = new RegExp(" + json.dumps(NOW_PATTERN) + ", 'i');\n"
+    """
+function postAge(el) {
+    for (const selector of AGE_LABEL_SELECTORS) {
+        const node = el.querySelector(selector);
+        if (!node) continue;
+        // The age is the first "•"-separated part; "Edited" and the visibility icon follow it
+        const label = (node.textContent || '').trim().split('•')[0].trim();
+        if (NOW_PATTERN.test(label)) return {label: label, seconds: 0};
+        const match = label.match(AGE_PATTERN);
+        if (match) return {label: label, seconds: parseInt(match[1], 10) * AGE_UNITS[match[2].toLowerCase()]};
+    }
+    return {label: null, seconds: null};
+}
+"""
+)
+
+AGE_REGEX = re.compile(AGE_PATTERN, re.IGNORECASE)
+NOW_REGEX = re.compile(NOW_PATTERN, re.IGNORECASE)
+
+
+def parse_age_label(label):
+    """
+    Seconds since posting for a relative label ("45m", "2h • Edited", "3 days ago"), None if unparseable
+    """
+    label = (label or "").strip().split("•")[0].strip()
+    if NOW_REGEX.match(label):
+        return 0
+    match = AGE_REGEX.search(label)
+    if not match:
+        return None
+    return int(match.group(1)) * AGE_UNITS[match.group(2).lower()]
+
+
+def post_age(root):
+    """
+    Same check as the in-page postAge, on parsed HTML (html_selectors). Returns (label, seconds).
+    """
+    for selector in AGE_LABEL_SELECTORS:
+        node = root.css_first(selector)
+        if node is None:
+            continue
+        label = node.text(deep=True).strip().split("•")[0].strip()
+        seconds = parse_age_label(label)
+        if seconds is not None:
+            return label, seconds
+    return None, None
+
+
+def posted_at(seconds, captured_at=None):
+    """
+    Absolute UTC posting time (ISO) from the age in seconds at capture time
+    """
+    if seconds is None:
+        return None
+    captured_at = captured_at or datetime.now(timezone.utc)
+    return (captured_at - timedelta(seconds=seconds)).isoformat()
+
+
+def age_days(posted_at_iso, now=None):
+    if not posted_at_iso:
+        return None
+    posted = datetime.fromisoformat(posted_at_iso)
+    now = now or datetime.now(timezone.utc)
+    return round((now - posted).total_seconds() / 86400, 2)
+
+
+def is_stale(posted_at_iso, now=None):
+    """
+    Older than MAX_POST_AGE_DAYS (posts without a known age are never stale)
+    """
+    days = age_days(posted_at_iso, now)
+    return bool(config.MAX_POST_AGE_DAYS) and days is not None and days > config.MAX_POST_AGE_DAYS
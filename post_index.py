@@ -0,0 +1,303 @@
+import time
+import config
+
+# In-page helpers shared by the harvester and URN lookups.
+# A post is identified by its outermost activity/share URN node; nested Ember
+# containers of the same post collapse into one root, and a different URN nested
+# inside the post is the reshared original.
+POST_ROOT_JS = """
+const URN_SELECTOR = ['activity', 'ugcPost', 'share', 'aggregate']
+    .map(type => `[data-urn^='urn:li:${type}:'], [data-id^='urn:li:${type}:']`).join(', ');
+
+function urnOf(node) {
+    return node.getAttribute('data-urn') || node.getAttribute('data-id');
+}
+
+function findUrnNode(urn) {
+    const escaped = CSS.escape(urn);
+    return document.querySelector(`[data-urn="${escaped}"], [data-id="${escaped}"]`);
+}
+
+function isEmber(node) {
+    return node.id && node.id.startsWith('ember');
+}
+
+function isPostCandidate(el) {
+    return isEmber(el) && el.querySelector('.update-components-actor__title') !== null;
+}
+
+function outermostUrnNode(node) {
+    let outer = node ? node.closest(URN_SELECTOR) : null;
+    while (outer && outer.parentElement) {
+        const above = outer.parentElement.closest(URN_SELECTOR);
+        if (!above) break;
+        outer = above;
+    }
+    return outer;
+}
+
+function topLevelPostCount(container) {
+    if (container.matches(URN_SELECTOR) || (container.parentElement && container.parentElement.closest(URN_SELECTOR))) return 1;
+    const urns = new Set();
+    for (const node of container.querySelectorAll(URN_SELECTOR)) {
+        if (outermostUrnNode(node) === node) urns.add(urnOf(node));
+        if (urns.size > 1) break;
+    }
+    return urns.size;
+}
+
+// Outermost Ember container of the post that does not also hold other posts
+// (null for feed wrappers whose posts have no Ember container of their own)
+function resolvePostRoot(el) {
+    if (!isPostCandidate(el)) return null;
+    const title = el.querySelector('.update-components-actor__title');
+    const urnNode = outermostUrnNode(title);
+    if (!urnNode) return el;
+
+    let root = null;
+    for (let node = urnNode; node; node = node.parentElement) {
+        if (!isEmber(node)) continue;
+        if (topLevelPostCount(node) > 1) break;
+        root = node;
+    }
+    if (!root) {
+        for (let node = title; node && urnNode.contains(node); node = node.parentElement) {
+            if (isEmber(node)) root = node;
+        }
+    }
+    return root;
+}
+
+function postUrns(root) {
+    const urnNode = outermostUrnNode(root.querySelector('.update-components-actor__title')) ||
+        (root.matches(URN_SELECTOR) ? root : root.querySelector(URN_SELECTOR));
+    if (!urnNode) return {urn: null, reshared_urn: null};
+
+    const urn = urnOf(urnNode);
+    let resharedUrn = null;
+    for (const inner of urnNode.querySelectorAll(URN_SELECTOR)) {
+        if (urnOf(inner) !== urn) { resharedUrn = urnOf(inner); break; }
+    }
+    return {urn: urn, reshared_urn: resharedUrn};
+}
+"""
+
+# Current ember id of the post root carrying a given URN (null if not rendered)
+EMBER_ID_BY_URN_SCRIPT = POST_ROOT_JS + """
+const urn = arguments[0];
+const node = findUrnNode(urn);
+if (!node) return null;
+const candidate = isPostCandidate(node) ? node :
+    ([...node.querySelectorAll("[id^='ember']")].find(isPostCandidate) || node.closest("[id^='ember']"));
+const root = candidate ? resolvePostRoot(candidate) : null;
+return root ? root.id : null;
+"""
+
+# Post root element and its ember id in one call: by URN when known, by ember id only
+# for posts without one (ember ids are reassigned on reload / re-render, so a post with
+# a URN that is no longer in the page is not found rather than matched to another post)
+RESOLVE_POST_SCRIPT = POST_ROOT_JS + """
+const urn = arguments[0];
+const emberId = arguments[1];
+let root = null;
+if (urn) {
+    const node = findUrnNode(urn);
+    if (node) {
+        const candidate = isPostCandidate(node) ? node :
+            ([...node.querySelectorAll("[id^='ember']")].find(isPostCandidate) || node.closest("[id^='ember']"));
+        root = candidate ? resolvePostRoot(candidate) : null;
+    }
+} else {
+    root = document.getElementById(emberId);
+}
+return root ? [root, root.id] : null;
+"""
+
+
+class PostIndex:
+    """
+    Posts keyed by their stable URN (ember id only for posts without one).
+    Maps each URN to its current ember id and a cached element handle,
+    so lookups are O(1) and results can be joined across sessions.
+    """
+
+    def __init__(self):
+        self.posts = {}  # key -> record, in feed order
+        self.keys_by_ember_id = {}
+        self.elements = {}
+        self.stale_recoveries = 0
+        self.stale_recovery_seconds = 0.0
+        self.not_found_recoveries = 0
+        self.not_found_failures = 0
+
+    @staticmethod
+    def key_for(record):
+        return record.get("urn") or record["ember_id"]
+
+    def add(self, record):
+        """
+        Index a post record. Returns False if the post is already known
+        (its ember id is refreshed in case it was re-rendered).
+        """
+        key = self.key_for(record)
+        if key in self.posts:
+            self.update_ember_id(key, record["ember_id"])
+            return False
+
+        self.posts[key] = record
+        self.keys_by_ember_id[record["ember_id"]] = key
+        return True
+
+    def update_ember_id(self, key, ember_id):
+        record = self.posts[key]
+        if record["ember_id"] != ember_id:
+            self.keys_by_ember_id.pop(record["ember_id"], None)
+            record["ember_id"] = ember_id
+            self.keys_by_ember_id[ember_id] = key
+            self.elements.pop(key, None)
+
+    def get(self, key):
+        return self.posts.get(key)
+
+    def ember_id(self, key):
+        record = self.posts.get(key)
+        return record["ember_id"] if record else None
+
+    def ember_ids(self):
+        return list(self.keys_by_ember_id)
+
+    def resolve(self, driver, key):
+        """
+        Locate a post's current element in one call (by URN; by ember id only for posts without one)
+        """
+        from selenium.common.exceptions import NoSuchElementException  # Lazy: parsing tools import this module without selenium
+
+        record = self.posts[key]
+        result = driver.execute_script(RESOLVE_POST_SCRIPT, record.get("urn"), record["ember_id"])
+        if not result:
+            raise NoSuchElementException(f"Post {key} is not in the page")
+
+        element, ember_id = result
+        self.update_ember_id(key, ember_id)
+        self.elements[key] = element
+        return element
+
+    def release_element(self, key):
+        """
+        Drop the cached element of a finished post, so no Python reference keeps it alive
+        """
+        self.elements.pop(key, None)
+
+    def handle(self, driver, key):
+        return PostHandle(self, driver, key)
+
+    def record_stale_recovery(self, seconds):
+        self.stale_recoveries += 1
+        self.stale_recovery_seconds += seconds
+
+    def record_not_found(self, recovered):
+        if recovered:
+            self.not_found_recoveries += 1
+        else:
+            self.not_found_failures += 1
+
+    def stale_stats(self):
+        average = self.stale_recovery_seconds / self.stale_recoveries if self.stale_recoveries else 0
+        return {
+            "stale_recoveries": self.stale_recoveries,
+            "avg_recovery_ms": round(average * 1000, 1),
+            "not_found_recoveries": self.not_found_recoveries,
+            "not_found_failures": self.not_found_failures
+        }
+
+    def records(self):
+        return list(self.posts.values())
+
+    def reshares(self):
+        return [record for record in self.posts.values() if record.get("reshared_urn")]
+
+    def __len__(self):
+        return len(self.posts)
+
+    def __contains__(self, key):
+        return key in self.posts
+
+
+class PostHandle:
+    """
+    Post element that survives LinkedIn re-rendering: on a stale element error it
+    re-locates the post by URN / ember id in one call and retries, instead of
+    failing into the per-post retry loop. A post caught mid re-render (old node gone,
+    new one not inserted yet) is polled for up to POST_RELOCATE_TIMEOUT.
+    WebElement methods and properties are proxied.
+    """
+
+    def __init__(self, index, driver, key):
+        self.index = index
+        self.driver = driver
+        self.key = key
+
+    @property
+    def element(self):
+        return self.index.elements.get(self.key) or self.locate()
+
+    @property
+    def ember_id(self):
+        return self.index.ember_id(self.key)
+
+    def locate(self):
+        """
+        Resolve the post, waiting out a re-render that has removed it from the page
+        (raises NoSuchElementException if it does not come back)
+        """
+        from selenium.common.exceptions import NoSuchElementException
+
+        try:
+            return self.index.resolve(self.driver, self.key)
+        except NoSuchElementException:
+            pass
+
+        deadline = time.perf_counter() + config.POST_RELOCATE_TIMEOUT
+        while True:
+            time.sleep(0.2)
+            try:
+                element = self.index.resolve(self.driver, self.key)
+                self.index.record_not_found(recovered=True)
+                return element
+            except NoSuchElementException:
+                if time.perf_counter() > deadline:
+                    self.index.record_not_found(recovered=False)
+                    print(f"⚠️ Post {self.key} is no longer in the page")
+                    raise
+
+    def re_resolve(self):
+        started = time.perf_counter()
+        self.index.elements.pop(self.key, None)
+        element = self.locate()
+        self.index.record_stale_recovery(time.perf_counter() - started)
+        print(f"♻️ Post re-rendered - re-located as {self.ember_id}")
+        return element
+
+    def call(self, action):
+        """
+        Run action(element), re-resolving once if the element went stale
+        """
+        from selenium.common.exceptions import StaleElementReferenceException
+
+        element = self.element
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            return action(self.re_resolve())
+
+    def execute_script(self, script, *args):
+        """
+        driver.execute_script with the post element as arguments[0]
+        """
+        return self.call(lambda element: self.driver.execute_script(script, element, *args))
+
+    def __getattr__(self, name):
+        value = self.call(lambda element: getattr(element, name))
+        if not callable(value):
+            return value
+        return lambda *args, **kwargs: self.call(lambda element: getattr(element, name)(*args, **kwargs))
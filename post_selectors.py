@@ -0,0 +1,32 @@
+# Post field selector cascades (and the Read More button), shared by the live scanner, the in-page harvester and the
+# offline snapshot parser (plain data, no browser dependencies)
+
+# Primary selector from HTML tag pattern, then fallbacks
+AUTHOR_SELECTORS = [
+    ".update-components-actor__title span.hoverable-link-text span span:first-child",
+    ".update-components-actor__title .hoverable-link-text",
+    ".update-components-actor__title span[aria-hidden='true']",
+    ".update-components-actor__name span",
+    ".feed-shared-actor__name span"
+]
+
+POST_CONTENT_SELECTORS = [
+    # Primary selector from HTML tag analysis
+    ".fie-impression-container div[class*='biSBAHR'] > div > div",
+    # Alternative content selectors
+    ".fie-impression-container .break-words",
+    ".feed-shared-update-v2__description",
+    ".feed-shared-update-v2__description-wrapper",
+    "[data-test-id='main-feed-activity-card'] .break-words",
+    ".update-components-text"
+]
+
+READ_MORE_SELECTORS = [
+    # Primary selector from HTML tag analysis
+    "div.fie-impression-container div[class*='biSBAHR'] > div > button",
+    # Alternative selectors for different LinkedIn layouts
+    "button[aria-label*='more' i]",
+    "button span[class*='see-more']",
+    ".feed-shared-update-v2__description button",
+    "button[data-control-name*='see_more']"
+]
@@ -0,0 +1,55 @@
+import psutil
+import config
+
+
+def find_pid_listening_on(port):
+    """
+    PID of the process listening on a local port (used for attached browsers)
+    """
+    try:
+        for conn in psutil.net_connections(kind="tcp"):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                return conn.pid
+    except (psutil.AccessDenied, PermissionError):
+        pass
+    return None
+
+
+def get_browser_processes(driver, debug_port=None):
+    """
+    All Chrome processes behind a driver: chromedriver's children for launched
+    browsers, or the process tree on the debug port for attached ones
+    """
+    processes = []
+    try:
+        driver_process = psutil.Process(driver.service.process.pid)
+        processes = driver_process.children(recursive=True)
+    except Exception:
+        pass
+
+    if not processes:
+        pid = find_pid_listening_on(debug_port or config.CHROME_DEBUGGING_PORT)
+        if pid:
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except psutil.NoSuchProcess:
+                pass
+
+    return processes
+
+
+def get_browser_usage(driver, debug_port=None):
+    """
+    Total CPU time and resident memory of the browser process tree
+    """
+    usage = {"cpu_seconds": 0.0, "rss_bytes": 0, "process_count": 0}
+    for process in get_browser_processes(driver, debug_port):
+        try:
+            cpu_times = process.cpu_times()
+            usage["cpu_seconds"] += cpu_times.user + cpu_times.system
+            usage["rss_bytes"] += process.memory_info().rss
+            usage["process_count"] += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return usage
@@ -0,0 +1,136 @@
+import os
+import glob
+import shutil
+import hashlib
+import tempfile
+import config
+
+# Files copied from the real profile (relative to the user-data dir)
+ESSENTIAL_PROFILE_FILES = [
+    "Local State",
+    os.path.join("Default", "Cookies"),
+    os.path.join("Default", "Cookies-journal"),
+    os.path.join("Default", "Network", "Cookies"),
+    os.path.join("Default", "Network", "Cookies-journal"),
+    os.path.join("Default", "Preferences")
+]
+
+# Chrome's cache directories inside the clone - never re-copied, kept warm across runs
+CACHE_DIRECTORIES = [
+    os.path.join("Default", "Cache"),
+    os.path.join("Default", "Code Cache"),
+    os.path.join("Default", "GPUCache"),
+    "ShaderCache",
+    "GrShaderCache"
+]
+
+
+def default_clone_dir():
+    """
+    Clone location: tmpfs (/dev/shm) when enabled and available, otherwise the temp dir
+    """
+    if config.PROFILE_CLONE_DIR:
+        return os.path.abspath(config.PROFILE_CLONE_DIR)
+    if config.PROFILE_CLONE_ON_TMPFS and os.path.isdir("/dev/shm"):
+        return os.path.join("/dev/shm", "linkedin_profile_clone")
+    return os.path.join(tempfile.gettempdir(), "linkedin_profile_clone")
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def directory_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+class ProfileClone:
+    """
+    A Chrome profile copy that is reused across runs. Only changed login files
+    are re-copied; HTTP and compiled-code caches stay warm between launches.
+    """
+
+    def __init__(self, source_user_data_dir, clone_dir=None):
+        self.source_user_data_dir = source_user_data_dir
+        self.clone_dir = clone_dir or default_clone_dir()
+
+    def is_changed(self, src, dst):
+        """
+        mtime/size check first; optional hash check when only the mtime moved
+        """
+        if not os.path.exists(dst):
+            return True
+
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size != dst_stat.st_size:
+            return True
+        if int(src_stat.st_mtime) == int(dst_stat.st_mtime):
+            return False
+        if config.PROFILE_CLONE_HASH_CHECK:
+            return file_digest(src) != file_digest(dst)
+        return True
+
+    def sync(self):
+        """
+        Bring the clone up to date with the source profile
+        Returns the clone directory (usable as --user-data-dir)
+        """
+        copied = 0
+        unchanged = 0
+
+        for relative_path in ESSENTIAL_PROFILE_FILES:
+            src = os.path.join(self.source_user_data_dir, relative_path)
+            if not os.path.exists(src):
+                continue
+
+            dst = os.path.join(self.clone_dir, relative_path)
+            if self.is_changed(src, dst):
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copy2(src, dst)
+                copied += 1
+            else:
+                # Keep mtimes aligned so the next run skips the hash check
+                shutil.copystat(src, dst)
+                unchanged += 1
+
+        print(f"Profile clone at {self.clone_dir}: {copied} files refreshed, {unchanged} unchanged")
+        return self.clone_dir
+
+    def gc(self):
+        """
+        Remove leaked per-run temp profiles and trim the clone's cache if it grew too large
+        Returns the number of bytes freed
+        """
+        freed = 0
+
+        # Older versions created a new linkedin_bot_* temp dir on every launch
+        for leaked_dir in glob.glob(os.path.join(tempfile.gettempdir(), "linkedin_bot_*")):
+            if os.path.abspath(leaked_dir) == os.path.abspath(self.clone_dir) or not os.path.isdir(leaked_dir):
+                continue
+            freed += directory_size(leaked_dir)
+            shutil.rmtree(leaked_dir, ignore_errors=True)
+
+        max_cache_bytes = config.PROFILE_CLONE_MAX_CACHE_MB * 1024 * 1024
+        cache_dirs = [os.path.join(self.clone_dir, d) for d in CACHE_DIRECTORIES]
+        cache_size = sum(directory_size(d) for d in cache_dirs if os.path.isdir(d))
+        if max_cache_bytes and cache_size > max_cache_bytes:
+            for cache_dir in cache_dirs:
+                if os.path.isdir(cache_dir):
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+            freed += cache_size
+
+        if freed:
+            print(f"🧹 Profile GC freed {freed / (1024 * 1024):.1f} MB")
+        return freed
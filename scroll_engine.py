@@ -0,0 +1,120 @@
+import time
+import config
+
+SCROLL_STEP_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+# Cheap growth signal: Ember node count and document height
+FEED_SIZE_SCRIPT = "return [document.querySelectorAll(\"[id^='ember']\").length, document.body.scrollHeight];"
+
+
+class ScrollEngine:
+    """
+    Content-driven infinite scroll: keeps scrolling until the post target, a
+    feed-growth plateau, the time budget or a consumer stop condition (stop_when()
+    returning a reason) is reached. Each step waits for the feed to actually grow
+    instead of sleeping a fixed time.
+    """
+
+    def __init__(self, reader, on_batch=None, count_posts=None, max_posts=None, time_budget=None, stop_when=None):
+        self.reader = reader
+        self.on_batch = on_batch
+        self.count_posts = count_posts
+        self.max_posts = config.MAX_POSTS_TO_SCAN if max_posts is None else max_posts
+        self.time_budget = config.SCROLL_TIME_BUDGET if time_budget is None else time_budget
+        self.stop_when = stop_when
+        self.steps = 0
+        self.step_seconds = 0.0  # Scroll + wait for growth, summed over all steps
+        self.stats = None
+
+    def feed_size(self):
+        return tuple(self.reader.run(FEED_SIZE_SCRIPT))
+
+    def wait_for_growth(self, before):
+        """
+        Poll until the feed grows or SCROLL_GROWTH_TIMEOUT passes. Returns True if it grew.
+        """
+        deadline = time.perf_counter() + config.SCROLL_GROWTH_TIMEOUT
+        while time.perf_counter() < deadline:
+            time.sleep(config.SCROLL_POLL_INTERVAL)
+            size = self.feed_size()
+            if size[0] > before[0] or size[1] > before[1]:
+                return True
+        return False
+
+    def posts_found(self):
+        return self.count_posts() if self.count_posts else 0
+
+    def batches(self):
+        """
+        Scroll step by step, yielding each on_batch() result as soon as it is harvested.
+        Only time spent scrolling counts against the budget, so the consumer can process
+        posts between batches (streaming mode). self.stats is set once scrolling stops.
+        """
+        print("📜 Scrolling feed until target, plateau or time budget...")
+        scrolling = 0.0  # Seconds spent in this generator, excluding the consumer's work
+        resumed = time.perf_counter()
+        suspended = False  # At a yield: time since `resumed` belongs to the consumer
+        stalled_steps = 0
+        stop_reason = "stopped"  # Consumer closed the stream before a stop condition
+
+        try:
+            if self.on_batch:
+                batch = self.on_batch()
+                scrolling += time.perf_counter() - resumed
+                suspended = True
+                yield batch
+                suspended = False
+                resumed = time.perf_counter()
+
+            while True:
+                if self.max_posts and self.posts_found() >= self.max_posts:
+                    stop_reason = "target_reached"
+                    break
+                if self.time_budget and scrolling + time.perf_counter() - resumed >= self.time_budget:
+                    stop_reason = "time_budget"
+                    break
+                if stalled_steps >= config.SCROLL_PLATEAU_STEPS:
+                    stop_reason = "plateau"
+                    break
+                consumer_reason = self.stop_when() if self.stop_when else None
+                if consumer_reason:
+                    stop_reason = consumer_reason
+                    break
+
+                step_started = time.perf_counter()
+                before = self.feed_size()
+                self.reader.run(SCROLL_STEP_SCRIPT)
+                self.steps += 1
+                grew = self.wait_for_growth(before)
+                self.step_seconds += time.perf_counter() - step_started
+                stalled_steps = 0 if grew else stalled_steps + 1
+
+                batch = self.on_batch() if self.on_batch else None
+                print(f"   Scroll {self.steps}: {'feed grew' if grew else 'no new content'} "
+                      f"({self.posts_found()} posts)")
+
+                scrolling += time.perf_counter() - resumed
+                suspended = True
+                yield batch
+                suspended = False
+                resumed = time.perf_counter()
+
+        finally:
+            # Closed at a yield (streaming consumer or post limit): the open segment is the consumer's
+            elapsed = scrolling if suspended else scrolling + time.perf_counter() - resumed
+            posts = self.posts_found()
+            self.stats = {
+                "scroll_steps": self.steps,
+                "stop_reason": stop_reason,
+                "seconds": round(elapsed, 2),
+                "posts_discovered": posts,
+                "posts_per_second": round(posts / elapsed, 2) if elapsed else 0,
+                "avg_step_seconds": round(self.step_seconds / self.steps, 3) if self.steps else 0
+            }
+            print(f"✅ Finished scrolling ({stop_reason}): {posts} posts in {elapsed:.1f}s "
+                  f"({self.stats['posts_per_second']} posts/s, {self.steps} scrolls)")
+
+    def run(self):
+        for _ in self.batches():
+            pass
+        return self.stats
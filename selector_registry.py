@@ -0,0 +1,138 @@
+import os
+import json
+import threading
+from datetime import datetime
+import config
+
+
+class SelectorRegistry:
+    """
+    Fallback selector cascades, tried best-performer first. Hits and misses are
+    recorded per cascade and persisted between runs (SELECTOR_STATS_FILE).
+    """
+
+    def __init__(self, stats_file=None):
+        self.stats_file = stats_file or config.SELECTOR_STATS_FILE
+        self.stats = self.load()
+        self.lookups = {}  # cascade -> {"fields": n, "attempts": n} for this run
+        self.lock = threading.Lock()  # The dual-browser writer runs on its own thread
+
+    def load(self):
+        if not os.path.exists(self.stats_file):
+            return {}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("cascades", {})
+        except Exception as e:
+            print(f"⚠️ Could not load selector stats: {e}")
+            return {}
+
+    def save(self):
+        try:
+            with open(self.stats_file, 'w', encoding='utf-8') as f:
+                json.dump({"updated": datetime.now().isoformat(), "cascades": self.stats}, f, indent=2)
+        except Exception as e:
+            print(f"⚠️ Could not save selector stats: {e}")
+
+    def score(self, cascade, selector):
+        entry = self.stats.get(cascade, {}).get(selector, {"hits": 0, "misses": 0})
+        # Laplace-smoothed hit rate: untried selectors start at 0.5
+        return (entry["hits"] + 1) / (entry["hits"] + entry["misses"] + 2)
+
+    def order(self, cascade, selectors, adaptive=True):
+        """
+        Selectors sorted by observed hit rate (declared order breaks ties).
+        Precedence-ordered cascades pass adaptive=False and keep their declared order.
+        """
+        if not (config.ADAPTIVE_SELECTORS and adaptive):
+            return list(selectors)
+        ranked = sorted(enumerate(selectors), key=lambda item: (-self.score(cascade, item[1]), item[0]))
+        return [selector for _, selector in ranked]
+
+    def record(self, cascade, selector, hit):
+        with self.lock:
+            entry = self.stats.setdefault(cascade, {}).setdefault(selector, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+
+    def record_lookup(self, cascade, attempts):
+        with self.lock:
+            entry = self.lookups.setdefault(cascade, {"fields": 0, "attempts": 0})
+            entry["fields"] += 1
+            entry["attempts"] += attempts
+
+    def first_match(self, cascade, selectors, probe, adaptive=True):
+        """
+        Run probe(selector) over the cascade until one returns a truthy result
+        (NoSuchElementException / TimeoutException count as a miss; anything else,
+        e.g. a dead session or stale element, is re-raised and not recorded).
+        Probes must only locate elements, never click.
+        Returns (selector, result), or (None, None) if every selector missed.
+        """
+        # Imported here so the registry stays importable without selenium (offline snapshot parsing)
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+        attempts = 0
+        for selector in self.order(cascade, selectors, adaptive):
+            attempts += 1
+            try:
+                result = probe(selector)
+            except (NoSuchElementException, TimeoutException):
+                result = None
+
+            self.record(cascade, selector, bool(result))
+            if result:
+                self.record_lookup(cascade, attempts)
+                return selector, result
+
+        self.record_lookup(cascade, attempts)
+        return None, None
+
+    def record_cascade(self, cascade, tried_selectors, used_selector):
+        """
+        Record a cascade evaluated elsewhere (e.g. in-page): everything tried
+        before the used selector missed
+        """
+        attempts = 0
+        for selector in tried_selectors:
+            attempts += 1
+            self.record(cascade, selector, selector == used_selector)
+            if selector == used_selector:
+                break
+        self.record_lookup(cascade, attempts)
+
+    def dead_selectors(self):
+        dead = []
+        for cascade, entries in self.stats.items():
+            for selector, entry in entries.items():
+                if entry["hits"] == 0 and entry["misses"] >= config.SELECTOR_DEAD_AFTER:
+                    dead.append({"cascade": cascade, "selector": selector, "misses": entry["misses"]})
+        return dead
+
+    def print_report(self):
+        if not self.lookups:
+            return
+        print("\n🎯 SELECTOR CASCADES")
+        print("-" * 50)
+        for cascade, entry in self.lookups.items():
+            average = entry["attempts"] / entry["fields"] if entry["fields"] else 0
+            print(f"   {cascade:<22} {entry['fields']:>5} lookups  {average:.2f} selectors/lookup")
+
+        dead = self.dead_selectors()
+        if dead:
+            print(f"💀 {len(dead)} selectors never matched (>= {config.SELECTOR_DEAD_AFTER} misses):")
+            for item in dead:
+                print(f"   [{item['cascade']}] {item['selector']}")
+        print("-" * 50)
+
+
+_registry = None
+
+
+def get_selector_registry():
+    """
+    Process-wide registry, so every bot instance learns from (and saves to) the same stats
+    """
+    global _registry
+    if _registry is None:
+        _registry = SelectorRegistry()
+    return _registry
@@ -0,0 +1,141 @@
+import os
+import json
+import time
+from datetime import datetime
+from cryptography.fernet import Fernet, InvalidToken
+import config
+
+# Script injected before the first LinkedIn document loads to restore localStorage
+RESTORE_STORAGE_SCRIPT = """
+(function(items) {
+    if (!location.hostname.endsWith('linkedin.com')) return;
+    try {
+        for (const [key, value] of Object.entries(items)) {
+            if (localStorage.getItem(key) === null) localStorage.setItem(key, value);
+        }
+    } catch (e) {}
+})(%s);
+"""
+
+# Only keep localStorage keys LinkedIn uses for session/feed state
+READ_STORAGE_SCRIPT = """
+const prefixes = arguments[0];
+const items = {};
+for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (prefixes.length === 0 || prefixes.some(p => key.startsWith(p))) {
+        items[key] = localStorage.getItem(key);
+    }
+}
+return items;
+"""
+
+
+class SessionStore:
+    """
+    Encrypted snapshot of LinkedIn cookies and localStorage, so a new browser
+    can start logged in without the manual input() gate
+    """
+
+    def __init__(self, filename=None, key_file=None):
+        self.filename = filename or config.SESSION_SNAPSHOT_FILE
+        self.key_file = key_file or config.SESSION_KEY_FILE
+
+    def get_cipher(self):
+        """
+        Key comes from LINKEDIN_SESSION_KEY, otherwise from a local key file created on first use
+        """
+        key = os.environ.get("LINKEDIN_SESSION_KEY")
+        if not key:
+            if not os.path.exists(self.key_file):
+                with open(self.key_file, 'wb') as f:
+                    f.write(Fernet.generate_key())
+                try:
+                    os.chmod(self.key_file, 0o600)
+                except Exception:
+                    pass
+            with open(self.key_file, 'rb') as f:
+                key = f.read().strip()
+        return Fernet(key)
+
+    def save(self, driver):
+        """
+        Snapshot cookies for all LinkedIn domains plus relevant localStorage
+        """
+        try:
+            # Network.getAllCookies includes cookies from every linkedin.com subdomain
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            cookies = [c for c in cookies if "linkedin.com" in c.get("domain", "")]
+            local_storage = driver.execute_script(READ_STORAGE_SCRIPT, config.SESSION_LOCAL_STORAGE_PREFIXES)
+
+            snapshot = {
+                "saved_at": datetime.now().isoformat(),
+                "cookies": cookies,
+                "local_storage": local_storage or {}
+            }
+            token = self.get_cipher().encrypt(json.dumps(snapshot).encode('utf-8'))
+            with open(self.filename, 'wb') as f:
+                f.write(token)
+            print(f"🔐 Session snapshot saved ({len(cookies)} cookies)")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not save session snapshot: {e}")
+            return False
+
+    def load(self):
+        """
+        Decrypt the snapshot and drop expired cookies
+        Returns None if there is no usable session (missing, unreadable or li_at expired)
+        """
+        if not os.path.exists(self.filename):
+            return None
+        try:
+            with open(self.filename, 'rb') as f:
+                snapshot = json.loads(self.get_cipher().decrypt(f.read()))
+        except (InvalidToken, ValueError, OSError) as e:
+            print(f"⚠️ Could not read session snapshot: {e}")
+            return None
+
+        now = time.time()
+        # Session cookies have expires == -1 and never expire on their own
+        snapshot["cookies"] = [c for c in snapshot.get("cookies", [])
+                               if c.get("expires", -1) <= 0 or c["expires"] > now]
+
+        if not any(c.get("name") == "li_at" for c in snapshot["cookies"]):
+            print("⚠️ Saved LinkedIn session has expired")
+            return None
+
+        return snapshot
+
+    def restore(self, driver):
+        """
+        Restore cookies and localStorage before the first navigation
+        Returns True if a snapshot was applied
+        """
+        snapshot = self.load()
+        if not snapshot:
+            return False
+
+        try:
+            cookie_fields = ["name", "value", "domain", "path", "expires", "httpOnly", "secure", "sameSite"]
+            cookies = [{k: c[k] for k in cookie_fields if k in c} for c in snapshot["cookies"]]
+            for cookie in cookies:
+                # Session cookies (expires -1) must be set without expires, or Chrome drops them as expired
+                if cookie.get("expires", 0) <= 0:
+                    cookie.pop("expires", None)
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+            if snapshot.get("local_storage"):
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": RESTORE_STORAGE_SCRIPT % json.dumps(snapshot["local_storage"])
+                })
+
+            print(f"🔐 Restored saved session from {snapshot.get('saved_at')}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not restore session snapshot: {e}")
+            return False
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
@@ -0,0 +1,157 @@
+import os
+import sys
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from feed_snapshot import list_snapshots, load_snapshot, snapshot_captured_at
+from html_selectors import (parse_html, outermost_urn, top_level_urns, post_urns, node_text,
+                            first_match, ACTOR_TITLE_SELECTOR)
+from sponsor_detection import sponsor_signal
+from content_types import content_type
+from post_age import post_age, posted_at
+from post_selectors import AUTHOR_SELECTORS, POST_CONTENT_SELECTORS
+from feed_pipeline import FeedPipeline, annotate_languages
+import config
+
+
+def find_post_roots(tree):
+    """
+    Post roots as Stage 1 finds them: Ember containers with an actor title, keyed by
+    their outermost URN, skipping feed wrappers that hold more than one post
+    """
+    roots = {}
+    for node in tree.css("[id^='ember']"):
+        title = node.css_first(ACTOR_TITLE_SELECTOR)
+        if title is None:
+            continue
+        urn = outermost_urn(title)
+        key = urn or node.attributes["id"]
+        if key in roots or len(top_level_urns(node)) > 1:
+            continue
+        roots[key] = (node, urn)
+    return roots
+
+
+def snapshot_record(root, urn, captured_at=None):
+    """
+    The same record the live harvester builds in-page, from archived HTML
+    (post ages are relative to captured_at, when the snapshot was taken)
+    """
+    selector_used, author_name = first_match(root, AUTHOR_SELECTORS, 2)
+    sponsor = sponsor_signal(root)
+    post_content_type, content_markers = content_type(root)
+    age_label, age_seconds = post_age(root)
+
+    return {
+        "ember_id": root.attributes["id"],
+        "urn": urn,
+        "reshared_urn": post_urns(root)[1] if urn else None,
+        "author_name": author_name,
+        "selector_used": selector_used,
+        "is_sponsored": sponsor is not None,
+        "sponsor_signal": sponsor,
+        "content_type": post_content_type,
+        "content_markers": content_markers,
+        "age_label": age_label,
+        "posted_at": posted_at(age_seconds, captured_at),
+        "captured_at": captured_at.isoformat() if captured_at else None,
+        "excerpt": node_text(root, config.HARVEST_EXCERPT_CHARS)
+    }
+
+
+def parse_snapshot_html(html, captured_at=None):
+    """
+    Classify every post in a snapshot with the live classifier pipeline (plus post content)
+    """
+    pipeline = FeedPipeline(None)
+    roots = list(find_post_roots(parse_html(html)).values())
+    records = annotate_languages([snapshot_record(root, urn, captured_at) for root, urn in roots])
+
+    posts = []
+    for (root, _), record in zip(roots, records):
+        post = pipeline.classify(record)
+        content_selector, content = first_match(root, POST_CONTENT_SELECTORS, 20)
+        post["content"] = content
+        post["content_length"] = len(content) if content else 0
+        post["content_selector"] = content_selector
+        posts.append(post)
+    return posts
+
+
+def parse_snapshot(path):
+    """
+    Worker: decompress and classify one snapshot
+    """
+    started = time.perf_counter()
+    try:
+        posts = parse_snapshot_html(load_snapshot(path), snapshot_captured_at(path))
+        return {"snapshot": path, "posts": posts, "seconds": round(time.perf_counter() - started, 3)}
+    except Exception as e:
+        return {"snapshot": path, "posts": [], "error": str(e)}
+
+
+def parse_archive(directory=None, workers=None):
+    """
+    Re-run author/sponsor/language/content extraction over every archived snapshot,
+    one process per CPU, without a browser
+    """
+    snapshots = list_snapshots(directory)
+    if not snapshots:
+        print(f"❌ No snapshots found in {directory or config.FEED_SNAPSHOT_DIR}")
+        return None
+
+    workers = workers or config.SNAPSHOT_PARSER_WORKERS or os.cpu_count()
+    print(f"🗂️ Parsing {len(snapshots)} snapshots with {workers} workers...")
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        snapshot_results = list(pool.map(parse_snapshot, snapshots, chunksize=max(1, len(snapshots) // (workers * 4))))
+
+    elapsed = time.perf_counter() - started
+    posts = [post for result in snapshot_results for post in result["posts"]]
+    failed = [result for result in snapshot_results if result.get("error")]
+
+    results = {
+        "parse_timestamp": datetime.now().isoformat(),
+        "snapshots": snapshot_results,
+        "summary": {
+            "snapshots_parsed": len(snapshots) - len(failed),
+            "snapshots_failed": len(failed),
+            "total_posts": len(posts),
+            "normal_posts_count": sum(1 for post in posts if post["post_type"] == "normal"),
+            "sponsored_posts_count": sum(1 for post in posts if post["post_type"] == "sponsored"),
+            "skipped_language_posts_count": sum(1 for post in posts if post["post_type"] == "skipped_language"),
+            "stale_posts_count": sum(1 for post in posts if post.get("is_stale")),
+            "seconds": round(elapsed, 2),
+            "snapshots_per_minute": round(len(snapshots) / elapsed * 60, 1) if elapsed else 0,
+            "posts_per_minute": round(len(posts) / elapsed * 60, 1) if elapsed else 0
+        }
+    }
+
+    summary = results["summary"]
+    print(f"✅ Parsed {summary['total_posts']} posts from {summary['snapshots_parsed']} snapshots in {elapsed:.1f}s "
+          f"({summary['snapshots_per_minute']} snapshots/min, {summary['posts_per_minute']} posts/min)")
+    print(f"   👤 Normal: {summary['normal_posts_count']}  📢 Sponsored: {summary['sponsored_posts_count']}  "
+          f"🌐 Skipped languages: {summary['skipped_language_posts_count']}")
+    for result in failed:
+        print(f"❌ {result['snapshot']}: {result['error']}")
+
+    return results
+
+
+def main():
+    """
+    python snapshot_parser.py [snapshot_dir] [output.json]
+    """
+    directory = sys.argv[1] if len(sys.argv) > 1 else None
+    output = sys.argv[2] if len(sys.argv) > 2 else "snapshot_classification.json"
+
+    results = parse_archive(directory)
+    if results:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import json
+import config
+
+# Ads are recognised by structure only: the actor's sub-description label ("Promoted",
+# "Sponsored") or ad-specific attributes. The post body is never read, so a post
+# saying "I got promoted!" is not an ad.
+SPONSOR_LABEL_SELECTORS = [
+    ".update-components-actor__sub-description",
+    ".update-components-actor__description",
+    ".feed-shared-actor__sub-description",
+    ".feed-shared-actor__description",
+    ".update-components-header__text-view"
+]
+
+SPONSOR_ATTRIBUTE_SELECTORS = [
+    "[data-ad-banner]",
+    "[data-is-sponsored='true']",
+    "[data-view-name*='sponsored']",
+    "[data-urn*='sponsored']",
+    "[data-id*='sponsored']"
+]
+
+# In-page sponsorSignal(el): the matched attribute selector or "label:<text>", null for organic posts
+SPONSOR_JS = (
+    "const SPONSOR_LABELS = " + json.dumps([label.lower() for label in config.SPONSOR_LABELS]) + ";\n"
+    "const SPONSOR_LABEL_SELECTORS = " + json.dumps(SPONSOR_LABEL_SELECTORS) + ";\n"
+    "const SPONSOR_ATTRIBUTE_SELECTORS = " + json.dumps(SPONSOR_ATTRIBUTE_SELECTORS) + ";\n"
+    """
+function isSponsorLabel(text) {
+    const label = text.trim().toLowerCase();
+    return SPONSOR_LABELS.some(word => label === word || label.startsWith(word + ' ') || label.startsWith(word + '\\n'));
+}
+
+function sponsorSignal(el) {
+    for (const selector of SPONSOR_ATTRIBUTE_SELECTORS) {
+        if (el.matches(selector) || el.querySelector(selector)) return selector;
+    }
+    for (const selector of SPONSOR_LABEL_SELECTORS) {
+        for (const node of el.querySelectorAll(selector)) {
+            const text = node.textContent || '';
+            if (isSponsorLabel(text)) return 'label:' + text.trim().split('\\n')[0].slice(0, 40);
+        }
+    }
+    return null;
+}
+"""
+)
+
+
+def is_sponsor_label(text):
+    label = text.strip().lower()
+    return any(label == word or label.startswith(word + " ") or label.startswith(word + "\n")
+               for word in (word.lower() for word in config.SPONSOR_LABELS))
+
+
+def sponsor_signal(root):
+    """
+    Same check as the in-page sponsorSignal, on parsed HTML (html_selectors)
+    """
+    for selector in SPONSOR_ATTRIBUTE_SELECTORS:
+        if root.css_first(selector) is not None:
+            return selector
+    for selector in SPONSOR_LABEL_SELECTORS:
+        for node in root.css(selector):
+            text = node.text(deep=True)
+            if is_sponsor_label(text):
+                return "label:" + text.strip().split("\n")[0][:40]
+    return None
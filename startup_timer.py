@@ -0,0 +1,73 @@
+import time
+import json
+from datetime import datetime
+import psutil
+import config
+
+
+def seconds_since_process_start():
+    """
+    Interpreter startup plus module imports so far (called once the imports are done)
+    """
+    return max(time.time() - psutil.Process().create_time(), 0.0)
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase takes (imports, driver resolution,
+    Chrome spawn, first navigation, feed ready)
+    """
+
+    def __init__(self, imports_seconds=None):
+        self.started_at = time.perf_counter()
+        self._last_mark = self.started_at
+        self.phases = []
+
+        if imports_seconds is not None:
+            self.phases.append(("imports", imports_seconds))
+
+    def mark(self, phase):
+        """
+        Close the current phase under the given name
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def skip(self):
+        """
+        Restart the clock without recording (e.g. to exclude manual login time)
+        """
+        self._last_mark = time.perf_counter()
+
+    def as_dict(self):
+        """
+        Seconds per phase name; a phase recorded more than once (e.g. a retried launch) is summed
+        """
+        timings = {}
+        for phase, seconds in self.phases:
+            timings[phase] = timings.get(phase, 0) + seconds
+        timings = {phase: round(seconds, 3) for phase, seconds in timings.items()}
+        timings["total"] = round(sum(seconds for _, seconds in self.phases), 3)
+        return timings
+
+    def print_report(self):
+        print("\n⏱️  STARTUP TIMING")
+        print("-" * 40)
+        for phase, seconds in self.phases:
+            print(f"   {phase:<20} {seconds:>7.2f}s")
+        print(f"   {'total':<20} {self.as_dict()['total']:>7.2f}s")
+        print("-" * 40)
+
+    def save(self, mode):
+        """
+        Append this startup to the timing log so cold-start regressions can be tracked
+        """
+        if not config.STARTUP_TIMING_LOG:
+            return
+        try:
+            entry = {"timestamp": datetime.now().isoformat(), "mode": mode, "timings": self.as_dict()}
+            with open(config.STARTUP_TIMING_LOG, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            print(f"⚠️ Could not save startup timings: {e}")
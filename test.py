@@ -1,5 +1,6 @@
 import time
 import json
+import itertools
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -7,9 +8,25 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException,
 from chrome_initialize import LinkedInCommentBot
 from duplicate_cleanup import DuplicateAuthorCleanup
 from comment_action import LinkedInCommentAction
+from dom_pruner import MemoryCleaner
+from dual_browser import start_dual_browsers
+from feed_harvester import FeedHarvester
+from post_selectors import AUTHOR_SELECTORS, POST_CONTENT_SELECTORS, READ_MORE_SELECTORS
+from feed_pipeline import FeedPipeline, classification_summary
+from language_id import identify_language, is_skipped_language
+from scroll_engine import ScrollEngine
+from post_index import PostIndex
+from html_selectors import parse_fragment, selector_text, post_urns
+from sponsor_detection import sponsor_signal
+from content_types import content_type, is_extracted_content_type
+from post_age import post_age, posted_at, age_days, is_stale
+from driver_watchdog import DriverWatchdog
 import config
 
 class LinkedInComprehensiveScanner(LinkedInCommentBot):
+    AUTHOR_SELECTORS = AUTHOR_SELECTORS
+    POST_CONTENT_SELECTORS = POST_CONTENT_SELECTORS
+
     def __init__(self):
         super().__init__()
         self.scan_results = {
@@ -17,11 +34,14 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
             "posts_data": [],
             "normal_posts": [],
             "sponsored_posts": [],
-            "vietnamese_posts": [],
+            "skipped_language_posts": [],
             "ember_elements_found": 0,
             "scan_summary": {}
         }
 
+        # Start of the feed scan, for the time-to-first-comment metric
+        self.pipeline_started = None
+
         # Content extraction results (Stage 2)
         self.content_results = {
             "extraction_timestamp": None,
@@ -32,56 +52,15 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
             "content_data": []
         }
 
-    def is_promoted_post(self, post_element):
-        """
-        Simple sponsor/advertising post detection
-        """
-        try:
-            promoted_text = post_element.text.lower()
-            return 'promoted' in promoted_text or 'sponsored' in promoted_text
-        except:
-            return False
+        # Headed writer browser in DUAL_BROWSER_MODE (comments are handed over by URN)
+        self.comment_writer = None
 
-    def is_vietnamese_post(self, post_element):
+    @staticmethod
+    def detect_language(post_text):
         """
-        Detect Vietnamese language posts
+        Language code of already-fetched post text (character n-gram identification)
         """
-        try:
-            post_text = post_element.text
-
-            # Vietnamese Unicode ranges (Vietnamese diacritics)
-            vietnamese_chars = [
-                'à', 'á', 'ả', 'ã', 'ạ', 'ă', 'ằ', 'ắ', 'ẳ', 'ẵ', 'ặ',
-                'â', 'ầ', 'ấ', 'ẩ', 'ẫ', 'ậ', 'è', 'é', 'ẻ', 'ẽ', 'ẹ',
-                'ê', 'ề', 'ế', 'ể', 'ễ', 'ệ', 'ì', 'í', 'ỉ', 'ĩ', 'ị',
-                'ò', 'ó', 'ỏ', 'õ', 'ọ', 'ô', 'ồ', 'ố', 'ổ', 'ỗ', 'ộ',
-                'ơ', 'ờ', 'ớ', 'ở', 'ỡ', 'ợ', 'ù', 'ú', 'ủ', 'ũ', 'ụ',
-                'ư', 'ừ', 'ứ', 'ử', 'ữ', 'ự', 'ỳ', 'ý', 'ỷ', 'ỹ', 'ỵ',
-                'đ', 'Đ'
-            ]
-
-            # Common Vietnamese words
-            vietnamese_words = [
-                'và', 'của', 'trong', 'với', 'cho', 'từ', 'theo', 'về',
-                'được', 'có', 'là', 'một', 'các', 'này', 'để', 'những',
-                'như', 'khi', 'hay', 'đã', 'sẽ', 'không', 'tôi', 'bạn',
-                'chúng', 'việc', 'công', 'ty', 'doanh', 'nghiệp'
-            ]
-
-            # Check for Vietnamese characters
-            vietnamese_char_count = sum(1 for char in post_text if char in vietnamese_chars)
-
-            # Check for Vietnamese words
-            text_lower = post_text.lower()
-            vietnamese_word_count = sum(1 for word in vietnamese_words if word in text_lower)
-
-            # Consider it Vietnamese if:
-            # - Has 3+ Vietnamese diacritical characters, OR
-            # - Has 2+ common Vietnamese words
-            return vietnamese_char_count >= 3 or vietnamese_word_count >= 2
-
-        except Exception:
-            return False
+        return identify_language(post_text)
 
     def extract_author_name(self, element):
         """
@@ -93,152 +72,138 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
         }
 
         try:
-            # Primary selector from HTML tag pattern
-            primary_selector = ".update-components-actor__title span.hoverable-link-text span span:first-child"
-
-            # Fallback selectors
-            author_selectors = [
-                primary_selector,
-                ".update-components-actor__title .hoverable-link-text",
-                ".update-components-actor__title span[aria-hidden='true']",
-                ".update-components-actor__name span",
-                ".feed-shared-actor__name span"
-            ]
+            def probe(selector):
+                author_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
+                return author_text if len(author_text) > 2 else None
 
-            for selector in author_selectors:
-                try:
-                    author_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    author_text = author_elem.text.strip()
-                    if author_text and len(author_text) > 2:
-                        author_data["author_name"] = author_text
-                        author_data["selector_used"] = selector
-                        break
-                except NoSuchElementException:
-                    continue
+            selector, author_text = self.selectors.first_match("author_name", self.AUTHOR_SELECTORS, probe)
+            if author_text:
+                author_data["author_name"] = author_text
+                author_data["selector_used"] = selector
 
         except Exception as e:
             author_data["extraction_error"] = str(e)
 
         return author_data
 
-    def scroll_to_bottom(self):
+    def scroll_to_bottom(self, on_batch=None, count_posts=None, max_posts=None):
         """
-        Scroll down three times to load more content via LinkedIn's infinite scrolling
+        Scroll LinkedIn's infinite feed until MAX_POSTS_TO_SCAN posts, a growth plateau
+        or SCROLL_TIME_BUDGET is reached (see ScrollEngine)
+        on_batch is called after each scroll (e.g. to harvest the newly loaded posts)
         """
-        print("📜 Scrolling down to load more content...")
-
-        for i in range(3):
-            # Scroll down to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-            # Wait for new content to load
-            time.sleep(2)
-            print(f"   Scroll {i+1}/3 completed")
-
-        print("✅ Finished scrolling - content loaded")
+        engine = ScrollEngine(self.get_dom_reader(), on_batch=on_batch, count_posts=count_posts, max_posts=max_posts)
+        return engine.run()
 
     def scan_all_posts(self):
         """
         Main scanning function that extracts posts, authors, and sponsor status
         """
+        for _ in self.stream_scan():
+            pass
+        return self.scan_results
+
+    def stream_scan(self, read_only=True):
+        """
+        Stage 1 as a generator: each post is classified, recorded in scan_results and
+        yielded as soon as its scroll batch is harvested. The summary is written when
+        the feed pass ends (or the consumer closes the stream). read_only=False when
+        the consumer comments while the scan runs (streaming mode): no lean profile then.
+        """
         print("🔍 Starting comprehensive LinkedIn post scan...")
+        self.pipeline_started = time.perf_counter()
+
+        # Read-only stage: use the lean render profile if enabled
+        if read_only:
+            self.enable_lean_render()
 
         # Wait for page to settle
         time.sleep(3)
 
-        # Scroll to bottom to load all content
-        self.scroll_to_bottom()
+        # One pass: scroll + harvest a snapshot per post, then run the registered classifiers over it
+        pipeline = FeedPipeline(self, self.AUTHOR_SELECTORS)
 
-        # Find all elements with ember IDs
-        ember_elements = self.driver.find_elements(By.CSS_SELECTOR, "[id^='ember']")
-        self.scan_results["ember_elements_found"] = len(ember_elements)
-        print(f"📊 Found {len(ember_elements)} Ember elements")
+        # Stage 1 prunes only posts Stage 2 will never revisit (sponsored / skipped language)
+        memory_cleaner = MemoryCleaner(self.driver)
 
-        # Find post containers that have author elements
-        post_containers = []
+        processed = 0
+        try:
+            # Classify each harvested post (no further browser round-trips)
+            for record in pipeline.snapshots():
+                processed += 1
+                print(f"⚙️ Processing post {processed}...")
 
-        for ember_elem in ember_elements:
-            try:
-                ember_id = ember_elem.get_attribute('id')
-
-                # Check if this ember element contains author name structure
-                if ember_elem.find_elements(By.CSS_SELECTOR, ".update-components-actor__title"):
-                    post_containers.append({
-                        "ember_id": ember_id,
-                        "element": ember_elem,
-                        "type": "post-container"
-                    })
-            except Exception as e:
-                continue
+                try:
+                    post_data = pipeline.classify(record)
+                    is_sponsored = post_data["is_sponsored"]
+                    is_skipped_language = post_data["is_skipped_language"]
+
+                    # Add to appropriate lists
+                    self.scan_results["posts_data"].append(post_data)
+
+                    if is_sponsored:
+                        self.scan_results["sponsored_posts"].append(post_data)
+                        print(f"📢 Sponsored post found: {post_data['author_name']} (ID: {record['ember_id']})")
+                    elif is_skipped_language:
+                        self.scan_results["skipped_language_posts"].append(post_data)
+                        print(f"🌐 Skipped-language post ({post_data['language']}) found: {post_data['author_name']} (ID: {record['ember_id']})")
+                    else:
+                        self.scan_results["normal_posts"].append(post_data)
+                        print(f"👤 Normal post found: {post_data['author_name']} (ID: {record['ember_id']})")
+
+                    # Stage 2 filters excluded content types and stale posts out too, so they are prunable as well
+                    prunable = (is_sponsored or is_skipped_language or post_data["is_skipped_content_type"]
+                                or post_data["is_stale"])
+                    memory_cleaner.post_done(record["ember_id"], prunable=prunable)
 
-        print(f"📝 Found {len(post_containers)} post containers with authors")
+                except Exception as e:
+                    print(f"❌ Error processing container {record['ember_id']}: {e}")
+                    continue
 
-        # Process each post container
-        for i, container in enumerate(post_containers):
-            print(f"⚙️ Processing post {i+1}/{len(post_containers)}...")
+                yield post_data
 
-            try:
-                # Scroll element into view
-                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", container["element"])
-                time.sleep(0.5)
-
-                # Extract author information
-                author_data = self.extract_author_name(container["element"])
-
-                # Check if it's a sponsored post
-                is_sponsored = self.is_promoted_post(container["element"])
-
-                # Check if it's a Vietnamese post
-                is_vietnamese = self.is_vietnamese_post(container["element"])
-
-                # Determine post type with priority: sponsored > vietnamese > normal
-                if is_sponsored:
-                    post_type = "sponsored"
-                elif is_vietnamese:
-                    post_type = "vietnamese"
-                else:
-                    post_type = "normal"
-
-                # Create post data
-                post_data = {
-                    "ember_id": container["ember_id"],
-                    "author_name": author_data["author_name"],
-                    "is_sponsored": is_sponsored,
-                    "is_vietnamese": is_vietnamese,
-                    "selector_used": author_data.get("selector_used"),
-                    "post_type": post_type
-                }
-
-                # Add to appropriate lists
-                self.scan_results["posts_data"].append(post_data)
-
-                if is_sponsored:
-                    self.scan_results["sponsored_posts"].append(post_data)
-                    print(f"📢 Sponsored post found: {author_data['author_name']} (ID: {container['ember_id']})")
-                elif is_vietnamese:
-                    self.scan_results["vietnamese_posts"].append(post_data)
-                    print(f"🇻🇳 Vietnamese post found: {author_data['author_name']} (ID: {container['ember_id']})")
-                else:
-                    self.scan_results["normal_posts"].append(post_data)
-                    print(f"👤 Normal post found: {author_data['author_name']} (ID: {container['ember_id']})")
+        finally:
+            self.finish_scan(pipeline, memory_cleaner, processed)
+
+    def finish_scan(self, pipeline, memory_cleaner, processed):
+        """
+        Stage 1 wrap-up once the feed pass has ended: snapshot, summary and stats
+        """
+        harvester = pipeline.harvester
+        reader = harvester.reader
+        self.scan_results["scroll_stats"] = pipeline.scroll_stats
 
+        # Archive the rendered feed for offline re-classification (snapshot_parser.py)
+        if config.SAVE_FEED_SNAPSHOTS:
+            try:
+                from feed_snapshot import save_snapshot
+                self.scan_results["snapshot_file"] = save_snapshot(self.driver.page_source)
             except Exception as e:
-                print(f"❌ Error processing container {container['ember_id']}: {e}")
-                continue
+                print(f"⚠️ Could not save feed snapshot: {e}")
+
+        self.scan_results["ember_elements_found"] = harvester.ember_count
+        print(f"📊 Found {harvester.ember_count} Ember elements")
+        print(f"📝 Found {processed} post containers with authors ({harvester.round_trips} harvest round-trips)")
 
         # Generate summary
         self.scan_results["scan_summary"] = {
             "total_ember_elements": self.scan_results["ember_elements_found"],
-            "total_posts_processed": len(post_containers),
-            "total_posts_with_authors": len(self.scan_results["posts_data"]),
-            "normal_posts_count": len(self.scan_results["normal_posts"]),
-            "sponsored_posts_count": len(self.scan_results["sponsored_posts"]),
-            "vietnamese_posts_count": len(self.scan_results["vietnamese_posts"]),
-            "unique_authors_count": len(set([p["author_name"] for p in self.scan_results["posts_data"] if p["author_name"]]))
+            "total_posts_processed": processed,
+            "harvest_round_trips": harvester.round_trips,
+            **classification_summary(self.scan_results["posts_data"]),
+            "reshares_count": len(harvester.index.reshares())
         }
 
+        memory_cleaner.cleanup()
+        self.scan_results["memory_cleanup"] = memory_cleaner.summary()
+
+        self.scan_results["render_stats"] = self.get_render_stats(pipeline.scroll_stats)
+        self.print_render_stats(self.scan_results["render_stats"])
+
+        self.scan_results["transport_stats"] = reader.stats.as_dict()
+        reader.stats.print_report()
+
         print("✅ Comprehensive scan completed!")
-        return self.scan_results
 
     def save_results_to_json(self, filename="linkedin_comprehensive_scan.json"):
         """
@@ -257,23 +222,13 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
         Find the 'Read More' button using multiple selector strategies
         Returns the button element if found, None otherwise
         """
-        read_more_selectors = [
-            # Primary selector from HTML tag analysis
-            "div.fie-impression-container div[class*='biSBAHR'] > div > button",
-            # Alternative selectors for different LinkedIn layouts
-            "button[aria-label*='more' i]",
-            "button span[class*='see-more']",
-            ".feed-shared-update-v2__description button",
-            "button[data-control-name*='see_more']"
-        ]
-
-        for selector in read_more_selectors:
-            try:
-                button = post_element.find_element(By.CSS_SELECTOR, selector)
-                if button.is_displayed():
-                    return button
-            except (NoSuchElementException, TimeoutException):
-                continue
+        def probe(selector):
+            button = post_element.find_element(By.CSS_SELECTOR, selector)
+            return button if button.is_displayed() else None
+
+        _, button = self.selectors.first_match("read_more", READ_MORE_SELECTORS, probe)
+        if button:
+            return button
 
         # Fallback: look for buttons containing "more" text
         try:
@@ -296,6 +251,7 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
             "content_expanded": False,
             "content": None,
             "content_length": 0,
+            "extraction_mode": "live",
             "extraction_time": datetime.now().isoformat(),
             "selectors_used": [],
             "errors": []
@@ -338,36 +294,25 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
                     print(f"❌ Error clicking Read More: {e}")
 
             # Step 2: Extract content using multiple strategies
-            content_selectors = [
-                # Primary selector from HTML tag analysis
-                ".fie-impression-container div[class*='biSBAHR'] > div > div",
-                # Alternative content selectors
-                ".fie-impression-container .break-words",
-                ".feed-shared-update-v2__description",
-                ".feed-shared-update-v2__description-wrapper",
-                "[data-test-id='main-feed-activity-card'] .break-words",
-                ".update-components-text"
-            ]
-
-            content_found = False
-            for selector in content_selectors:
-                try:
-                    content_elements = post_element.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in content_elements:
-                        content_text = elem.text.strip()
-                        if content_text and len(content_text) > 20:  # Only consider substantial content
-                            content_data["content"] = content_text
-                            content_data["content_length"] = len(content_text)
-                            content_data["selectors_used"].append(selector)
-                            content_found = True
-                            print(f"✅ Extracted content ({len(content_text)} chars) using: {selector}")
-                            break
-
-                    if content_found:
-                        break
-
-                except (NoSuchElementException, TimeoutException):
-                    continue
+            if config.LOCAL_SELECTOR_EVALUATION:
+                # One WebDriver call: the expanded post's HTML, every selector evaluated locally
+                self.extract_from_post_html(post_element, content_data)
+                return content_data
+
+            def probe(selector):
+                for elem in post_element.find_elements(By.CSS_SELECTOR, selector):
+                    content_text = elem.text.strip()
+                    if content_text and len(content_text) > 20:  # Only consider substantial content
+                        return content_text
+                return None
+
+            selector, content_text = self.selectors.first_match("post_content", self.POST_CONTENT_SELECTORS, probe)
+            content_found = content_text is not None
+            if content_found:
+                content_data["content"] = content_text
+                content_data["content_length"] = len(content_text)
+                content_data["selectors_used"].append(selector)
+                print(f"✅ Extracted content ({len(content_text)} chars) using: {selector}")
 
             if not content_found:
                 content_data["errors"].append("No content found with any selector")
@@ -379,6 +324,38 @@ class LinkedInComprehensiveScanner(LinkedInCommentBot):
 
         return content_data
 
+    def extract_from_post_html(self, post_element, content_data):
+        """
+        Fetch the post root's outerHTML once and evaluate the content, author and
+        metadata selectors in Python (same cascades and registry stats as the live path)
+        """
+        post_html = post_element.get_attribute("outerHTML")
+        root = parse_fragment(post_html)
+        content_data["extraction_mode"] = "local"
+
+        selector, content_text = self.selectors.first_match(
+            "post_content", self.POST_CONTENT_SELECTORS, lambda selector: selector_text(root, selector, 20)
+        )
+        if content_text:
+            content_data["content"] = content_text
+            content_data["content_length"] = len(content_text)
+            content_data["selectors_used"].append(selector)
+            print(f"✅ Extracted content ({len(content_text)} chars) using: {selector} (local)")
+        else:
+            content_data["errors"].append("No content found with any selector")
+            print("❌ No content could be extracted")
+
+        author_selector, author_text = self.selectors.first_match(
+            "author_name", self.AUTHOR_SELECTORS, lambda selector: selector_text(root, selector, 2)
+        )
+        content_data["author_name"] = author_text
+        content_data["author_selector"] = author_selector
+        content_data["urn"], content_data["reshared_urn"] = post_urns(root)
+        content_data["is_sponsored"] = sponsor_signal(root) is not None
+        content_data["content_type"], _ = content_type(root)
+        content_data["age_label"], age_seconds = post_age(root)
+        content_data["posted_at"] = posted_at(age_seconds)
+
     def extract_comment_content(self, post_element, ember_id):
         """
         Extract existing comments from a specific post for analysis
@@ -564,35 +541,52 @@ Please generate a comment that naturally fits this existing conversation style a
         """
         Apply configuration-based filters to posts
         """
-        filtered_posts = []
+        return [post for post in posts if self.passes_content_filters(post)]
 
-        for post in posts:
-            author_name = post.get("author_name", "")
+    def passes_content_filters(self, post):
+        """
+        Configuration-based filters for a single post (usable on a post stream)
+        """
+        reason = self.content_filter_reason(post)
+        if reason:
+            print(f"⏭️  Skipping {reason}")
+            return False
+        return True
 
-            # Apply author filtering
-            if config.EXTRACT_FROM_SPECIFIC_AUTHORS:
-                if author_name not in config.EXTRACT_FROM_SPECIFIC_AUTHORS:
-                    print(f"⏭️  Skipping {author_name} - not in specific authors list")
-                    continue
+    @staticmethod
+    def content_filter_reason(post):
+        """
+        Why the configuration filters exclude a post, None if it passes (no output,
+        so duplicate cleanup can check eligibility before choosing which post to keep)
+        """
+        author_name = post.get("author_name", "")
 
-            if config.SKIP_AUTHORS:
-                if author_name in config.SKIP_AUTHORS:
-                    print(f"⏭️  Skipping {author_name} - in skip authors list")
-                    continue
+        # Apply author filtering
+        if config.EXTRACT_FROM_SPECIFIC_AUTHORS:
+            if author_name not in config.EXTRACT_FROM_SPECIFIC_AUTHORS:
+                return f"{author_name} - not in specific authors list"
 
-            # Apply sponsored filter
-            if not config.EXTRACT_FROM_SPONSORED and post.get("is_sponsored", False):
-                print(f"⏭️  Skipping sponsored post by {author_name}")
-                continue
+        if config.SKIP_AUTHORS:
+            if author_name in config.SKIP_AUTHORS:
+                return f"{author_name} - in skip authors list"
 
-            # Apply Vietnamese filter
-            if config.SKIP_VIETNAMESE_POSTS and post.get("is_vietnamese", False):
-                print(f"⏭️  Skipping Vietnamese post by {author_name}")
-                continue
+        # Apply sponsored filter
+        if not config.EXTRACT_FROM_SPONSORED and post.get("is_sponsored", False):
+            return f"sponsored post by {author_name}"
 
-            filtered_posts.append(post)
+        # Apply language filter
+        if is_skipped_language(post.get("language"), post.get("language_shares")):
+            return f"{post['language']} post by {author_name} ({post.get('language_shares') or 'skipped language'})"
 
-        return filtered_posts
+        # Apply age filter (re-checked now, Stage 2 may run long after the scan)
+        if is_stale(post.get("posted_at")):
+            return f"{author_name} - posted {age_days(post['posted_at'])} days ago (limit {config.MAX_POST_AGE_DAYS})"
+
+        # Apply content type filter (EXTRACT_CONTENT_TYPES / SKIP_CONTENT_TYPES)
+        if not is_extracted_content_type(post.get("content_type")):
+            return f"{post['content_type']} post by {author_name}"
+
+        return None
 
     def extract_content_from_valid_posts(self, valid_posts=None):
         """
@@ -619,43 +613,93 @@ Please generate a comment that naturally fits this existing conversation style a
             print("❌ No valid posts found to process")
             return
 
-        # Apply configuration filters
-        filtered_posts = self.apply_content_filters(valid_posts)
+        # A generator of posts (streaming mode) is filtered and limited lazily, as posts arrive
+        streaming = not isinstance(valid_posts, list)
+        if self.pipeline_started is None:
+            self.pipeline_started = time.perf_counter()
+
+        if streaming:
+            filtered_posts = (post for post in valid_posts if self.passes_content_filters(post))
+            if config.MAX_POSTS_TO_PROCESS > 0:
+                filtered_posts = itertools.islice(filtered_posts, config.MAX_POSTS_TO_PROCESS)
+            total_posts = "?"
+            print("📊 Streaming posts into content extraction as they are discovered...")
+        else:
+            # Apply configuration filters
+            filtered_posts = self.apply_content_filters(valid_posts)
 
-        # Apply post limit from config
-        if config.MAX_POSTS_TO_PROCESS > 0:
-            filtered_posts = filtered_posts[:config.MAX_POSTS_TO_PROCESS]
-            print(f"📊 Limited to {config.MAX_POSTS_TO_PROCESS} posts as per configuration")
+            # Apply post limit from config
+            if config.MAX_POSTS_TO_PROCESS > 0:
+                filtered_posts = filtered_posts[:config.MAX_POSTS_TO_PROCESS]
+                print(f"📊 Limited to {config.MAX_POSTS_TO_PROCESS} posts as per configuration")
 
-        if not filtered_posts:
-            print("❌ No posts remaining after applying filters")
-            return
+            if not filtered_posts:
+                print("❌ No posts remaining after applying filters")
+                return
 
-        self.content_results["total_posts_processed"] = len(filtered_posts)
-        print(f"📊 Processing {len(filtered_posts)} filtered posts for content extraction...")
+            total_posts = len(filtered_posts)
+            self.content_results["total_posts_processed"] = total_posts
+            print(f"📊 Processing {total_posts} filtered posts for content extraction...")
         print(f"⚙️  Configuration: {config.DELAY_BETWEEN_POSTS}s delay, auto-expand: {config.AUTO_EXPAND_READ_MORE}")
 
         # Initialize comment action if auto-commenting is enabled
         commenter = None
         comments_posted = 0
         comment_results = []
+        queued_content = {}  # Post URN -> content_data of comments handed to the writer browser
 
         if config.AUTO_COMMENT_AFTER_EXTRACTION:
             print(f"💬 Auto-commenting enabled: will comment after each content extraction")
             print(f"📊 Max comments per session: {config.MAX_COMMENTS_PER_SESSION}")
             print(f"⏱️  Comment delay: {config.COMMENT_DELAY_AFTER_EXTRACTION}s")
 
-            commenter = LinkedInCommentAction()
-            commenter.driver = self.driver  # Use the same browser session
-            commenter.cleanup = lambda: None  # Prevent commenter from closing our browser
+            if self.comment_writer:
+                print("✍️  Dual-browser mode: comments are queued for the headed writer browser")
+            else:
+                commenter = LinkedInCommentAction()
+                commenter.driver = self.driver  # Use the same browser session
+                commenter.cleanup = lambda: None  # Prevent commenter from closing our browser
+        commenting_enabled = commenter is not None or self.comment_writer is not None
+
+        def comments_counted():
+            # The writer's queued comments hold a slot until it confirms or fails them
+            return self.comment_writer.committed_count() if self.comment_writer else comments_posted
+
+        # Stage 2 writes from this browser: restore full rendering first
+        if commenter is not None:
+            self.disable_lean_render()
+
+        # Posts are pruned from the DOM once they are fully processed
+        memory_cleaner = MemoryCleaner(self.driver)
+
+        # Posts are located by URN (current ember id resolved in-page), ember id as fallback
+        post_index = PostIndex()
+
+        # Restarts a crashed, hung or bloated browser and resumes with the remaining posts
+        # (single-browser setup only: restarts go through initialize_driver; a streamed
+        # feed pass cannot survive a page reload, so streaming runs without it)
+        watchdog = DriverWatchdog(self) if config.WATCHDOG_ENABLED and not self.comment_writer and not streaming else None
 
         # Process each valid post
         processed_count = 0
+        i = 0
+        lost_keys = set()  # Posts not found again after a browser restart
         for i, post_data in enumerate(filtered_posts, 1):
+            if watchdog:
+                reason = watchdog.check()
+                if reason:
+                    lost_keys |= self.resume_after_restart(watchdog, reason, filtered_posts[i - 1:], commenter, memory_cleaner)
+
             ember_id = post_data.get("ember_id")
             author_name = post_data.get("author_name", "Unknown")
+            self.drain_transfer_log()
 
-            print(f"\n--- Processing post {i}/{len(filtered_posts)} ---")
+            if PostIndex.key_for(post_data) in lost_keys:
+                print(f"⏭️  Skipping post by {author_name} - not found in the reloaded feed")
+                continue
+            post_index.add(post_data)
+
+            print(f"\n--- Processing post {i}/{total_posts} ---")
             print(f"👤 Author: {author_name}")
             print(f"🔖 Ember ID: {ember_id}")
 
@@ -664,18 +708,21 @@ Please generate a comment that naturally fits this existing conversation style a
 
             while retry_count <= config.MAX_RETRIES_PER_POST and not success:
                 try:
-                    # Find the post element by ember ID
-                    post_element = self.driver.find_element(By.ID, ember_id)
+                    # Find the post element by URN (or ember ID for posts without one), in one call.
+                    # The handle re-locates the node if LinkedIn re-renders it later.
+                    post_index.resolve(self.driver, PostIndex.key_for(post_data))
+                    post_element = post_index.handle(self.driver, PostIndex.key_for(post_data))
+                    ember_id = post_element.ember_id
 
                     # Scroll into view with configured delay
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", post_element)
+                    post_element.execute_script("arguments[0].scrollIntoView({block: 'center'});")
                     time.sleep(config.SCROLL_DELAY)
 
                     # Extract content (this will expand "Read More" if needed)
                     content_data = self.extract_post_content(post_element, ember_id)
 
-                    # Add author information to content data
-                    content_data["author_name"] = author_name
+                    # Add author information to content data (Stage 1 name first, then the one read from the post HTML)
+                    content_data["author_name"] = post_data.get("author_name") or content_data.get("author_name") or author_name
 
                     # Apply content length filters
                     if content_data.get("content"):
@@ -710,8 +757,8 @@ Please generate a comment that naturally fits this existing conversation style a
                     success = True
 
                     # ========== IMMEDIATE COMMENTING AFTER EXTRACTION ==========
-                    if (commenter and
-                        comments_posted < config.MAX_COMMENTS_PER_SESSION and
+                    if (commenting_enabled and
+                        comments_counted() < config.MAX_COMMENTS_PER_SESSION and
                         content_data.get("content") and
                         (config.COMMENT_ON_EXTRACTION_FAILURE or not content_data.get("errors"))):
 
@@ -731,21 +778,26 @@ Please generate a comment that naturally fits this existing conversation style a
                                 ".feed-shared-social-action-bar__action-button[data-control-name*='comment']"
                             ]
 
+                            def find_comment_button(selector):
+                                comment_button = post_element.find_element(By.CSS_SELECTOR, selector)
+                                return comment_button if comment_button.is_displayed() else None
+
+                            # The registry only locates the button; the click happens once, outside the cascade
+                            selector, comment_button = self.selectors.first_match(
+                                "reveal_comments", comment_button_selectors, find_comment_button
+                            )
                             comment_section_opened = False
-                            for selector in comment_button_selectors:
+                            if comment_button:
                                 try:
-                                    comment_button = post_element.find_element(By.CSS_SELECTOR, selector)
-                                    if comment_button.is_displayed():
-                                        # Scroll button into view and click
-                                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", comment_button)
-                                        time.sleep(0.5)
-                                        comment_button.click()
-                                        time.sleep(2)  # Wait for comments to load
-                                        comment_section_opened = True
-                                        print(f"✅ Opened comment section using: {selector}")
-                                        break
-                                except (NoSuchElementException, ElementClickInterceptedException):
-                                    continue
+                                    # Scroll button into view and click
+                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", comment_button)
+                                    time.sleep(0.5)
+                                    comment_button.click()
+                                    time.sleep(2)  # Wait for comments to load
+                                    comment_section_opened = True
+                                    print(f"✅ Opened comment section using: {selector}")
+                                except ElementClickInterceptedException as e:
+                                    print(f"⚠️ Comment button click was intercepted: {e}")
 
                             if not comment_section_opened:
                                 print("⚠️ Could not open comment section - proceeding without comment analysis")
@@ -765,48 +817,72 @@ Please generate a comment that naturally fits this existing conversation style a
 
                             print(f"💭 Generated comment: {comment_text[:60]}...")
 
-                            # Post the comment
-                            comment_success = commenter.post_comment_by_ember_id(ember_id, comment_text)
-
-                            # Record comment result
-                            comment_result = {
-                                "ember_id": ember_id,
-                                "author_name": author_name,
-                                "comment_text": comment_text,
-                                "comment_success": comment_success,
-                                "post_content_preview": content_data.get("content", "")[:100]
-                            }
-                            comment_results.append(comment_result)
-
-                            if comment_success:
-                                comments_posted += 1
-                                print(f"✅ Comment posted successfully! ({comments_posted}/{config.MAX_COMMENTS_PER_SESSION})")
-
-                                # Add comment data to content results
-                                content_data["comment_posted"] = True
+                            if self.comment_writer:
+                                # Hand the comment to the writer browser; reading carries on during its cooldown
+                                queued = self.comment_writer.submit(
+                                    post_data.get("urn"),
+                                    comment_text,
+                                    ember_id=ember_id,
+                                    author_name=author_name,
+                                    post_content_preview=content_data.get("content", "")[:100]
+                                )
+                                content_data["comment_queued"] = queued
                                 content_data["comment_text"] = comment_text
+                                if queued:
+                                    queued_content[post_data.get("urn")] = content_data
+                                    self.mark_first_comment()
+                                    print(f"📨 Comment queued for the writer browser ({comments_counted()}/{config.MAX_COMMENTS_PER_SESSION})")
+                                else:
+                                    content_data["comment_posted"] = False
+                                    content_data["comment_error"] = "No post URN to hand over"
                             else:
-                                print(f"❌ Comment posting failed")
-                                content_data["comment_posted"] = False
-                                content_data["comment_error"] = "Posting failed"
+                                # Post the comment
+                                comment_success = commenter.post_comment_by_ember_id(post_element.ember_id, comment_text)
+
+                                # Record comment result
+                                comment_result = {
+                                    "ember_id": ember_id,
+                                    "author_name": author_name,
+                                    "comment_text": comment_text,
+                                    "comment_success": comment_success,
+                                    "post_content_preview": content_data.get("content", "")[:100]
+                                }
+                                comment_results.append(comment_result)
+
+                                if comment_success:
+                                    comments_posted += 1
+                                    self.mark_first_comment()
+                                    print(f"✅ Comment posted successfully! ({comments_posted}/{config.MAX_COMMENTS_PER_SESSION})")
+
+                                    # Add comment data to content results
+                                    content_data["comment_posted"] = True
+                                    content_data["comment_text"] = comment_text
+                                else:
+                                    print(f"❌ Comment posting failed")
+                                    content_data["comment_posted"] = False
+                                    content_data["comment_error"] = "Posting failed"
 
                         except Exception as e:
                             print(f"❌ Error during commenting: {e}")
                             content_data["comment_posted"] = False
                             content_data["comment_error"] = str(e)
 
-                    elif commenter and comments_posted >= config.MAX_COMMENTS_PER_SESSION:
+                    elif commenting_enabled and comments_counted() >= config.MAX_COMMENTS_PER_SESSION:
                         print(f"⏭️ Skipping comment - reached max comments per session ({config.MAX_COMMENTS_PER_SESSION})")
                         content_data["comment_posted"] = False
                         content_data["comment_skipped"] = "Max comments reached"
 
-                    elif commenter and not content_data.get("content"):
+                    elif commenting_enabled and not content_data.get("content"):
                         print(f"⏭️ Skipping comment - no content extracted")
                         content_data["comment_posted"] = False
                         content_data["comment_skipped"] = "No content"
 
-                    # Save incrementally if configured
-                    if config.SAVE_CONTENT_INCREMENTALLY and processed_count % 5 == 0:
+                    memory_cleaner.post_done(post_element.ember_id)
+                    post_index.release_element(post_element.key)
+                    post_element = None
+
+                    # Save incrementally if configured (every BATCH_SIZE posts)
+                    if config.SAVE_CONTENT_INCREMENTALLY and config.BATCH_SIZE > 0 and processed_count % config.BATCH_SIZE == 0:
                         self.save_content_results(f"linkedin_content_extraction_partial_{processed_count}.json")
 
                     # Add configured delay between posts
@@ -835,6 +911,17 @@ Please generate a comment that naturally fits this existing conversation style a
                             break
 
                 except Exception as e:
+                    if watchdog and watchdog.is_dead_session_error(e):
+                        # Browser died mid-post: restart and retry without consuming a retry
+                        print(f"💀 Browser session lost while processing {ember_id}: {e}")
+                        lost_keys |= self.resume_after_restart(watchdog, "dead_session", filtered_posts[i - 1:], commenter, memory_cleaner)
+                        if PostIndex.key_for(post_data) in lost_keys:
+                            print(f"⏭️  Skipping post by {author_name} - not found in the reloaded feed")
+                            success = True
+                            break
+                        ember_id = post_data.get("ember_id")
+                        continue
+
                     if retry_count == 0:
                         print(f"❌ Error processing post {ember_id}: {e}")
 
@@ -856,10 +943,31 @@ Please generate a comment that naturally fits this existing conversation style a
                             print("❌ Stopping extraction due to error (CONTINUE_ON_ERROR = False)")
                             break
 
+            post_index.release_element(PostIndex.key_for(post_data))  # Also after failed attempts
             if not config.CONTINUE_ON_ERROR and not success:
                 break
 
+        if streaming:
+            self.content_results["total_posts_processed"] = i
+
         print(f"\n✅ Content extraction completed!")
+        self.content_results["memory_cleanup"] = memory_cleaner.summary()
+
+        if self.comment_writer:
+            # Queued comments count once the writer has actually posted them
+            comment_results = self.comment_writer.finish()
+            comments_posted = sum(1 for result in comment_results if result["comment_success"])
+            for result in comment_results:
+                content_data = queued_content.get(result["urn"])
+                if content_data is None:
+                    continue
+                content_data["comment_posted"] = result["comment_success"]
+                content_data["comment_posted_at"] = result["posted_at"]
+                if not result["comment_success"]:
+                    content_data["comment_error"] = result.get("comment_error", "Posting failed")
+        if watchdog:
+            self.content_results["watchdog"] = watchdog.summary()
+        self.content_results["stale_handles"] = post_index.stale_stats()
 
         # Add comment results to content results for saving
         if comment_results:
@@ -872,6 +980,94 @@ Please generate a comment that naturally fits this existing conversation style a
 
         self.print_content_extraction_summary(comments_posted, comment_results)
 
+    def mark_first_comment(self):
+        """
+        Record time-to-first-comment: seconds from the start of the feed scan to the
+        first comment posted (or handed to the writer browser)
+        """
+        if "time_to_first_comment" not in self.content_results:
+            seconds = round(time.perf_counter() - self.pipeline_started, 2)
+            self.content_results["time_to_first_comment"] = seconds
+            print(f"⏱️ First comment {seconds}s after the feed scan started")
+
+    def run_streaming_pipeline(self):
+        """
+        Streaming mode: posts flow scan → filters → dedupe → content extraction →
+        comment generation → posting as they are discovered, so the first comment
+        goes out seconds after the feed loads instead of after a full scan
+        """
+        print("\n🌊 STREAMING PIPELINE: scan → filters → dedupe → extraction → commenting")
+        print("="*80)
+
+        cleanup_tool = DuplicateAuthorCleanup()
+        # Comments are posted while the feed is still being scanned, so no lean profile
+        scan_stream = self.stream_scan(read_only=not config.AUTO_COMMENT_AFTER_EXTRACTION)
+        # Filter before author dedupe, so an author's filtered-out post (job posting, stale,
+        # skipped language) does not shadow a later post of theirs that would be commented on
+        valid_posts = cleanup_tool.stream_unique(
+            post for post in scan_stream if post["post_type"] == "normal" and self.passes_content_filters(post)
+        )
+
+        try:
+            self.extract_content_from_valid_posts(valid_posts)
+        finally:
+            # Ends the feed pass if Stage 2 stopped early (writes the Stage 1 summary)
+            scan_stream.close()
+
+        self.scan_results["duplicate_cleanup"] = cleanup_tool.cleanup_results
+        self.save_results_to_json()
+        self.save_content_results()
+
+    def resume_after_restart(self, watchdog, reason, remaining_posts, commenter=None, memory_cleaner=None):
+        """
+        Restart the browser through the watchdog and rebind Stage 2 to the new session
+        """
+        try:
+            watchdog.restart(reason)
+        except Exception:
+            # Keep what we have before giving up
+            self.save_content_results(f"linkedin_content_extraction_partial_{len(self.content_results['content_data'])}.json")
+            raise
+
+        if commenter:
+            commenter.driver = self.driver
+        if memory_cleaner:
+            memory_cleaner.driver = self.driver
+            memory_cleaner.pending_ids = []  # Old ids belong to the dead page
+
+        return self.remap_ember_ids(remaining_posts)
+
+    def remap_ember_ids(self, posts):
+        """
+        Ember ids are assigned per page load, so after a restart the remaining
+        posts are re-located in the fresh feed by URN. Posts that cannot be found
+        (or have no URN) are returned as lost keys: their old ember ids may now
+        point at other posts, so they must be skipped rather than commented on.
+        """
+        # Scroll until every remaining URN is found again (the reloaded feed is reordered,
+        # so only matched URNs count), a growth plateau or the scroll time budget
+        harvester = FeedHarvester(self.get_dom_reader(), self.AUTHOR_SELECTORS)
+        urns = [post["urn"] for post in posts if post.get("urn")]
+        self.scroll_to_bottom(on_batch=harvester.harvest,
+                              count_posts=lambda: sum(urn in harvester.index for urn in urns),
+                              max_posts=len(urns))
+
+        lost_keys = set()
+        for post in posts:
+            new_id = harvester.index.ember_id(post["urn"]) if post.get("urn") else None
+            if new_id:
+                post["ember_id"] = new_id
+            else:
+                lost_keys.add(PostIndex.key_for(post))
+
+        print(f"🔁 Re-located {len(posts) - len(lost_keys)}/{len(posts)} remaining posts in the reloaded feed")
+        missing_urns = sum(urn not in harvester.index for urn in urns)
+        if missing_urns:
+            print(f"🔎 {missing_urns}/{len(urns)} remaining URNs were not found before scrolling stopped")
+        if lost_keys:
+            print(f"⏭️  {len(lost_keys)} posts could not be found by URN and will be skipped")
+        return lost_keys
+
     def print_content_extraction_summary(self, comments_posted=0, comment_results=None):
         """
         Print a summary of the content extraction and commenting results
@@ -884,6 +1080,14 @@ Please generate a comment that naturally fits this existing conversation style a
         print(f"📝 Posts with content extracted: {self.content_results['posts_with_content']}")
         print(f"📖 Posts with Read More buttons: {self.content_results['posts_with_read_more']}")
         print(f"✅ Successful expansions: {self.content_results['expansion_successful']}")
+        stale = self.content_results.get("stale_handles")
+        if stale and stale["stale_recoveries"]:
+            print(f"♻️ Stale post handles re-located: {stale['stale_recoveries']} (avg {stale['avg_recovery_ms']} ms)")
+        if stale and (stale["not_found_recoveries"] or stale["not_found_failures"]):
+            print(f"♻️ Posts missing mid re-render: {stale['not_found_recoveries']} found again, "
+                  f"{stale['not_found_failures']} gone")
+        if "time_to_first_comment" in self.content_results:
+            print(f"⏱️ Time to first comment: {self.content_results['time_to_first_comment']}s")
 
         # Comment statistics
         if comments_posted > 0 or comment_results:
@@ -936,6 +1140,7 @@ def main():
     print("="*80)
 
     scanner = LinkedInComprehensiveScanner()
+    reader_pool = None
 
     try:
         # ========== STAGE 1: POST DISCOVERY & CLASSIFICATION ==========
@@ -944,11 +1149,22 @@ def main():
 
         # Step 1: Initialize Chrome and open login
         print("Step 1: Initializing Chrome browser...")
-        scanner.initialize_driver()
+        if config.DUAL_BROWSER_MODE:
+            # Headed writer logs in first; the headless reader reuses its saved session
+            reader_pool, scanner.comment_writer = start_dual_browsers()
+            scanner.driver = reader_pool.instances[0].driver
+        else:
+            scanner.initialize_driver()
 
         # Step 2: Manual login (handled in initialize_driver)
         print("Step 2: Manual login completed ✅")
 
+        if config.STREAMING_PIPELINE:
+            # Stage 1 and Stage 2 interleaved: posts are commented on as they are discovered
+            scanner.run_streaming_pipeline()
+            input("\n✅ Workflow complete! Press Enter to close browser...")
+            return
+
         # Step 3-6: Scroll, load authors, detect sponsors, return results
         print("Step 3-6: Scanning posts, authors, and sponsors...")
         scan_results = scanner.scan_all_posts()
@@ -972,7 +1188,11 @@ def main():
 
             # Apply cleanup with default strategy (keep_first_normal)
             print("Applying cleanup strategy: keep_first_normal")
-            cleanup_success = cleanup_tool.clean_scan_file("linkedin_comprehensive_scan.json", strategy="keep_first_normal")
+            # Posts the Stage 2 filters would drop are never kept over an author's eligible post
+            cleanup_success = cleanup_tool.clean_scan_file(
+                "linkedin_comprehensive_scan.json", strategy="keep_first_normal",
+                is_eligible=lambda post: scanner.content_filter_reason(post) is None
+            )
 
             if cleanup_success:
                 print("✅ Duplicate cleanup completed successfully!")
@@ -986,12 +1206,19 @@ def main():
         # Show Stage 1 completion summary with cleaned data
         normal_posts_count = len(scanner.scan_results.get("normal_posts", []))
         sponsored_posts_count = len(scanner.scan_results.get("sponsored_posts", []))
-        vietnamese_posts_count = len(scanner.scan_results.get("vietnamese_posts", []))
+        skipped_language_posts_count = len(scanner.scan_results.get("skipped_language_posts", []))
 
         print(f"\n✅ STAGE 1 COMPLETED!")
-        print(f"📊 Found {normal_posts_count} valid posts (non-sponsored, non-Vietnamese)")
+        print(f"📊 Found {normal_posts_count} valid posts (non-sponsored, not in a skipped language)")
         print(f"📢 Found {sponsored_posts_count} sponsored posts")
-        print(f"🇻🇳 Found {vietnamese_posts_count} Vietnamese posts")
+        print(f"🌐 Found {skipped_language_posts_count} posts in skipped languages ({', '.join(config.SKIP_LANGUAGES)})")
+        skipped_content_types = scanner.scan_results.get("scan_summary", {}).get("skipped_content_types", {})
+        if skipped_content_types:
+            counts = ", ".join(f"{name}: {count}" for name, count in skipped_content_types.items())
+            print(f"🎞️ {sum(skipped_content_types.values())} valid posts will be skipped by content type ({counts})")
+        stale_posts_count = scanner.scan_results.get("scan_summary", {}).get("stale_posts_count", 0)
+        if stale_posts_count:
+            print(f"⏳ {stale_posts_count} posts are older than {config.MAX_POST_AGE_DAYS} days and will be skipped")
         print(f"💾 Results saved to 'linkedin_comprehensive_scan.json'")
 
         # Initialize user_choice for scope
@@ -1062,7 +1289,7 @@ def main():
         print(f"   • Total posts processed: {len(scanner.scan_results.get('posts_data', []))}")
         print(f"   • Valid posts: {normal_posts_count}")
         print(f"   • Sponsored posts: {sponsored_posts_count}")
-        print(f"   • Vietnamese posts: {vietnamese_posts_count}")
+        print(f"   • Skipped-language posts: {skipped_language_posts_count}")
         if hasattr(scanner, 'content_results') and scanner.content_results.get('posts_with_content', 0) > 0:
             print(f"   • Posts with content extracted: {scanner.content_results['posts_with_content']}")
 
@@ -1090,6 +1317,10 @@ def main():
 
     finally:
         scanner.cleanup()
+        if scanner.comment_writer:
+            scanner.comment_writer.close()
+        if reader_pool:
+            reader_pool.shutdown()
         print("\n🏁 LinkedIn Scanner closed!")
 
 if __name__ == "__main__":